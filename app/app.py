@@ -1,64 +1,2548 @@
-from flask import Flask, jsonify, request, render_template
+from flask import Flask, Response, jsonify, request, render_template
 from werkzeug.middleware.proxy_fix import ProxyFix
 from urllib.parse import urlparse
+from array import array
+from collections import Counter, OrderedDict, deque, namedtuple
+from collections.abc import Mapping
+from contextlib import contextmanager
+import atexit
+import base64
+import bisect
+import calendar
 import datetime
+import heapq
+import gzip
 import json
 import os
+import queue
 import re
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import uuid
+import zlib
 
 app = Flask(__name__)
 
 # x_prefix=1 tells Flask to trust the X-Forwarded-Prefix header
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
 
-# In-memory data store
-# health_data = {
+# The board lives in a HealthStore (see below), created fresh for each run:
+# {
 #     "CategoryName": {
 #         "ItemName": {"status": "unknown", "last_updated": None, "message": "", "url": ""}
 #     }
 # }
-health_data = {} # Initialize fresh for each run. This is sufficient when app.py is run as a script.
+
+# Storage backend: 'memory' keeps the board in this process only, 'sqlite'
+# keeps it in a SQLite database in WAL mode that several server worker
+# processes can share.
+STORAGE_BACKEND = os.environ.get('HEALTH_BOARD_STORAGE', 'memory').lower()
+SQLITE_PATH = os.environ.get('HEALTH_BOARD_DB', 'health_board.db')
+
+# File written by POST /api/checkpoint and read by POST /api/restore, and the
+# seconds between automatic checkpoints (0 disables them). Automatic
+# checkpoints are skipped while the board is unchanged.
+CHECKPOINT_FILE = 'health_data.json'
+CHECKPOINT_INTERVAL = float(os.environ.get('HEALTH_BOARD_CHECKPOINT_INTERVAL', 0))
+
+# Checkpoint format: 'json', or 'binary' for the compact format described at
+# write_binary_checkpoint, optionally compressed with 'zlib' or 'gzip'. Restore
+# recognizes either format, whatever these are set to.
+CHECKPOINT_FORMAT = os.environ.get('HEALTH_BOARD_CHECKPOINT_FORMAT', 'json').lower()
+CHECKPOINT_COMPRESSION = os.environ.get('HEALTH_BOARD_CHECKPOINT_COMPRESSION', 'none').lower()
+
+# Write-ahead journal of the memory backend (disabled when empty). Every change
+# is appended to it, and on startup the board is rebuilt from the journal's
+# checkpoint plus the journal tail. JOURNAL_FSYNC is 'always' (a write returns
+# once it is on disk), 'interval' (fsync at most every JOURNAL_FSYNC_INTERVAL
+# seconds) or 'never' (leave it to the OS). Past JOURNAL_COMPACT_BYTES the
+# journal is compacted into its checkpoint in the background.
+JOURNAL_PATH = os.environ.get('HEALTH_BOARD_JOURNAL', '')
+JOURNAL_FSYNC = os.environ.get('HEALTH_BOARD_JOURNAL_FSYNC', 'interval').lower()
+JOURNAL_FSYNC_INTERVAL = float(os.environ.get('HEALTH_BOARD_JOURNAL_FSYNC_INTERVAL', 1.0))
+JOURNAL_COMPACT_BYTES = int(os.environ.get('HEALTH_BOARD_JOURNAL_COMPACT_BYTES', 64 * 1024 * 1024))
+
+# Number of recent changes kept for /api/health?since=<version>. Clients that
+# fall further behind than this get a full snapshot instead of a delta.
+CHANGE_LOG_SIZE = int(os.environ.get('HEALTH_BOARD_CHANGE_LOG_SIZE', 10000))
+
+# /api/stream settings: events buffered per client before it is considered too
+# slow and resynchronized, seconds between keepalive comments, and seconds
+# between checks for changes written by other worker processes.
+STREAM_QUEUE_SIZE = int(os.environ.get('HEALTH_BOARD_STREAM_QUEUE_SIZE', 1000))
+STREAM_KEEPALIVE_SECONDS = 15
+STREAM_POLL_SECONDS = 1
+
+# Status transitions remembered per item, and the memory all item histories
+# may use together before the least recently used ones are evicted.
+HISTORY_SIZE = int(os.environ.get('HEALTH_BOARD_HISTORY_SIZE', 100))
+HISTORY_MAX_BYTES = int(os.environ.get('HEALTH_BOARD_HISTORY_MAX_BYTES', 32 * 1024 * 1024))
+
+# Uptime rollup windows (name, seconds), each kept as ROLLUP_BUCKETS buckets
+# of time spent per status color.
+ROLLUP_WINDOWS = (('1h', 3600), ('24h', 24 * 3600), ('7d', 7 * 24 * 3600))
+ROLLUP_BUCKETS = 30
+
+# Damping of high-frequency reporters (see WriteDamper): seconds within which
+# further PUTs to an item are merged into one write, and how long (seconds) or
+# how many consecutive reports a new status must last before it is shown.
+# 0 disables each.
+COALESCE_WINDOW = float(os.environ.get('HEALTH_BOARD_COALESCE_WINDOW', 0))
+HYSTERESIS_SECONDS = float(os.environ.get('HEALTH_BOARD_HYSTERESIS_SECONDS', 0))
+HYSTERESIS_UPDATES = int(os.environ.get('HEALTH_BOARD_HYSTERESIS_UPDATES', 0))
+
+# Cached read responses smaller than this are not worth gzipping.
+GZIP_MIN_SIZE = 1024
+
+# Operations accepted by POST /api/batch, and the most accepted in one request.
+BATCH_OPERATIONS = ('create', 'update', 'delete')
+MAX_BATCH_OPERATIONS = 10000
 
 # Pre-compile regex for performance
 NAME_PATTERN = re.compile(r'^[a-zA-Z0-9 _.-]+$')
 
-# Load status configuration at startup
-try:
-    with open('status_config.json', 'r') as f:
-        STATUS_CONFIG = json.load(f)
-except (FileNotFoundError, json.JSONDecodeError) as e:
-    raise RuntimeError(f"Failed to load status_config.json: {e}")
+# Load status configuration at startup
+try:
+    with open('status_config.json', 'r') as f:
+        STATUS_CONFIG = json.load(f)
+except (FileNotFoundError, json.JSONDecodeError) as e:
+    raise RuntimeError(f"Failed to load status_config.json: {e}")
+
+
+def validate_name(name):
+    """
+    Validates category and item names.
+    - Max length: 50 characters
+    - Allowed characters: alphanumeric, space, hyphen, underscore, period
+    """
+    if not name:
+        return False, "Name cannot be empty"
+    if len(name) > 50:
+        return False, "Name exceeds maximum length of 50 characters"
+    if not NAME_PATTERN.match(name):
+        return False, "Name contains invalid characters. Allowed: alphanumeric, space, hyphen, underscore, period"
+    return True, ""
+
+
+def is_safe_url(target):
+    """
+    Ensures that the URL is safe and valid.
+    Allows http, https, and empty strings (to clear the URL).
+    """
+    if not target:
+        return True
+    ref_url = urlparse(target)
+    return ref_url.scheme in ('http', 'https')
+
+
+# --- Board Storage ---
+
+# One committed change: item is None for changes to a category itself, and
+# deleted marks the tombstone of a removed category or item.
+Change = namedtuple('Change', ['version', 'category', 'item', 'deleted'])
+
+
+def _utc_timestamp():
+    """The current time as a Unix timestamp; last_updated of every write."""
+    return time.time()
+
+
+def _format_timestamp(timestamp):
+    """Formats a Unix timestamp with microseconds, e.g. 2024-01-01T12:00:00.000000Z."""
+    seconds = int(timestamp)
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds)) + f".{int((timestamp - seconds) * 1e6):06d}Z"
+
+
+# The last second formatted by _format_last_updated, as (seconds, text).
+_formatted_second = (None, '')
+
+
+def _format_last_updated(timestamp):
+    """Formats a Unix timestamp like datetime.isoformat() plus Z: microseconds only if there are any."""
+    global _formatted_second
+    seconds = int(timestamp)
+    micros = round((timestamp - seconds) * 1e6)
+    if micros == 1000000:
+        seconds, micros = seconds + 1, 0
+    cached_seconds, text = _formatted_second
+    if cached_seconds != seconds:
+        # Items written in the same second, as most of a burst is, share this.
+        text = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _formatted_second = (seconds, text)
+    return text + (f".{micros:06d}Z" if micros else 'Z')
+
+
+def _parse_timestamp(value):
+    """Parses a last_updated timestamp into a Unix timestamp, or returns None."""
+    try:
+        seconds, _, fraction = value.rstrip('Z').partition('.')
+        return calendar.timegm(time.strptime(seconds, '%Y-%m-%dT%H:%M:%S')) + float('0.' + (fraction or '0'))
+    except (AttributeError, ValueError):
+        return None
+
+
+# Status names by small-int code, for Item. Codes of configured statuses follow
+# status_config.json; other statuses (e.g. from a restored file) are appended.
+_STATUS_NAMES = list(STATUS_CONFIG)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUS_NAMES)}
+_status_codes_lock = threading.Lock()
+
+
+def _status_code(status):
+    code = _STATUS_CODES.get(status)
+    if code is None:
+        with _status_codes_lock:
+            code = _STATUS_CODES.get(status)
+            if code is None:
+                code = len(_STATUS_NAMES)
+                _STATUS_NAMES.append(status)
+                _STATUS_CODES[status] = code
+    return code
+
+
+_MISSING = object()
+
+
+class Item(Mapping):
+    """
+    One item of the board: an immutable record that reads like the dict
+    {"status", "last_updated", "message", "url"[, "ttl"]} it stands for, in a
+    fraction of the memory. The status is a small-int code and last_updated a
+    float Unix timestamp (`updated`), formatted only when first read and then
+    kept, so each version of an item is formatted at most once. Keys of
+    restored items that are not item fields are kept as they were. The dict
+    form is built on the first serialization and kept too, which costs about
+    as much memory as the dict itself once the item has been served.
+    """
+
+    __slots__ = ('_status', 'updated', '_last_updated', 'message', 'url', 'ttl', '_extra', '_dict')
+
+    FIELDS = ('status', 'last_updated', 'message', 'url', 'ttl')
+
+    def __init__(self, status, updated, message='', url='', ttl=None):
+        self._status = _status_code(status)
+        self.updated = updated
+        # None: formatted from updated on first read (or null without it).
+        self._last_updated = None
+        self.message = message
+        self.url = url
+        self.ttl = ttl
+        self._extra = None
+        self._dict = None
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Returns mapping as an Item; Items are returned as they are."""
+        if isinstance(mapping, Item):
+            return mapping
+        item = cls.__new__(cls)
+        item._status = _status_code(mapping['status']) if 'status' in mapping else -1
+        last_updated = mapping.get('last_updated', _MISSING)
+        item.updated = None if last_updated is _MISSING else _parse_timestamp(last_updated)
+        # The original text is kept, so items read back exactly as written.
+        item._last_updated = last_updated
+        item.message = mapping.get('message', _MISSING)
+        item.url = mapping.get('url', _MISSING)
+        item.ttl = mapping.get('ttl')
+        extra = {key: value for key, value in mapping.items() if key not in cls.FIELDS}
+        item._extra = extra or None
+        item._dict = None
+        return item
+
+    def replace(self, **changes):
+        """Returns a copy with the given fields (status, updated, message, url, ttl) changed."""
+        item = Item.__new__(Item)
+        item._status = _status_code(changes.pop('status')) if 'status' in changes else self._status
+        if 'updated' in changes:
+            item.updated = changes.pop('updated')
+            item._last_updated = None
+        else:
+            item.updated = self.updated
+            item._last_updated = self._last_updated
+        item.message = changes.pop('message', self.message)
+        item.url = changes.pop('url', self.url)
+        item.ttl = changes.pop('ttl', self.ttl)
+        item._extra = self._extra
+        item._dict = None
+        if changes:
+            raise TypeError(f"Unknown item fields: {', '.join(changes)}")
+        return item
+
+    @property
+    def status(self):
+        return None if self._status < 0 else _STATUS_NAMES[self._status]
+
+    @property
+    def last_updated(self):
+        value = self._last_updated
+        if value is None and self.updated is not None:
+            # Racing readers may both format it; they get equal strings.
+            value = self._last_updated = _format_last_updated(self.updated)
+        return value
+
+    def _get(self, key):
+        if key == 'status':
+            return _MISSING if self._status < 0 else _STATUS_NAMES[self._status]
+        if key == 'last_updated':
+            return self.last_updated
+        if key == 'message':
+            return self.message
+        if key == 'url':
+            return self.url
+        if key == 'ttl':
+            return _MISSING if self.ttl is None else self.ttl
+        if self._extra is not None:
+            return self._extra.get(key, _MISSING)
+        return _MISSING
+
+    def __getitem__(self, key):
+        value = self._get(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._get(key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key):
+        return self._get(key) is not _MISSING
+
+    def __iter__(self):
+        for key in self.FIELDS:
+            if self._get(key) is not _MISSING:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def to_dict(self):
+        """Returns the item as a dict. It is built once and shared, so it must not be modified."""
+        value = self._dict
+        if value is not None:
+            return value
+        last_updated, message, url = self._last_updated, self.message, self.url
+        if (self._status >= 0 and self.ttl is None and self._extra is None
+                and last_updated is not _MISSING and message is not _MISSING and url is not _MISSING):
+            # The usual shape, without a lookup per key.
+            if last_updated is None and self.updated is not None:
+                last_updated = self.last_updated
+            value = {"status": _STATUS_NAMES[self._status], "last_updated": last_updated,
+                     "message": message, "url": url}
+        else:
+            value = {key: self._get(key) for key in self}
+        # Racing readers may both build it; they get equal dicts.
+        self._dict = value
+        return value
+
+    def __repr__(self):
+        return f"Item({self.to_dict()!r})"
+
+
+def _json_default(value):
+    """Lets json encode Items, as the dicts they stand for."""
+    if isinstance(value, Item):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _compact_board(data):
+    """Returns a board with interned names and Item records, e.g. read from a file."""
+    return {sys.intern(category_name): {sys.intern(item_name): Item.from_mapping(item)
+                                        for item_name, item in items.items()}
+            for category_name, items in data.items()}
+
+
+app.json.default = _json_default
+
+
+class ChangeLog:
+    """
+    A bounded log of recent changes to the board, used to answer delta queries.
+    It has its own lock, held only briefly, so delta readers never wait for a
+    write transaction to finish.
+    """
+
+    def __init__(self, maxlen):
+        self._lock = threading.Lock()
+        self._entries = deque(maxlen=maxlen)
+        # Every change with a version above the floor is still in the log.
+        self._floor = 0
+
+    def record(self, changes):
+        with self._lock:
+            for change in changes:
+                if len(self._entries) == self._entries.maxlen:
+                    self._floor = self._entries[0].version
+                self._entries.append(change)
+
+    def reset(self, version):
+        """Forgets all history, e.g. after a restore replaced the whole board."""
+        with self._lock:
+            self._entries.clear()
+            self._floor = version
+
+    def changes_between(self, since, until):
+        """
+        Returns the changes with since < version <= until, newest first, or None
+        when some of them have already been dropped from the log.
+        """
+        with self._lock:
+            if since < self._floor or since > until:
+                return None
+            changes = []
+            for change in reversed(self._entries):
+                if change.version <= since:
+                    break
+                if change.version <= until:
+                    changes.append(change)
+            return changes
+
+
+class StoreTransaction:
+    """
+    A copy-on-write view of the board used to stage one write. The root dict and
+    each touched category dict are copied once, on first write; item dicts are
+    never modified, only replaced. Nothing is visible to readers until the store
+    commits the transaction.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.changes = []
+        self._root_copied = False
+        self._copied_categories = set()
+
+    def _writable_root(self):
+        if not self._root_copied:
+            self.data = dict(self.data)
+            self._root_copied = True
+        return self.data
+
+    def _writable_category(self, category_name):
+        root = self._writable_root()
+        if category_name not in self._copied_categories:
+            root[category_name] = dict(root[category_name])
+            self._copied_categories.add(category_name)
+        return root[category_name]
+
+    def create_category(self, category_name):
+        self._writable_root()[sys.intern(category_name)] = {}
+        self._copied_categories.add(category_name)
+        self.changes.append((category_name, None, False))
+
+    def delete_category(self, category_name):
+        del self._writable_root()[category_name]
+        self._copied_categories.discard(category_name)
+        self.changes.append((category_name, None, True))
+
+    def put_item(self, category_name, item_name, item):
+        """Stores item, an Item or a dict, which is stored as an Item."""
+        self._writable_category(category_name)[sys.intern(item_name)] = Item.from_mapping(item)
+        self.changes.append((category_name, item_name, False))
+
+    def delete_item(self, category_name, item_name):
+        del self._writable_category(category_name)[item_name]
+        self.changes.append((category_name, item_name, True))
+
+
+class HealthStore:
+    """
+    Thread-safe home of the board, kept in memory. This is the default storage
+    backend and the base class of the others.
+
+    Readers take snapshot() (or read() for the snapshot with its version) and
+    never block: a published snapshot is never modified, so it can be iterated
+    and serialized while writes go on. Writers are serialized by a lock and
+    stage their changes in a copy-on-write StoreTransaction; committing it
+    assigns one version per change, logs the changes and publishes the new
+    snapshot with a single reference assignment.
+
+    Backends that persist the board override the _begin, _save, _save_all,
+    _commit and _rollback hooks, which run with the write lock held.
+    """
+
+    def __init__(self, change_log_size):
+        self._write_lock = threading.RLock()
+        # (version, data), replaced as a whole so readers always see a matching pair.
+        self._state = (0, {})
+        self.changes = ChangeLog(change_log_size)
+        self._listeners = []
+        # Part of every ETag, so tags from another board (or a restarted server) never match.
+        self.board_id = uuid.uuid4().hex[:12]
+        # Optional write-ahead Journal, see open_journal().
+        self.journal = None
+
+    @property
+    def version(self):
+        return self.read()[0]
+
+    def snapshot(self):
+        return self.read()[1]
+
+    def read(self):
+        """Returns (version, snapshot) as one consistent pair."""
+        return self._state
+
+    def add_listener(self, listener):
+        """
+        Registers listener(changes, reset) to be called after every commit, in
+        commit order and with the write lock held. reset is True when the whole
+        board was replaced.
+        """
+        self._listeners.append(listener)
+
+    @contextmanager
+    def transaction(self):
+        """Yields a StoreTransaction that is committed when the block exits normally."""
+        ticket = None
+        with self._write_lock:
+            self._begin()
+            try:
+                txn = StoreTransaction(self._state[1])
+                yield txn
+                version = self._state[0]
+                changes = []
+                for category_name, item_name, deleted in txn.changes:
+                    version += 1
+                    changes.append(Change(version, category_name, item_name, deleted))
+                if changes:
+                    self._save(changes, txn.data)
+            except BaseException:
+                self._rollback()
+                raise
+            self._commit()
+            if changes:
+                if self.journal is not None:
+                    ticket = self.journal.append(Journal.changes_record(changes, txn.data))
+                self._state = (version, txn.data)
+                self._notify(changes, reset=False)
+        if ticket is not None:
+            # Outside the lock, so concurrent writers share one journal write and fsync.
+            self.journal.wait(ticket)
+
+    def replace(self, data):
+        """Replaces the whole board, e.g. when restoring a checkpoint."""
+        data = _compact_board(data)
+        ticket = None
+        with self._write_lock:
+            self._begin()
+            try:
+                version = self._state[0] + 1
+                self._save_all(version, data)
+            except BaseException:
+                self._rollback()
+                raise
+            self._commit()
+            if self.journal is not None:
+                ticket = self.journal.append({"version": version, "replace": data})
+            self._state = (version, data)
+            self._notify([], reset=True)
+        if ticket is not None:
+            self.journal.wait(ticket)
+
+    def reset(self):
+        """Empties the board."""
+        self.replace({})
+
+    def open_journal(self, journal):
+        """
+        Rebuilds the board from journal (its checkpoint plus the journal tail) and
+        from then on appends every change to it.
+        """
+        version, data = journal.load()
+        data = _compact_board(data)
+        with self._write_lock:
+            self.changes.reset(version)
+            self._state = (version, data)
+            self.journal = journal
+            journal.start(self)
+            self._notify([], reset=True)
+
+    def close(self):
+        """Releases any resources held by the backend."""
+        if self.journal is not None:
+            self.journal.close()
+
+    def _notify(self, changes, reset):
+        for listener in self._listeners:
+            listener(changes, reset)
+
+    # Backend hooks. _begin starts a write and may first bring _state up to date;
+    # _save persists a transaction's changes (data is the board after them) and
+    # _save_all a whole new board. Both must log before the state is published,
+    # so a reader never sees a version the log lacks.
+
+    def _begin(self):
+        pass
+
+    def _save(self, changes, data):
+        self.changes.record(changes)
+
+    def _save_all(self, version, data):
+        self.changes.reset(version)
+
+    def _commit(self):
+        pass
+
+    def _rollback(self):
+        pass
+
+
+class Journal:
+    """
+    Append-only write-ahead journal of the changes to a HealthStore, one JSON
+    record per line, next to a checkpoint of the board it starts from.
+
+    Writers only queue their record (in commit order, under the store's write
+    lock) and then wait for it outside the lock. A background thread writes
+    everything queued so far with one write() and, depending on the fsync
+    policy, one fsync(), so concurrent writers share the cost (group commit).
+    Once the journal grows past compact_bytes it is compacted in the
+    background: the board is checkpointed and only the records after the
+    checkpoint are kept.
+
+    A write that fails, e.g. on a full disk, is logged and cut off the file
+    again, so no torn record is left in front of later ones. Its records are
+    lost: writers waiting for them with 'always', and any writer while the
+    last write failed, get an IOError, and the next successful write starts a
+    compaction so the checkpoint covers them.
+    """
+
+    FSYNC_POLICIES = ('always', 'interval', 'never')
+
+    def __init__(self, path, fsync='interval', fsync_interval=1.0, compact_bytes=64 * 1024 * 1024):
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"Invalid fsync policy '{fsync}'. Must be one of: {', '.join(self.FSYNC_POLICIES)}")
+        self.path = path
+        self.checkpoint_path = path + '.checkpoint'
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.compact_bytes = compact_bytes
+        self._cond = threading.Condition()
+        self._pending = []
+        self._appended = 0  # Sequence number of the last queued record
+        self._written = 0  # ... and of the last one written (and synced, with 'always')
+        self._lost = deque(maxlen=64)  # (first, last) sequence numbers of recent failed writes
+        self.error = None  # Why the last write failed, until one succeeds
+        self.failed_writes = 0
+        self._closed = False
+        # Held while the journal file is written or swapped for a compacted one.
+        self._file_lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._synced = True
+        self._last_sync = 0.0
+        self._compaction = None
+        self._store = None
+        self._thread = None
+
+    @staticmethod
+    def changes_record(changes, data):
+        """
+        Encodes one committed transaction; data is the board after it. Only the
+        last write of each item carries its value, the final one.
+        """
+        entries = []
+        written = set()
+        for change in reversed(changes):
+            value = None
+            key = (change.category, change.item)
+            if change.item is not None and not change.deleted and key not in written:
+                written.add(key)
+                value = data.get(change.category, {}).get(change.item)
+            entries.append([change.category, change.item, change.deleted, value])
+        entries.reverse()
+        return {"version": changes[-1].version, "changes": entries}
+
+    def load(self):
+        """Returns (version, data): the checkpoint with the journal tail replayed onto it."""
+        version, data = 0, {}
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                checkpoint = json.load(f)
+            version, data = checkpoint['version'], checkpoint['data']
+        except FileNotFoundError:
+            pass
+
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return version, data
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break  # A record torn by a crash; nothing after it was acknowledged
+                if record['version'] <= version:
+                    continue  # Already in the checkpoint
+                if 'replace' in record:
+                    data = record['replace']
+                else:
+                    txn = StoreTransaction(data)
+                    for category_name, item_name, deleted, value in record['changes']:
+                        self._replay(txn, category_name, item_name, deleted, value)
+                    data = txn.data
+                version = record['version']
+        return version, data
+
+    @staticmethod
+    def _replay(txn, category_name, item_name, deleted, value):
+        # Deletions may find nothing: only the last write of an item is replayed.
+        if item_name is None:
+            if not deleted:
+                txn.create_category(category_name)
+            elif category_name in txn.data:
+                txn.delete_category(category_name)
+        elif deleted:
+            if item_name in txn.data.get(category_name, {}):
+                txn.delete_item(category_name, item_name)
+        elif value is not None:  # None: written again or deleted later in the same transaction
+            txn.put_item(category_name, item_name, value)
+
+    def start(self, store):
+        """Opens the journal for appending and starts the writer thread."""
+        self._store = store
+        # Unbuffered, so a failed write leaves nothing behind to be flushed later.
+        self._file = open(self.path, 'ab', buffering=0)
+        self._size = self._file.tell()
+        self._thread = threading.Thread(target=self._run, name='health-board-journal', daemon=True)
+        self._thread.start()
+
+    def append(self, record):
+        """Queues a record and returns its sequence number for wait()."""
+        line = json.dumps(record, separators=(',', ':'), default=_json_default).encode('utf-8') + b'\n'
+        with self._cond:
+            self._pending.append(line)
+            self._appended += 1
+            self._cond.notify_all()
+            return self._appended
+
+    def wait(self, ticket):
+        """
+        Returns once the record is as durable as the fsync policy promises: on
+        disk with 'always'; otherwise it has only been queued. Raises IOError
+        if it was lost, or while the journal cannot be written.
+        """
+        if self.fsync == 'always':
+            self._wait_written(ticket)
+        elif self.error is not None:
+            raise IOError(f"Journal write failed: {self.error}")
+
+    def flush(self):
+        """Writes everything queued so far."""
+        with self._cond:
+            ticket = self._appended
+        self._wait_written(ticket)
+
+    def _wait_written(self, ticket):
+        with self._cond:
+            while self._written < ticket and self._thread is not None:
+                self._cond.wait()
+            if any(first <= ticket <= last for first, last in self._lost):
+                raise IOError(f"Journal write failed: {self.error}")
+
+    def status(self):
+        return {
+            "path": self.path,
+            "fsync": self.fsync,
+            "size_bytes": self._size,
+            "error": self.error,
+            "failed_writes": self.failed_writes,
+        }
+
+    def close(self):
+        if self._thread is None:
+            return
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        # The writer has stopped, so no compaction starts after this one.
+        if self._compaction is not None:
+            self._compaction.join()
+        self._thread = None
+        with self._file_lock:
+            if not self._synced:
+                os.fsync(self._file.fileno())
+            self._file.close()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    if not self._synced and self.fsync == 'interval':
+                        break
+                    self._cond.wait()
+                if not self._pending:
+                    if self._closed:
+                        return
+                    self._cond.wait(self.fsync_interval)
+                batch, self._pending = self._pending, []
+                first, ticket = self._written + 1, self._appended
+            size = self._size
+            try:
+                with self._file_lock:
+                    if batch:
+                        data = memoryview(b''.join(batch))
+                        while data:
+                            data = data[self._file.write(data):]
+                        self._size += sum(len(line) for line in batch)
+                        self._synced = False
+                    now = time.monotonic()
+                    if not self._synced and (self.fsync == 'always' or (
+                            self.fsync == 'interval' and now - self._last_sync >= self.fsync_interval)):
+                        os.fsync(self._file.fileno())
+                        self._synced = True
+                        self._last_sync = now
+                    elif self.fsync == 'never':
+                        self._synced = True
+            except OSError as e:
+                app.logger.error(f"Failed to write the journal: {e}")
+                with self._file_lock:
+                    try:
+                        # Cut off whatever part was written, so later records follow a whole one.
+                        self._file.truncate(size)
+                        self._size = size
+                    except OSError as truncate_error:
+                        app.logger.error(f"Failed to truncate the journal: {truncate_error}")
+                with self._cond:
+                    if ticket >= first:
+                        self._lost.append((first, ticket))
+                    self.error = str(e)
+                    self.failed_writes += 1
+                    self._written = ticket
+                    self._cond.notify_all()
+                continue
+            with self._cond:
+                recovered, self.error = self.error is not None or bool(self._lost), None
+                # Started before the writers are woken, so they can always join it.
+                if ((recovered or self._size > self.compact_bytes)
+                        and (self._compaction is None or not self._compaction.is_alive())):
+                    compaction = threading.Thread(target=self._compact_in_background,
+                                                  name='health-board-compaction', daemon=True)
+                    compaction.start()
+                    self._compaction = compaction
+                self._written = ticket
+                self._cond.notify_all()
+
+    def _compact_in_background(self):
+        try:
+            self.compact()
+        except (IOError, OSError) as e:
+            app.logger.error(f"Failed to compact the journal: {e}")
+
+    def compact(self):
+        """
+        Checkpoints the board and drops the journal records the checkpoint covers.
+        A crash at any point leaves a checkpoint and journal that replay correctly.
+        """
+        # With commits held off, the journal ends exactly at the snapshot's version.
+        with self._store._write_lock:
+            self.flush()
+            version, data = self._store.read()
+            with self._file_lock:
+                offset = self._file.tell()
+
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": version, "data": data}, f, default=_json_default)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+        with self._file_lock:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                tail = f.read()
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(tail)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._file.close()
+            self._file = open(self.path, 'ab', buffering=0)
+            self._size = len(tail)
+            self._synced = True
+        with self._cond:
+            # The checkpoint now covers the records of failed writes.
+            self._lost.clear()
+
+
+class SQLiteChangeLog:
+    """The change log of a SQLiteHealthStore, read from its changes table."""
+
+    def __init__(self, store):
+        self._store = store
+
+    def changes_between(self, since, until):
+        """
+        Returns the changes with since < version <= until, newest first, or None
+        when some of them have already been dropped from the log.
+        """
+        conn = self._store._connection()
+        with self._store._read_transaction(conn):
+            floor = self._store._meta(conn, 'floor')
+            if since < floor or since > until:
+                return None
+            rows = conn.execute(
+                'SELECT version, category, item, deleted FROM changes '
+                'WHERE version > ? AND version <= ? ORDER BY version DESC', (since, until)).fetchall()
+        return [Change(version, category_name, item_name, bool(deleted))
+                for version, category_name, item_name, deleted in rows]
+
+
+class SQLiteHealthStore(HealthStore):
+    """
+    Keeps the board in a SQLite database in WAL mode, so several server worker
+    processes share one board.
+
+    The database is the source of truth. Each process keeps the in-memory
+    snapshot of the base class as a read cache: a read costs one indexed
+    lookup of the database version, and when another process has written, the
+    snapshot is brought up to date from the changes table (or reloaded in full
+    when the log no longer reaches back far enough) and the listeners are told
+    about those changes too. Writes take the database write lock with
+    BEGIN IMMEDIATE, catch up, and write each transaction as one SQLite
+    transaction of batched executemany() calls. Statements use fixed SQL with
+    parameters, so each connection prepares them once and reuses them.
+    """
+
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)',
+        'CREATE TABLE IF NOT EXISTS categories (name TEXT PRIMARY KEY)',
+        'CREATE TABLE IF NOT EXISTS items ('
+        ' category TEXT NOT NULL, name TEXT NOT NULL, status TEXT, last_updated TEXT,'
+        ' message TEXT, url TEXT, ttl REAL, PRIMARY KEY (category, name))',
+        # The primary key already indexes items by category; databases may have a redundant index.
+        'DROP INDEX IF EXISTS items_category',
+        'CREATE INDEX IF NOT EXISTS items_status ON items (status)',
+        'CREATE TABLE IF NOT EXISTS changes ('
+        ' version INTEGER PRIMARY KEY, category TEXT NOT NULL, item TEXT, deleted INTEGER NOT NULL)',
+    )
+    ITEM_FIELDS = ('status', 'last_updated', 'message', 'url', 'ttl')
+
+    def __init__(self, path, change_log_size):
+        super().__init__(change_log_size)
+        self.path = path
+        self.change_log_size = change_log_size
+        self.changes = SQLiteChangeLog(self)
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute('PRAGMA journal_mode=WAL')
+        with self._write_transaction(conn):
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+            if 'ttl' not in [row[1] for row in conn.execute('PRAGMA table_info(items)')]:
+                # Databases from before item TTLs.
+                conn.execute('ALTER TABLE items ADD COLUMN ttl REAL')
+            conn.executemany('INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)',
+                             [('version', 0), ('floor', 0), ('board_id', self.board_id)])
+            self.board_id = self._meta(conn, 'board_id')
+            self._state = (self._meta(conn, 'version'), self._load(conn))
+
+    def _connection(self):
+        """Returns this thread's connection to the database."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # isolation_level=None: transactions are started explicitly below.
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                                   check_same_thread=False, cached_statements=256)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self):
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    @contextmanager
+    def _read_transaction(self, conn):
+        """Reads everything inside the block from one consistent database snapshot."""
+        if conn.in_transaction:
+            yield
+            return
+        conn.execute('BEGIN')
+        try:
+            yield
+        finally:
+            conn.execute('COMMIT')
+
+    @contextmanager
+    def _write_transaction(self, conn):
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    @staticmethod
+    def _meta(conn, key):
+        return conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()[0]
+
+    @staticmethod
+    def _item(row):
+        status, last_updated, message, url, ttl = row
+        item = Item(status, _parse_timestamp(last_updated), message, url, ttl)
+        item._last_updated = last_updated
+        return item
+
+    def _load(self, conn):
+        """Reads the whole board."""
+        data = {name: {} for name, in conn.execute('SELECT name FROM categories')}
+        for row in conn.execute('SELECT category, name, status, last_updated, message, url, ttl FROM items'):
+            data[row[0]][row[1]] = self._item(row[2:])
+        return data
+
+    def _load_item(self, conn, category_name, item_name):
+        row = conn.execute('SELECT status, last_updated, message, url, ttl FROM items WHERE category = ? AND name = ?',
+                           (category_name, item_name)).fetchone()
+        return None if row is None else self._item(row)
+
+    def read(self):
+        conn = self._connection()
+        if self._meta(conn, 'version') != self._state[0]:
+            with self._write_lock:
+                with self._read_transaction(conn):
+                    self._sync(conn)
+        return self._state
+
+    def _sync(self, conn):
+        """
+        Brings the in-memory snapshot up to the database version, replaying the
+        changes made by other processes. Runs with the write lock held and inside
+        a database transaction.
+        """
+        local_version, data = self._state
+        version = self._meta(conn, 'version')
+        if version == local_version:
+            return
+        rows = None
+        if self._meta(conn, 'floor') <= local_version < version:
+            rows = conn.execute('SELECT version, category, item, deleted FROM changes '
+                                'WHERE version > ? ORDER BY version', (local_version,)).fetchall()
+        if rows is None:
+            self._state = (version, self._load(conn))
+            self._notify([], reset=True)
+            return
+
+        txn = StoreTransaction(data)
+        changes = []
+        for change_version, category_name, item_name, deleted in rows:
+            change = Change(change_version, category_name, item_name, bool(deleted))
+            changes.append(change)
+            if item_name is None:
+                if deleted:
+                    if category_name in txn.data:
+                        txn.delete_category(category_name)
+                else:
+                    txn.create_category(category_name)
+            elif category_name in txn.data:
+                if deleted:
+                    if item_name in txn.data[category_name]:
+                        txn.delete_item(category_name, item_name)
+                else:
+                    # The row holds the latest value; a later change covers a later deletion.
+                    item = self._load_item(conn, category_name, item_name)
+                    if item is not None:
+                        txn.put_item(category_name, item_name, item)
+        self._state = (version, txn.data)
+        self._notify(changes, reset=False)
+
+    def _begin(self):
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._sync(conn)
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+
+    def _commit(self):
+        self._connection().execute('COMMIT')
+
+    def _rollback(self):
+        conn = self._connection()
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+
+    def _save(self, changes, data):
+        conn = self._connection()
+        deleted_categories, created_categories, touched_items = set(), set(), set()
+        for change in changes:
+            if change.item is not None:
+                touched_items.add((change.category, change.item))
+            elif change.deleted:
+                deleted_categories.add(change.category)
+            else:
+                created_categories.add(change.category)
+
+        # Whole categories first, then the final value of every touched item.
+        conn.executemany('DELETE FROM items WHERE category = ?', [(name,) for name in deleted_categories])
+        conn.executemany('DELETE FROM categories WHERE name = ?',
+                         [(name,) for name in deleted_categories if name not in data])
+        conn.executemany('INSERT OR IGNORE INTO categories (name) VALUES (?)',
+                         [(name,) for name in created_categories if name in data])
+        # A category deleted and re-created in this transaction lost its rows above.
+        for name in deleted_categories & set(data):
+            touched_items.update((name, item_name) for item_name in data[name])
+        conn.executemany('DELETE FROM items WHERE category = ? AND name = ?',
+                         [key for key in touched_items if key[1] not in data.get(key[0], {})])
+        conn.executemany(
+            'INSERT OR REPLACE INTO items (category, name, status, last_updated, message, url, ttl) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [key + tuple(data[key[0]][key[1]].get(field) for field in self.ITEM_FIELDS)
+             for key in touched_items if key[1] in data.get(key[0], {})])
+
+        conn.executemany('INSERT INTO changes (version, category, item, deleted) VALUES (?, ?, ?, ?)',
+                         [(c.version, c.category, c.item, int(c.deleted)) for c in changes])
+        self._set_version(conn, changes[-1].version)
+
+    def _save_all(self, version, data):
+        conn = self._connection()
+        conn.execute('DELETE FROM items')
+        conn.execute('DELETE FROM categories')
+        conn.execute('DELETE FROM changes')
+        conn.executemany('INSERT INTO categories (name) VALUES (?)', [(name,) for name in data])
+        conn.executemany(
+            'INSERT INTO items (category, name, status, last_updated, message, url, ttl) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(category_name, item_name) + tuple(item.get(field) for field in self.ITEM_FIELDS)
+             for category_name, items in data.items() for item_name, item in items.items()])
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'floor'", (version,))
+        self._set_version(conn, version)
+
+    def _set_version(self, conn, version):
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'version'", (version,))
+        floor = version - self.change_log_size
+        if floor > self._meta(conn, 'floor'):
+            conn.execute('DELETE FROM changes WHERE version <= ?', (floor,))
+            conn.execute("UPDATE meta SET value = ? WHERE key = 'floor'", (floor,))
+
+
+def create_store():
+    """Creates the storage backend selected by HEALTH_BOARD_STORAGE."""
+    if STORAGE_BACKEND == 'sqlite':
+        if JOURNAL_PATH:
+            raise RuntimeError("HEALTH_BOARD_JOURNAL is only supported by the memory backend; SQLite is already durable")
+        return SQLiteHealthStore(SQLITE_PATH, CHANGE_LOG_SIZE)
+    if STORAGE_BACKEND != 'memory':
+        raise RuntimeError(f"Unknown HEALTH_BOARD_STORAGE '{STORAGE_BACKEND}'. Must be one of: memory, sqlite")
+    store = HealthStore(CHANGE_LOG_SIZE)
+    if JOURNAL_PATH:
+        store.open_journal(Journal(JOURNAL_PATH, JOURNAL_FSYNC, JOURNAL_FSYNC_INTERVAL, JOURNAL_COMPACT_BYTES))
+    return store
+
+
+store = create_store()
+atexit.register(store.close)
+
+# Every mutation bumps the store's board version. Together with the board id it
+# forms the ETag of /api/health, so clients can poll with If-None-Match and a
+# restarted in-memory server never matches a stale tag.
+BOARD_INSTANCE_ID = store.board_id
+
+
+# --- Change Notification ---
+
+class EventSubscriber:
+    """One /api/stream client: a bounded queue of (version, event bytes) pairs."""
+
+    def __init__(self, queue_size):
+        self.queue = queue.Queue(maxsize=queue_size)
+        # Set by the hub when the queue overflowed and events were lost.
+        self.lagged = False
+
+
+class EventHub:
+    """
+    Fans server-sent events out to every /api/stream subscriber. Events are
+    serialized once by the publisher and the same bytes are queued for all
+    subscribers. A subscriber whose queue is full is dropped and flagged as
+    lagged rather than blocking the publisher.
+    """
+
+    def __init__(self, queue_size):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = set()
+
+    def subscribe(self):
+        subscriber = EventSubscriber(self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def has_subscribers(self):
+        return bool(self._subscribers)
+
+    def publish(self, version, payload):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.queue.put_nowait((version, payload))
+            except queue.Full:
+                subscriber.lagged = True
+                self.unsubscribe(subscriber)
+
+
+event_hub = EventHub(STREAM_QUEUE_SIZE)
+
+
+class CachedBody:
+    """An encoded JSON response body for one board version, and its gzip encoding."""
+
+    def __init__(self, version, body):
+        self.version = version
+        self.body = body
+        self.gzipped = None
+        self.gzip_checked = False
+
+
+class ResponseCache:
+    """
+    Caches encoded read responses for the current board version, so reads cost
+    a dict lookup instead of a serialization of the whole board. Each version
+    can hold a few variants of a response under different keys. The first
+    reader after a change builds a body while concurrent readers wait and then
+    share it; hits never take the lock.
+    """
+
+    def __init__(self, max_variants=32):
+        self.max_variants = max_variants
+        self._lock = threading.Lock()
+        # (version, {key: CachedBody}), replaced as a whole so readers see a consistent pair.
+        self._state = (None, {})
+
+    def invalidate(self):
+        self._state = (None, {})
+
+    def get(self, version, key, build, want_gzip=False):
+        """
+        Returns the CachedBody for key at version. On a miss build() is called and
+        must return (version, body) for the board it encoded, which may be newer.
+        """
+        state_version, entries = self._state
+        entry = entries.get(key) if state_version == version else None
+        if entry is not None and (entry.gzip_checked or not want_gzip):
+            return entry
+
+        with self._lock:
+            state_version, entries = self._state
+            entry = entries.get(key) if state_version == version else None
+            if entry is None:
+                entry = CachedBody(*build())
+                if entry.version != state_version:
+                    entries = {}
+                if len(entries) < self.max_variants:
+                    self._state = (entry.version, {**entries, key: entry})
+            if want_gzip and not entry.gzip_checked:
+                if len(entry.body) >= GZIP_MIN_SIZE:
+                    entry.gzipped = gzip.compress(entry.body, compresslevel=6)
+                entry.gzip_checked = True
+        return entry
+
+
+health_cache = ResponseCache()
+status_config_cache = ResponseCache(max_variants=1)
+
+
+def _encode_json(data):
+    """Encodes data exactly like jsonify would."""
+    return app.json.dumps(data).encode('utf-8') + b'\n'
+
+
+def _cached_json_response(cache, version, key, build):
+    """
+    Serves a response body from cache, gzipped when the client accepts it.
+    Returns the response and the version of the board it encodes.
+    """
+    want_gzip = request.accept_encodings['gzip'] > 0
+    entry = cache.get(version, key, build, want_gzip)
+    if want_gzip and entry.gzipped is not None:
+        response = app.response_class(entry.gzipped, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = app.response_class(entry.body, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return response, entry.version
+
+
+def _format_event(event, event_id, data):
+    """Serializes one server-sent event."""
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, default=_json_default)}\n\n".encode('utf-8')
+
+
+def _publish_change(change, data):
+    """
+    Pushes one change to /api/stream subscribers. The event data has the same
+    shape as a /api/health?since= delta.
+    """
+    delta = {"version": _board_etag(change.version), "full": False, "data": {},
+             "deleted_categories": [], "deleted_items": {}}
+    if change.item is None:
+        event = 'category'
+        if change.deleted:
+            delta["deleted_categories"].append(change.category)
+        else:
+            delta["data"][change.category] = {}
+    else:
+        event = 'item'
+        if change.deleted:
+            delta["deleted_items"][change.category] = [change.item]
+        elif change.item in data.get(change.category, {}):
+            delta["data"][change.category] = {change.item: data[change.category][change.item]}
+        else:
+            return  # Deleted again later in the same commit; that change is published instead.
+    if change.deleted:
+        event += '-deleted'
+    event_hub.publish(change.version, _format_event(event, delta["version"], delta))
+
+
+def _on_board_change(changes, reset):
+    """Store listener: drops cached responses and pushes the changes to subscribers."""
+    health_cache.invalidate()
+    if not event_hub.has_subscribers():
+        return
+    version, data = store.read()  # The committed board, as this runs under the write lock
+    if reset:
+        _, delta = _build_health_delta(None)
+        event_hub.publish(version, _format_event('reset', delta["version"], delta))
+    for change in changes:
+        _publish_change(change, data)
+
+
+store.add_listener(_on_board_change)
+
+
+def _board_etag(version=None):
+    """Returns the (unquoted) ETag for a board version, by default the current one."""
+    return f"{BOARD_INSTANCE_ID}-{store.version if version is None else version}"
+
+
+def _parse_board_etag(tag):
+    """
+    Returns the board version encoded in an ETag produced by _board_etag, or
+    None if the tag is malformed or was issued by another server instance.
+    """
+    tag = tag.strip()
+    if tag.startswith('W/'):
+        tag = tag[2:]
+    instance_id, _, version = tag.strip('"').rpartition('-')
+    if instance_id != BOARD_INSTANCE_ID or not version.isdigit():
+        return None
+    return int(version)
+
+
+def _build_health_delta(since):
+    """
+    Builds the /api/health?since=<etag> response body: only the categories and
+    items that changed after version `since`, plus tombstones for the ones that
+    were deleted. Falls back to a full snapshot when the change log no longer
+    reaches back that far. Returns (version, delta) for the snapshot it read.
+    """
+    version, data = store.read()
+    changes = None
+    if since is not None:
+        changes = store.changes.changes_between(since, version)
+
+    delta = {"version": _board_etag(version), "full": changes is None, "data": {},
+             "deleted_categories": [], "deleted_items": {}}
+    if changes is None:
+        delta["data"] = data
+        return version, delta
+
+    deleted_categories = {}
+    deleted_items = {}
+    seen = set()
+    for change in changes:  # Newest first, so the first change seen for a key wins
+        if change.item is None and change.deleted:
+            # Always reported: the category may have been re-created since.
+            deleted_categories[change.category] = None
+        key = (change.category, change.item)
+        if key in seen:
+            continue
+        seen.add(key)
+        if change.deleted:
+            if change.item is not None:
+                deleted_items.setdefault(change.category, {})[change.item] = None
+        elif change.category in data:
+            category_delta = delta["data"].setdefault(change.category, {})
+            if change.item is not None and change.item in data[change.category]:
+                category_delta[change.item] = data[change.category][change.item]
+
+    delta["deleted_categories"] = list(deleted_categories)
+    delta["deleted_items"] = {name: list(items) for name, items in deleted_items.items()}
+    return version, delta
+
+
+# --- Item History ---
+
+class ItemHistory:
+    """
+    A ring buffer of one item's status transitions: status codes as unsigned
+    bytes and Unix timestamps as packed doubles, 9 bytes per entry.
+    """
+
+    __slots__ = ('codes', 'times', 'start')
+
+    # Rough size of the objects around the two arrays, for memory accounting.
+    OVERHEAD_BYTES = 200
+
+    def __init__(self):
+        self.codes = array('B')
+        self.times = array('d')
+        self.start = 0  # Index of the oldest entry once the buffer is full
+
+    def __len__(self):
+        return len(self.codes)
+
+    def nbytes(self):
+        return self.OVERHEAD_BYTES + len(self.codes) * (self.codes.itemsize + self.times.itemsize)
+
+    def last_code(self):
+        if not self.codes:
+            return None
+        return self.codes[self.start - 1]
+
+    def append(self, code, timestamp, capacity):
+        if len(self.codes) < capacity:
+            self.codes.append(code)
+            self.times.append(timestamp)
+        else:
+            self.codes[self.start] = code
+            self.times[self.start] = timestamp
+            self.start = (self.start + 1) % capacity
+
+    def entries(self):
+        """Yields (code, timestamp) pairs, oldest first."""
+        size = len(self.codes)
+        for offset in range(size):
+            index = (self.start + offset) % size
+            yield self.codes[index], self.times[index]
+
+
+class HistoryStore:
+    """
+    Status transition histories of all items, kept up to date by a store
+    listener. Only changes of status are recorded. When the histories
+    together grow past max_bytes, those of the least recently updated or read
+    items are dropped.
+    """
+
+    def __init__(self, capacity, max_bytes):
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._histories = OrderedDict()  # (category, item) -> ItemHistory, least recently used first
+        self._by_category = {}  # category -> set of item names with a history
+        self._nbytes = 0
+        # Status names by code; codes of configured statuses follow status_config.json.
+        self._statuses = list(STATUS_CONFIG)
+        self._codes = {status: code for code, status in enumerate(self._statuses)}
+        self.evictions = 0
+
+    def _code(self, status):
+        code = self._codes.get(status)
+        if code is None:
+            if len(self._statuses) >= 255:
+                return 255  # Out of codes; reported as null
+            code = len(self._statuses)
+            self._statuses.append(status)
+            self._codes[status] = code
+        return code
+
+    def record(self, category_name, item_name, status, timestamp=None):
+        """Records the item's status if it differs from the last one recorded."""
+        key = (category_name, item_name)
+        with self._lock:
+            code = self._code(status)
+            history = self._histories.get(key)
+            if history is None:
+                history = self._histories[key] = ItemHistory()
+                self._by_category.setdefault(category_name, set()).add(item_name)
+                before = 0
+            else:
+                self._histories.move_to_end(key)
+                if history.last_code() == code:
+                    return
+                before = history.nbytes()
+            history.append(code, time.time() if timestamp is None else timestamp, self.capacity)
+            self._nbytes += history.nbytes() - before
+            while self._nbytes > self.max_bytes and len(self._histories) > 1:
+                self._drop(*next(iter(self._histories)))
+                self.evictions += 1
+
+    def _drop(self, category_name, item_name):
+        history = self._histories.pop((category_name, item_name), None)
+        if history is None:
+            return
+        self._nbytes -= history.nbytes()
+        items = self._by_category[category_name]
+        items.discard(item_name)
+        if not items:
+            del self._by_category[category_name]
+
+    def forget(self, category_name, item_name=None):
+        """Drops the history of an item, or of every item in a category."""
+        with self._lock:
+            item_names = [item_name] if item_name is not None else list(self._by_category.get(category_name, ()))
+            for name in item_names:
+                self._drop(category_name, name)
+
+    def get(self, category_name, item_name):
+        """Returns the item's transitions, oldest first, as dicts."""
+        with self._lock:
+            history = self._histories.get((category_name, item_name))
+            if history is None:
+                return []
+            self._histories.move_to_end((category_name, item_name))
+            entries = list(history.entries())
+        return [{"status": self._statuses[code] if code < len(self._statuses) else None,
+                 "timestamp": _format_timestamp(timestamp)} for code, timestamp in entries]
+
+    def stats(self):
+        with self._lock:
+            return {"items": len(self._histories), "bytes": self._nbytes,
+                    "max_bytes": self.max_bytes, "evictions": self.evictions}
+
+    def on_change(self, changes, reset, data):
+        """
+        Store listener body: records new statuses, at the time the item was
+        updated, and forgets deleted items.
+        """
+        if reset:
+            with self._lock:
+                gone = [key for key in self._histories if key[1] not in data.get(key[0], {})]
+            for key in gone:
+                self.forget(*key)
+            for category_name, items in data.items():
+                for item_name, item in items.items():
+                    self.record(category_name, item_name, item.get('status'), item.updated)
+            return
+        for change in changes:
+            if change.deleted:
+                self.forget(change.category, change.item)
+            elif change.item is not None:
+                item = data.get(change.category, {}).get(change.item)
+                if item is not None:
+                    self.record(change.category, change.item, item.get('status'), item.updated)
+
+
+item_history = HistoryStore(HISTORY_SIZE, HISTORY_MAX_BYTES)
+
+
+def _on_history_change(changes, reset):
+    item_history.on_change(changes, reset, store.snapshot())
+
+
+item_history.on_change([], True, store.snapshot())
+store.add_listener(_on_history_change)
+
+
+# --- Board Summary ---
+
+# How bad each status color is, for a category's worst color. Colors not
+# listed rank between green and orange; statuses without a color count as 'none'.
+COLOR_SEVERITY = {'green': 0, 'orange': 2, 'red': 3}
+OTHER_COLOR_SEVERITY = 1
+
+
+def status_color(status):
+    return STATUS_CONFIG.get(status, {}).get('color', 'none')
+
+
+def color_severity(color):
+    return COLOR_SEVERITY.get(color, OTHER_COLOR_SEVERITY)
+
+
+def status_severity(status):
+    return color_severity(status_color(status))
+
+
+class SummaryStore:
+    """
+    Per-status item counts for the whole board and for each category, kept up
+    to date by a store listener, so a summary costs O(categories) rather than
+    a pass over every item.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statuses = {}  # category -> {item: status}
+        self._counts = {}  # category -> Counter of statuses
+        self._total = Counter()
+
+    def _set_item(self, category_name, item_name, status):
+        items = self._statuses.setdefault(category_name, {})
+        counts = self._counts.setdefault(category_name, Counter())
+        if item_name in items:
+            old = items[item_name]
+            if old == status:
+                return
+            self._discount(counts, old)
+        items[item_name] = status
+        counts[status] += 1
+        self._total[status] += 1
+
+    def _discount(self, counts, status):
+        for counter in (counts, self._total):
+            counter[status] -= 1
+            if not counter[status]:
+                del counter[status]
+
+    def _remove_item(self, category_name, item_name):
+        items = self._statuses.get(category_name, {})
+        if item_name in items:
+            self._discount(self._counts[category_name], items.pop(item_name))
+
+    def _remove_category(self, category_name):
+        for item_name in list(self._statuses.get(category_name, {})):
+            self._remove_item(category_name, item_name)
+        self._statuses.pop(category_name, None)
+        self._counts.pop(category_name, None)
+
+    def on_change(self, changes, reset, data):
+        """Store listener body."""
+        with self._lock:
+            if reset:
+                for category_name in list(self._statuses):
+                    self._remove_category(category_name)
+                for category_name, items in data.items():
+                    self._statuses[category_name] = {}
+                    self._counts[category_name] = Counter()
+                    for item_name, item in items.items():
+                        self._set_item(category_name, item_name, item.get('status'))
+                return
+            for change in changes:
+                if change.item is None:
+                    if change.deleted:
+                        self._remove_category(change.category)
+                    else:
+                        self._statuses.setdefault(change.category, {})
+                        self._counts.setdefault(change.category, Counter())
+                elif change.deleted:
+                    self._remove_item(change.category, change.item)
+                else:
+                    item = data.get(change.category, {}).get(change.item)
+                    if item is not None:
+                        self._set_item(change.category, change.item, item.get('status'))
+
+    @staticmethod
+    def _describe(counts):
+        colors = {status_color(status) for status in counts}
+        return {
+            "counts": dict(counts),
+            "items": sum(counts.values()),
+            "worst_color": max(colors, key=color_severity) if colors else None,
+        }
+
+    def summary(self):
+        with self._lock:
+            result = self._describe(self._total)
+            result["categories"] = {name: self._describe(counts) for name, counts in self._counts.items()}
+        return result
+
+
+board_summary = SummaryStore()
+
+
+def _on_summary_change(changes, reset):
+    board_summary.on_change(changes, reset, store.snapshot())
+
+
+board_summary.on_change([], True, store.snapshot())
+store.add_listener(_on_summary_change)
+
+
+# --- Secondary Indexes ---
+
+def _remove_sorted(keys, key):
+    """Removes key from the sorted list keys."""
+    del keys[bisect.bisect_left(keys, key)]
+
+
+def _page_sorted(keys, after, limit, descending=False):
+    """
+    Returns up to limit entries of the sorted list keys that come after the
+    entry after (None for the first page) in the given direction, and whether
+    more follow. Paging by key rather than offset keeps pages stable while the
+    board changes: nothing is skipped or repeated unless it was itself moved.
+    """
+    if descending:
+        end = len(keys) if after is None else bisect.bisect_left(keys, after)
+        start = max(end - limit, 0)
+        return keys[start:end][::-1], start > 0
+    start = 0 if after is None else bisect.bisect_right(keys, after)
+    return keys[start:start + limit], start + limit < len(keys)
+
+
+class HealthIndex:
+    """
+    Secondary indexes for filtered and sorted item queries, kept up to date by
+    a store listener: status -> items, item names in sorted order for prefix
+    searches, and items sorted by category and by status severity for paging.
+    Category -> items needs no index of its own, as the board is keyed by
+    category. Lookups return (category, item) keys in time proportional to
+    the number of matches.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_status = {}  # status -> set of (category, item)
+        self._status_of = {}  # (category, item) -> status
+        self._names = []  # Sorted (item, category) pairs
+        self._by_category = []  # Sorted (category, item) pairs
+        self._by_severity = []  # Sorted (severity, status, category, item)
+
+    @staticmethod
+    def _severity_key(key, status):
+        return (status_severity(status), status or '') + key
+
+    def _set_item(self, category_name, item_name, status):
+        key = (category_name, item_name)
+        if key in self._status_of:
+            old = self._status_of[key]
+            if old == status:
+                return
+            self._discard_status(key, old)
+        else:
+            bisect.insort(self._names, (item_name, category_name))
+            bisect.insort(self._by_category, key)
+        self._status_of[key] = status
+        self._by_status.setdefault(status, set()).add(key)
+        bisect.insort(self._by_severity, self._severity_key(key, status))
+
+    def _discard_status(self, key, status):
+        keys = self._by_status[status]
+        keys.discard(key)
+        if not keys:
+            del self._by_status[status]
+        _remove_sorted(self._by_severity, self._severity_key(key, status))
+
+    def _remove_item(self, category_name, item_name):
+        key = (category_name, item_name)
+        if key not in self._status_of:
+            return
+        self._discard_status(key, self._status_of.pop(key))
+        _remove_sorted(self._names, (item_name, category_name))
+        _remove_sorted(self._by_category, key)
+
+    def on_change(self, changes, reset, data):
+        """Store listener body."""
+        with self._lock:
+            if reset:
+                self._by_status, self._status_of = {}, {}
+                for category_name, items in data.items():
+                    for item_name, item in items.items():
+                        key = (category_name, item_name)
+                        self._status_of[key] = item.get('status')
+                        self._by_status.setdefault(item.get('status'), set()).add(key)
+                self._names = sorted((item_name, category_name) for category_name, item_name in self._status_of)
+                self._by_category = sorted(self._status_of)
+                self._by_severity = sorted(self._severity_key(key, status) for key, status in self._status_of.items())
+                return
+            for change in changes:
+                if change.item is None:
+                    if change.deleted:
+                        for key in [key for key in self._status_of if key[0] == change.category]:
+                            self._remove_item(*key)
+                elif change.deleted:
+                    self._remove_item(change.category, change.item)
+                else:
+                    item = data.get(change.category, {}).get(change.item)
+                    if item is not None:
+                        self._set_item(change.category, change.item, item.get('status'))
+
+    def page(self, sort, after, limit, descending=False):
+        """
+        Returns a page of sort keys ordered by 'category' or 'status' (severity,
+        then status name, category and item) after the sort key after, and
+        whether more follow (see _page_sorted).
+        """
+        with self._lock:
+            keys = self._by_category if sort == 'category' else self._by_severity
+            return _page_sorted(keys, after, limit, descending)
+
+    def statuses_with_color(self, colors):
+        """Returns the indexed statuses whose color is one of colors."""
+        with self._lock:
+            return {status for status in self._by_status if status_color(status) in colors}
+
+    def count_status(self, statuses):
+        with self._lock:
+            return sum(len(self._by_status.get(status, ())) for status in statuses)
+
+    def by_status(self, statuses):
+        with self._lock:
+            return [key for status in statuses for key in self._by_status.get(status, ())]
+
+    def _prefix_range(self, prefix):
+        start = bisect.bisect_left(self._names, (prefix,))
+        end = bisect.bisect_left(self._names, (prefix + '\U0010ffff',))
+        return start, end
+
+    def count_prefix(self, prefix):
+        with self._lock:
+            start, end = self._prefix_range(prefix)
+            return end - start
+
+    def by_prefix(self, prefix):
+        with self._lock:
+            start, end = self._prefix_range(prefix)
+            return [(category_name, item_name) for item_name, category_name in self._names[start:end]]
+
+
+health_index = HealthIndex()
+
+
+def _on_index_change(changes, reset):
+    health_index.on_change(changes, reset, store.snapshot())
+
+
+health_index.on_change([], True, store.snapshot())
+store.add_listener(_on_index_change)
+
+
+# --- Staleness and TTL Expiry ---
+
+class StalenessIndex:
+    """
+    Orders items by when they last reported, and expires items that carry a
+    TTL: once ttl seconds have passed since its last update without another
+    one, an item is flipped to 'unknown' (keeping its last_updated), so a
+    reporter that died shows up on the board.
+
+    Items are kept in a list sorted by last update, which answers "what has
+    been silent for longer than N seconds" with a bisect, and TTL deadlines
+    in a heap, so expiring an item costs O(log n) and nothing is scanned.
+    Heap entries that a later update made obsolete are skipped when popped.
+    A store listener keeps both up to date; a background thread sleeps until
+    the earliest deadline.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._seen = {}  # (category, item) -> (last update, ttl)
+        self._by_age = []  # Sorted (last update, category, item)
+        self._deadlines = []  # Heap of (deadline, category, item)
+        self._expired = 0
+        self._thread = None
+        self._closed = False
+
+    @staticmethod
+    def _last_seen(item):
+        return 0.0 if item.updated is None else item.updated
+
+    def _forget(self, key):
+        entry = self._seen.pop(key, None)
+        if entry is not None:
+            _remove_sorted(self._by_age, (entry[0],) + key)
+
+    def _track(self, key, item):
+        seen, ttl = self._last_seen(item), item.get('ttl')
+        if self._seen.get(key) == (seen, ttl):
+            # Unchanged, or only the status changed, as it does on expiry.
+            return
+        self._forget(key)
+        self._seen[key] = (seen, ttl)
+        bisect.insort(self._by_age, (seen,) + key)
+        if ttl:
+            deadline = seen + ttl
+            if not self._deadlines or deadline < self._deadlines[0][0]:
+                self._cond.notify()
+            heapq.heappush(self._deadlines, (deadline,) + key)
+
+    def on_change(self, changes, reset, data):
+        """Store listener body."""
+        with self._cond:
+            if reset:
+                # Built in one pass and sorted once; insort is for single changes.
+                self._seen = {(category_name, item_name): (self._last_seen(item), item.get('ttl'))
+                              for category_name, items in data.items() for item_name, item in items.items()}
+                self._by_age = sorted((seen,) + key for key, (seen, _) in self._seen.items())
+                self._deadlines = [(seen + ttl,) + key for key, (seen, ttl) in self._seen.items() if ttl]
+                heapq.heapify(self._deadlines)
+                self._cond.notify()
+                return
+            for change in changes:
+                if change.item is None:
+                    if change.deleted:
+                        for key in [key for key in self._seen if key[0] == change.category]:
+                            self._forget(key)
+                elif change.deleted:
+                    self._forget((change.category, change.item))
+                else:
+                    item = data.get(change.category, {}).get(change.item)
+                    if item is not None:
+                        self._track((change.category, change.item), item)
+
+    def stale(self, older_than):
+        """Returns the (category, item) keys not updated for more than older_than seconds, oldest first."""
+        with self._cond:
+            end = bisect.bisect_left(self._by_age, (self.clock() - older_than,))
+            return [(category_name, item_name) for _, category_name, item_name in self._by_age[:end]]
+
+    def page(self, after, limit, descending=False):
+        """Returns a page of (last update, category, item) keys, oldest first (see _page_sorted)."""
+        with self._cond:
+            return _page_sorted(self._by_age, after, limit, descending)
+
+    def _due(self, now):
+        """Pops the items whose deadline has passed."""
+        due = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, category_name, item_name = heapq.heappop(self._deadlines)
+            seen, ttl = self._seen.get((category_name, item_name), (None, None))
+            if ttl and seen + ttl == deadline:
+                due.append((category_name, item_name, seen))
+        return due
+
+    def expire(self):
+        """Flips every item past its deadline to 'unknown'. Returns how many were flipped."""
+        now = self.clock()
+        with self._cond:
+            due = self._due(now)
+        if not due:
+            return 0
+        flipped = 0
+        with store.transaction() as txn:
+            for category_name, item_name, seen in due:
+                item = txn.data.get(category_name, {}).get(item_name)
+                # Skip items updated, deleted or already unknown since they were due.
+                if item is None or item.get('status') == 'unknown' or self._last_seen(item) != seen:
+                    continue
+                txn.put_item(category_name, item_name, item.replace(status='unknown'))
+                flipped += 1
+        with self._cond:
+            self._expired += flipped
+        return flipped
+
+    def stats(self):
+        with self._cond:
+            return {"items": len(self._seen), "pending_deadlines": len(self._deadlines), "expired": self._expired}
+
+    def start(self):
+        with self._cond:
+            self._closed = False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='health-board-ttl', daemon=True)
+                self._thread.start()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                timeout = None
+                if self._deadlines:
+                    # Capped, as far-off deadlines overflow Condition.wait.
+                    timeout = min(max(self._deadlines[0][0] - self.clock(), 0), 3600)
+                if timeout != 0:
+                    self._cond.wait(timeout)
+                if self._closed:
+                    return
+            try:
+                self.expire()
+            except Exception as e:
+                app.logger.error(f"Failed to expire items: {e}")
+                time.sleep(1)
+
+
+staleness = StalenessIndex()
+
+
+def _on_staleness_change(changes, reset):
+    staleness.on_change(changes, reset, store.snapshot())
+
+
+staleness.on_change([], True, store.snapshot())
+store.add_listener(_on_staleness_change)
+staleness.start()
+atexit.register(staleness.close)
+
+
+# --- Uptime Rollups ---
+
+# Status colors from status_config.json; statuses without one count as 'none'.
+ROLLUP_COLORS = sorted({status_color(status) for status in STATUS_CONFIG} | {'none'})
+_COLOR_INDEX = {color: index for index, color in enumerate(ROLLUP_COLORS)}
+
+
+class UptimeAccumulator:
+    """
+    Time spent in each status color over the ROLLUP_WINDOWS, for one item or a
+    whole category. counts holds how many items are in each color right now
+    (one item for an item's accumulator); every change of counts first books
+    the time since the previous change into fixed-size rings of buckets, so
+    the cost of a change or a query never depends on how long it has run.
+    Windows are accurate to one bucket (1/ROLLUP_BUCKETS of their length).
+
+    The rings are allocated when time is first booked, and only for the
+    colors that get any, so an item that never changed status costs a few
+    dozen bytes and one that changes between two colors a ring for each.
+    """
+
+    __slots__ = ('counts', 'since', 'bucket_ids', 'seconds')
+
+    def __init__(self, now):
+        self.counts = [0] * len(ROLLUP_COLORS)
+        self.since = now
+        self.bucket_ids = None  # Which bucket each slot holds
+        self.seconds = None  # Per color: seconds per slot, or None while it has none
+
+    def set_counts(self, now, counts):
+        self._book(self.since, now)
+        self.counts = counts
+        self.since = now
+
+    def adjust(self, now, color, delta):
+        """Adds delta items of color, e.g. when an item joins or leaves a category."""
+        counts = list(self.counts)
+        counts[color] += delta
+        self.set_counts(now, counts)
+
+    def _book(self, start, end):
+        weights = [(color, count) for color, count in enumerate(self.counts) if count]
+        if not weights or end <= start:
+            return
+        slots = len(ROLLUP_WINDOWS) * ROLLUP_BUCKETS
+        if self.bucket_ids is None:
+            self.bucket_ids = array('q', [-1]) * slots
+            self.seconds = [None] * len(ROLLUP_COLORS)
+        for color, _ in weights:
+            if self.seconds[color] is None:
+                self.seconds[color] = array('d', [0.0]) * slots
+        for window, (_, length) in enumerate(ROLLUP_WINDOWS):
+            bucket_length = length / ROLLUP_BUCKETS
+            first = int(max(start, end - length) // bucket_length)
+            for bucket in range(first, int(end // bucket_length) + 1):
+                seconds = min(end, (bucket + 1) * bucket_length) - max(start, bucket * bucket_length)
+                if seconds <= 0:
+                    continue
+                slot = window * ROLLUP_BUCKETS + bucket % ROLLUP_BUCKETS
+                if self.bucket_ids[slot] != bucket:
+                    self.bucket_ids[slot] = bucket
+                    for ring in self.seconds:
+                        if ring is not None:
+                            ring[slot] = 0.0
+                for color, count in weights:
+                    self.seconds[color][slot] += seconds * count
+
+    def rollup(self, now):
+        """Returns the time per color and the share of green time for each window."""
+        colors = len(ROLLUP_COLORS)
+        result = {}
+        for window, (name, length) in enumerate(ROLLUP_WINDOWS):
+            bucket_length = length / ROLLUP_BUCKETS
+            newest = int(now // bucket_length)
+            oldest = newest - ROLLUP_BUCKETS + 1
+            totals = [0.0] * colors
+            for bucket in range(oldest, newest + 1):
+                slot = window * ROLLUP_BUCKETS + bucket % ROLLUP_BUCKETS
+                if self.bucket_ids is not None and self.bucket_ids[slot] == bucket:
+                    for color, ring in enumerate(self.seconds):
+                        if ring is not None:
+                            totals[color] += ring[slot]
+            open_seconds = now - max(self.since, oldest * bucket_length)
+            if open_seconds > 0:
+                for color, count in enumerate(self.counts):
+                    totals[color] += open_seconds * count
+            tracked = sum(totals)
+            green = totals[_COLOR_INDEX['green']] if 'green' in _COLOR_INDEX else 0.0
+            result[name] = {
+                "uptime": round(100.0 * green / tracked, 3) if tracked else None,
+                "tracked_seconds": round(tracked, 3),
+                "seconds": {color: round(totals[index], 3) for index, color in enumerate(ROLLUP_COLORS)},
+            }
+        return result
+
+
+class RollupStore:
+    """
+    Uptime accumulators of every item and category, kept up to date by a store
+    listener on each status transition.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._categories = {}  # category -> UptimeAccumulator over its items
+        self._items = {}  # (category, item) -> (color index, UptimeAccumulator)
+
+    @staticmethod
+    def color_of(item):
+        return _COLOR_INDEX[status_color(item.get('status'))]
+
+    def _category(self, category_name, now):
+        accumulator = self._categories.get(category_name)
+        if accumulator is None:
+            accumulator = self._categories[category_name] = UptimeAccumulator(now)
+        return accumulator
+
+    def _set_item(self, category_name, item_name, color, now):
+        category = self._category(category_name, now)
+        current = self._items.get((category_name, item_name))
+        if current is None:
+            accumulator = UptimeAccumulator(now)
+            accumulator.adjust(now, color, 1)
+            self._items[(category_name, item_name)] = (color, accumulator)
+            category.adjust(now, color, 1)
+        elif current[0] != color:
+            current[1].set_counts(now, [int(index == color) for index in range(len(ROLLUP_COLORS))])
+            self._items[(category_name, item_name)] = (color, current[1])
+            counts = list(category.counts)
+            counts[current[0]] -= 1
+            counts[color] += 1
+            category.set_counts(now, counts)
+
+    def _remove_item(self, category_name, item_name, now):
+        current = self._items.pop((category_name, item_name), None)
+        if current is not None and category_name in self._categories:
+            self._categories[category_name].adjust(now, current[0], -1)
+
+    def _remove_category(self, category_name):
+        self._categories.pop(category_name, None)
+        for key in [key for key in self._items if key[0] == category_name]:
+            del self._items[key]
+
+    def on_change(self, changes, reset, data):
+        """Store listener body."""
+        now = self.clock()
+        with self._lock:
+            if reset:
+                for category_name in [name for name in self._categories if name not in data]:
+                    self._remove_category(category_name)
+                for category_name, item_name in [key for key in self._items if key[1] not in data.get(key[0], {})]:
+                    self._remove_item(category_name, item_name, now)
+                for category_name, items in data.items():
+                    self._category(category_name, now)
+                    for item_name, item in items.items():
+                        self._set_item(category_name, item_name, self.color_of(item), now)
+                return
+            for change in changes:
+                if change.item is None:
+                    if change.deleted:
+                        self._remove_category(change.category)
+                    else:
+                        self._category(change.category, now)
+                elif change.deleted:
+                    self._remove_item(change.category, change.item, now)
+                else:
+                    item = data.get(change.category, {}).get(change.item)
+                    if item is not None:
+                        self._set_item(change.category, change.item, self.color_of(item), now)
+
+    def category_rollup(self, category_name):
+        with self._lock:
+            accumulator = self._categories.get(category_name)
+            return None if accumulator is None else accumulator.rollup(self.clock())
+
+    def item_rollup(self, category_name, item_name):
+        with self._lock:
+            current = self._items.get((category_name, item_name))
+            return None if current is None else current[1].rollup(self.clock())
+
+    def category_names(self):
+        with self._lock:
+            return list(self._categories)
+
+
+rollups = RollupStore()
+
+
+def _on_rollup_change(changes, reset):
+    rollups.on_change(changes, reset, store.snapshot())
+
+
+rollups.on_change([], True, store.snapshot())
+store.add_listener(_on_rollup_change)
+
+
+# --- Checkpoints ---
+
+CHECKPOINT_MAGIC = b'HBCK'
+CHECKPOINT_FORMAT_VERSION = 1
+CHECKPOINT_FORMATS = ('json', 'binary')
+CHECKPOINT_COMPRESSIONS = ('none', 'zlib', 'gzip')
+# Marks a missing string (None) where a string id or length is expected.
+_NULL = 0xFFFFFFFF
+_UINT = struct.Struct('<I')
+_ITEM = struct.Struct('<III')
+_END = struct.Struct('<II')
+_TTL = struct.Struct('<d')
+
+
+class CheckpointError(ValueError):
+    """Raised when a binary checkpoint is corrupt, truncated or of an unknown version."""
 
 
-def validate_name(name):
+class _ZlibWriter:
+    """File-like wrapper that zlib-compresses everything written through it."""
+
+    def __init__(self, f):
+        self._f = f
+        self._compressor = zlib.compressobj(6)
+
+    def write(self, data):
+        self._f.write(self._compressor.compress(data))
+
+    def close(self):
+        self._f.write(self._compressor.flush())
+
+
+class _ZlibReader:
+    """File-like wrapper that decompresses a zlib stream as it is read."""
+
+    def __init__(self, f):
+        self._f = f
+        self._decompressor = zlib.decompressobj()
+        self._buffer = bytearray()
+
+    def read(self, size):
+        while len(self._buffer) < size and not self._decompressor.eof:
+            chunk = self._f.read(65536)
+            if not chunk:
+                break
+            self._buffer += self._decompressor.decompress(chunk)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def close(self):
+        pass
+
+
+def write_binary_checkpoint(f, data, compression='none'):
     """
-    Validates category and item names.
-    - Max length: 50 characters
-    - Allowed characters: alphanumeric, space, hyphen, underscore, period
+    Writes the board to the binary file f in the compact checkpoint format:
+
+    A header of CHECKPOINT_MAGIC, the format version and the compression
+    (an index into CHECKPOINT_COMPRESSIONS) as one byte each, followed by the
+    optionally compressed records. Every record starts with a one-byte tag:
+
+    - S: a string (u32 length, UTF-8 bytes). Strings are numbered in order of
+      appearance; category names, item names and statuses are written once and
+      then referred to by number.
+    - C: a category (u32 name number).
+    - I: an item (u32 category, name and status numbers, then last_updated,
+      message and url as u32 length plus UTF-8 bytes).
+    - T: the TTL of the item before it, for items that have one (f64 seconds).
+    - E: the end (u32 number of records before it, u32 CRC-32 of their bytes).
+
+    All integers are little-endian; 0xFFFFFFFF stands for a missing (None) string.
     """
-    if not name:
-        return False, "Name cannot be empty"
-    if len(name) > 50:
-        return False, "Name exceeds maximum length of 50 characters"
-    if not NAME_PATTERN.match(name):
-        return False, "Name contains invalid characters. Allowed: alphanumeric, space, hyphen, underscore, period"
-    return True, ""
+    f.write(CHECKPOINT_MAGIC + bytes([CHECKPOINT_FORMAT_VERSION, CHECKPOINT_COMPRESSIONS.index(compression)]))
+    if compression == 'gzip':
+        out = gzip.GzipFile(fileobj=f, mode='wb', compresslevel=6)
+    elif compression == 'zlib':
+        out = _ZlibWriter(f)
+    else:
+        out = f
 
+    buffer = bytearray()
+    crc = 0
+    count = 0
+    strings = {}
 
-def get_default_item_status():
-    """Returns the default status dictionary for a new item."""
-    return {"status": "unknown", "last_updated": None, "message": "", "url": ""}
+    def emit(record):
+        nonlocal crc, count
+        buffer.extend(record)
+        count += 1
+        if len(buffer) >= 65536:
+            crc = zlib.crc32(buffer, crc)
+            out.write(bytes(buffer))
+            buffer.clear()
 
+    def string_id(value):
+        if value is None:
+            return _NULL
+        if value not in strings:
+            strings[value] = len(strings)
+            encoded = value.encode('utf-8')
+            emit(b'S' + _UINT.pack(len(encoded)) + encoded)
+        return strings[value]
 
-def is_safe_url(target):
+    def field(value):
+        if value is None:
+            return _UINT.pack(_NULL)
+        encoded = value.encode('utf-8')
+        return _UINT.pack(len(encoded)) + encoded
+
+    for category_name, items in data.items():
+        category_id = string_id(category_name)
+        emit(b'C' + _UINT.pack(category_id))
+        for item_name, item in items.items():
+            record = _ITEM.pack(category_id, string_id(item_name), string_id(item.get('status')))
+            emit(b'I' + record + field(item.get('last_updated')) + field(item.get('message')) + field(item.get('url')))
+            if item.get('ttl'):
+                emit(b'T' + _TTL.pack(item['ttl']))
+
+    crc = zlib.crc32(buffer, crc)
+    out.write(bytes(buffer) + b'E' + _END.pack(count, crc))
+    if out is not f:
+        out.close()
+
+
+def read_binary_checkpoint(f):
     """
-    Ensures that the URL is safe and valid.
-    Allows http, https, and empty strings (to clear the URL).
+    Reads a board written by write_binary_checkpoint from the binary file f,
+    record by record, so the file is never held in memory as a whole. Raises
+    CheckpointError if it is damaged in any way.
     """
-    if not target:
-        return True
-    ref_url = urlparse(target)
-    return ref_url.scheme in ('http', 'https')
+    header = f.read(len(CHECKPOINT_MAGIC) + 2)
+    if len(header) < len(CHECKPOINT_MAGIC) + 2 or header[:len(CHECKPOINT_MAGIC)] != CHECKPOINT_MAGIC:
+        raise CheckpointError("Not a binary checkpoint")
+    version, compression = header[len(CHECKPOINT_MAGIC):]
+    if version != CHECKPOINT_FORMAT_VERSION:
+        raise CheckpointError(f"Unsupported checkpoint format version {version}")
+    if compression >= len(CHECKPOINT_COMPRESSIONS):
+        raise CheckpointError(f"Unknown checkpoint compression {compression}")
+    compression = CHECKPOINT_COMPRESSIONS[compression]
+    if compression == 'gzip':
+        source = gzip.GzipFile(fileobj=f, mode='rb')
+    elif compression == 'zlib':
+        source = _ZlibReader(f)
+    else:
+        source = f
+
+    crc = 0
+
+    def read(size, checked=True):
+        nonlocal crc
+        chunk = source.read(size)
+        if len(chunk) != size:
+            raise CheckpointError("Checkpoint is truncated")
+        if checked:
+            crc = zlib.crc32(chunk, crc)
+        return chunk
+
+    def read_string():
+        length, = _UINT.unpack(read(4))
+        return None if length == _NULL else read(length).decode('utf-8')
+
+    def lookup(string_id):
+        if string_id == _NULL:
+            return None
+        if string_id >= len(strings):
+            raise CheckpointError(f"Unknown string number {string_id}")
+        return strings[string_id]
+
+    data = {}
+    strings = []
+    count = 0
+    item = None
+    try:
+        while True:
+            tag = read(1, checked=False)
+            if tag == b'E':
+                expected_count, expected_crc = _END.unpack(read(_END.size, checked=False))
+                if (expected_count, expected_crc) != (count, crc):
+                    raise CheckpointError("Checkpoint checksum mismatch")
+                return data
+            crc = zlib.crc32(tag, crc)
+            count += 1
+            if tag == b'S':
+                strings.append(read_string())
+            elif tag == b'C':
+                data[lookup(_UINT.unpack(read(4))[0])] = {}
+            elif tag == b'I':
+                category_id, name_id, status_id = _ITEM.unpack(read(_ITEM.size))
+                category_name = lookup(category_id)
+                if category_name not in data:
+                    raise CheckpointError(f"Item in undeclared category '{category_name}'")
+                item = data[category_name][lookup(name_id)] = {
+                    "status": lookup(status_id),
+                    "last_updated": read_string(),
+                    "message": read_string(),
+                    "url": read_string(),
+                }
+            elif tag == b'T':
+                if item is None:
+                    raise CheckpointError("TTL without an item")
+                item['ttl'], = _TTL.unpack(read(_TTL.size))
+            else:
+                raise CheckpointError(f"Unknown record type {tag!r}")
+    except (UnicodeDecodeError, zlib.error, EOFError, gzip.BadGzipFile) as e:
+        raise CheckpointError(f"Checkpoint is corrupt: {e}")
+
+
+def read_checkpoint(f):
+    """Reads a JSON or binary checkpoint from the binary file f."""
+    if f.read(len(CHECKPOINT_MAGIC)) == CHECKPOINT_MAGIC:
+        f.seek(0)
+        return read_binary_checkpoint(f)
+    f.seek(0)
+    return json.load(f)
+
+
+class Checkpointer:
+    """
+    Writes checkpoints of the store on a background thread, so neither the
+    request that asked for one nor any other request waits on serialization.
+    Taking the snapshot is free (published snapshots never change). The file
+    is written to a temporary name, synced and then renamed over the previous
+    checkpoint, so a crash never leaves a truncated checkpoint behind.
+
+    With an interval the thread also checkpoints on its own, but only when the
+    board changed since the last checkpoint.
+    """
+
+    def __init__(self, store, path, interval=0, format='json', compression='none'):
+        if format not in CHECKPOINT_FORMATS:
+            raise ValueError(f"Invalid checkpoint format '{format}'. Must be one of: {', '.join(CHECKPOINT_FORMATS)}")
+        if compression not in CHECKPOINT_COMPRESSIONS:
+            raise ValueError(f"Invalid checkpoint compression '{compression}'. "
+                             f"Must be one of: {', '.join(CHECKPOINT_COMPRESSIONS)}")
+        self.store = store
+        self.path = path
+        self.interval = interval
+        self.format = format
+        self.compression = compression
+        self._cond = threading.Condition()
+        self._requested = 0  # Sequence number of the last requested checkpoint
+        self._completed = 0  # ... and of the last one the thread finished
+        self._thread = None
+        self._closed = False
+        # Outcome of the last checkpoint, see status().
+        self.version = None
+        self.last_checkpoint = None
+        self.duration_ms = None
+        self.size_bytes = None
+        self.error = None
+        self.in_progress = False
+
+    def start(self):
+        with self._cond:
+            if self._thread is None:
+                self._closed = False
+                self._thread = threading.Thread(target=self._run, name='health-board-checkpoint', daemon=True)
+                self._thread.start()
+
+    def request(self):
+        """Asks for a checkpoint of the current board; returns a ticket for wait()."""
+        self.start()
+        with self._cond:
+            self._requested += 1
+            self._cond.notify_all()
+            return self._requested
+
+    def wait(self, ticket):
+        """Waits for a requested checkpoint and returns the error it failed with, if any."""
+        with self._cond:
+            while self._completed < ticket:
+                self._cond.wait()
+            return self.error
+
+    def close(self):
+        """Stops the thread once the checkpoint it is writing, if any, is done."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def is_dirty(self):
+        return self.store.version != self.version
+
+    def status(self):
+        return {
+            "path": self.path,
+            "format": self.format,
+            "version": None if self.version is None else _board_etag(self.version),
+            "last_checkpoint": self.last_checkpoint,
+            "duration_ms": self.duration_ms,
+            "size_bytes": self.size_bytes,
+            "error": self.error,
+            "in_progress": self.in_progress,
+            "dirty": self.is_dirty(),
+            "interval_seconds": self.interval,
+        }
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._requested == self._completed and not self._closed:
+                    self._cond.wait(self.interval or None)
+                if self._closed:
+                    return
+                target = self._requested
+            try:
+                if target > self._completed or (self.interval and self.is_dirty()):
+                    self._write()
+            finally:
+                # Waiters are released whatever happened to the checkpoint.
+                with self._cond:
+                    self._completed = max(self._completed, target)
+                    self._cond.notify_all()
+
+    def _write(self):
+        self.in_progress = True
+        started = time.monotonic()
+        tmp_path = self.path + '.tmp'
+        try:
+            version, data = self.store.read()
+            with open(tmp_path, 'wb' if self.format == 'binary' else 'w') as f:
+                if self.format == 'binary':
+                    write_binary_checkpoint(f, data, self.compression)
+                else:
+                    json.dump(data, f, separators=(',', ':'), default=_json_default)
+                f.flush()
+                os.fsync(f.fileno())
+                size = f.tell()
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            # E.g. a full disk, or a value the format cannot encode.
+            self.error = str(e) or type(e).__name__
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        else:
+            self.version = version
+            self.size_bytes = size
+            self.duration_ms = round((time.monotonic() - started) * 1000, 3)
+            self.last_checkpoint = datetime.datetime.utcnow().isoformat() + 'Z'
+            self.error = None
+        finally:
+            self.in_progress = False
+
+
+checkpointer = Checkpointer(store, CHECKPOINT_FILE, CHECKPOINT_INTERVAL, CHECKPOINT_FORMAT, CHECKPOINT_COMPRESSION)
+if CHECKPOINT_INTERVAL:
+    checkpointer.start()
+atexit.register(checkpointer.close)
 
 
 @app.route('/')
@@ -69,45 +2553,736 @@ def index():
 
 @app.route('/api/health', methods=['GET'])
 def get_health_data_api():
-    """API endpoint to get all health data."""
-    return jsonify(health_data)
+    """
+    API endpoint to get all health data.
+    Responds 304 Not Modified without serializing the board when the client's
+    If-None-Match still matches the current board version. With ?since=<etag>
+    it returns only what changed after that version (see _build_health_delta).
+    ?status=, ?color=, ?category= (each comma-separated) and ?prefix= return
+    only the matching items (see _build_filtered_health), and ?fields= only
+    the listed keys of each item.
+    Full and projected responses are served from health_cache, so the board is
+    serialized (and gzipped) at most once per version and variant however many
+    clients poll it.
+    """
+    version = store.version
+    etag = _board_etag(version)
+    since = request.args.get('since')
+    filters = _parse_health_filters(request.args)
+    fields, error = _parse_fields(request.args)
+    if error:
+        return jsonify({"error": error}), 400
+    if filters and since is not None:
+        return jsonify({"error": "since cannot be combined with status, color, category or prefix"}), 400
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    elif since is not None:
+        version, delta = _build_health_delta(_parse_board_etag(since))
+        etag = delta["version"]
+        if fields:
+            delta["data"] = _project_board(delta["data"], fields)
+        response = jsonify(delta)
+    elif filters:
+        key = ('filter', fields) + tuple(filters.get(name) for name in HEALTH_FILTERS)
+        response, version = _cached_json_response(health_cache, version, key,
+                                                  lambda: _build_filtered_health(filters, fields))
+        etag = _board_etag(version)
+    else:
+        key = 'full' if fields is None else ('full', fields)
+        response, version = _cached_json_response(health_cache, version, key, lambda: _build_health_body(fields))
+        etag = _board_etag(version)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _build_health_body(fields=None):
+    """Encodes the whole board for health_cache, with the version it encodes."""
+    version, data = store.read()
+    if fields:
+        data = _project_board(data, fields)
+    return version, _encode_json(data)
+
+
+ITEM_FIELDS = ('status', 'last_updated', 'message', 'url', 'ttl')
+
+
+def _parse_fields(args):
+    """
+    Parses ?fields=status,last_updated. Returns (fields, error): the requested
+    item keys as a tuple in ITEM_FIELDS order, or None when all are wanted.
+    """
+    value = args.get('fields')
+    if value is None:
+        return None, None
+    names = {part.strip() for part in value.split(',') if part.strip()}
+    if not names or not names <= set(ITEM_FIELDS):
+        return None, f"Invalid fields. Must be a comma-separated list of: {', '.join(ITEM_FIELDS)}"
+    return tuple(name for name in ITEM_FIELDS if name in names), None
+
+
+def _project_item(item, fields):
+    """Returns the fields of item that it has, or item itself if fields is None."""
+    if fields is None:
+        return item
+    return {name: item[name] for name in fields if name in item}
+
+
+def _project_board(data, fields):
+    return {category_name: {item_name: _project_item(item, fields) for item_name, item in items.items()}
+            for category_name, items in data.items()}
+
+
+HEALTH_FILTERS = ('status', 'color', 'category', 'prefix')
+
+
+def _parse_health_filters(args):
+    """Returns the /api/health filters present in args; list filters become sorted tuples."""
+    filters = {}
+    for name in HEALTH_FILTERS:
+        value = args.get(name)
+        if value is None:
+            continue
+        if name == 'prefix':
+            filters[name] = value
+            continue
+        values = {part.strip() for part in value.split(',') if part.strip()}
+        if name in ('status', 'color'):
+            values = {part.lower() for part in values}
+        filters[name] = tuple(sorted(values))
+    return filters
+
+
+def _build_filtered_health(filters, fields=None):
+    """
+    Encodes the items matching all of filters (any of the listed values within
+    one filter) for health_cache. Candidates come from whichever index yields
+    the fewest: status/color, category or name prefix. Each candidate is then
+    checked against the snapshot, so the result always matches the version
+    it is reported with.
+    """
+    version, data = store.read()
+    categories = filters.get('category')
+    statuses = None
+    if 'status' in filters:
+        statuses = set(filters['status'])
+    if 'color' in filters:
+        color_statuses = health_index.statuses_with_color(set(filters['color']))
+        statuses = color_statuses if statuses is None else statuses & color_statuses
+    prefix = filters.get('prefix')
+
+    if statuses is None and prefix is None:
+        # Whole categories, including empty ones.
+        result = {name: data[name] for name in categories if name in data}
+        if fields:
+            result = _project_board(result, fields)
+        return version, _encode_json(result)
+
+    sources = []
+    if statuses is not None:
+        sources.append((health_index.count_status(statuses), lambda: health_index.by_status(statuses)))
+    if categories is not None:
+        sources.append((sum(len(data.get(name, ())) for name in categories),
+                        lambda: [(name, item_name) for name in categories for item_name in data.get(name, ())]))
+    if prefix is not None:
+        sources.append((health_index.count_prefix(prefix), lambda: health_index.by_prefix(prefix)))
+    _, candidates = min(sources, key=lambda source: source[0])
+
+    result = {}
+    for category_name, item_name in candidates():
+        item = data.get(category_name, {}).get(item_name)
+        if item is None:
+            continue
+        if statuses is not None and item.get('status') not in statuses:
+            continue
+        if categories is not None and category_name not in categories:
+            continue
+        if prefix is not None and not item_name.startswith(prefix):
+            continue
+        result.setdefault(category_name, {})[item_name] = _project_item(item, fields)
+    return version, _encode_json(result)
+
+
+ITEM_SORTS = ('category', 'status', 'last_updated')
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def _encode_cursor(sort, descending, key):
+    return base64.urlsafe_b64encode(json.dumps([sort, descending, key]).encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor, sort, descending):
+    """Returns the sort key in cursor, or None if it is invalid or from another sort order."""
+    try:
+        cursor_sort, cursor_descending, key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, TypeError):
+        return None
+    if (cursor_sort, cursor_descending) != (sort, descending) or not isinstance(key, list):
+        return None
+    return tuple(key)
+
+
+@app.route('/api/items', methods=['GET'])
+def list_items_api():
+    """
+    API endpoint listing items one page at a time, sorted by ?sort=category
+    (the default), status (by severity) or last_updated, with ?order=desc to
+    reverse it. Pages come from the maintained ordered indexes, so fetching
+    any page costs O(log n + limit) however large the board is; the opaque
+    next_cursor continues after the last item returned. ?fields= works as
+    for /api/health.
+    """
+    sort = request.args.get('sort', 'category')
+    if sort not in ITEM_SORTS:
+        return jsonify({"error": f"Invalid sort. Must be one of: {', '.join(ITEM_SORTS)}"}), 400
+    order = request.args.get('order', 'asc')
+    if order not in ('asc', 'desc'):
+        return jsonify({"error": "Invalid order. Must be asc or desc"}), 400
+    descending = order == 'desc'
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MAX_PAGE_SIZE}"}), 400
+    fields, error = _parse_fields(request.args)
+    if error:
+        return jsonify({"error": error}), 400
+    after = None
+    if 'cursor' in request.args:
+        after = _decode_cursor(request.args['cursor'], sort, descending)
+        if after is None:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    version, data = store.read()
+    try:
+        if sort == 'last_updated':
+            keys, more = staleness.page(after, limit, descending)
+        else:
+            keys, more = health_index.page(sort, after, limit, descending)
+    except TypeError:
+        # A cursor whose key does not compare with the index.
+        return jsonify({"error": "Invalid cursor"}), 400
+
+    items = []
+    for key in keys:
+        category_name, item_name = key[-2:]
+        item = data.get(category_name, {}).get(item_name)
+        if item is not None:
+            items.append(dict(_project_item(item, fields), category=category_name, item=item_name))
+    next_cursor = _encode_cursor(sort, descending, list(keys[-1])) if more else None
+    return jsonify({"items": items, "next_cursor": next_cursor, "version": _board_etag(version)})
+
+
+@app.route('/api/stream', methods=['GET'])
+def stream_api():
+    """
+    API endpoint streaming board changes as server-sent events.
+
+    The first event brings the client up to date: a delta since its Last-Event-ID
+    (or ?since=<etag>) when the server still has it, otherwise a full snapshot.
+    Every later event carries one change. All events use the /api/health?since=
+    delta format and their id is the board ETag, so a reconnecting EventSource
+    resumes where it left off.
+    """
+    since = request.headers.get('Last-Event-ID') or request.args.get('since')
+    # Subscribe before taking the snapshot so no change can fall in between.
+    subscriber = event_hub.subscribe()
+    last_version, delta = _build_health_delta(_parse_board_etag(since) if since else None)
+    initial_event = _format_event('delta', delta["version"], delta)
+
+    def generate(subscriber, last_version):
+        try:
+            yield b'retry: 5000\n' + initial_event
+            sent_at = time.monotonic()
+            while True:
+                if subscriber.lagged:
+                    # Events were dropped: resubscribe and send what was missed as one delta.
+                    subscriber = event_hub.subscribe()
+                    last_version, delta = _build_health_delta(last_version)
+                    yield _format_event('delta', delta["version"], delta)
+                    sent_at = time.monotonic()
+                    continue
+                try:
+                    version, payload = subscriber.queue.get(timeout=min(STREAM_POLL_SECONDS, STREAM_KEEPALIVE_SECONDS))
+                except queue.Empty:
+                    # Writes by other worker processes reach this one only when it
+                    # reads the store, which then queues them like local changes.
+                    if store.read()[0] > last_version:
+                        if subscriber.queue.empty():
+                            last_version, delta = _build_health_delta(last_version)
+                            yield _format_event('delta', delta["version"], delta)
+                            sent_at = time.monotonic()
+                    elif time.monotonic() - sent_at >= STREAM_KEEPALIVE_SECONDS:
+                        yield b': keepalive\n\n'
+                        sent_at = time.monotonic()
+                    continue
+                if version > last_version:  # Older events are already covered by a delta
+                    last_version = version
+                    yield payload
+                    sent_at = time.monotonic()
+        finally:
+            event_hub.unsubscribe(subscriber)
+
+    return Response(generate(subscriber, last_version), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @app.route('/api/status-config', methods=['GET'])
 def get_status_config():
     """API endpoint to get the status configuration."""
-    return jsonify(STATUS_CONFIG)
+    response, _ = _cached_json_response(status_config_cache, 0, 'full', lambda: (0, _encode_json(STATUS_CONFIG)))
+    return response
 
 
 @app.route('/api/checkpoint', methods=['POST'])
 def checkpoint_data():
-    """Saves the current health_data to a file."""
-    try:
-        with open('health_data.json', 'w') as f:
-            json.dump(health_data, f, indent=4)
-        return jsonify({"message": "Data checkpointed successfully to health_data.json"}), 200
-    except IOError as e:
-        return jsonify({"error": f"Failed to write checkpoint file: {str(e)}"}), 500
+    """
+    Saves the current board to a file. The checkpoint is written by the
+    background checkpointer; with ?wait=0 the request returns 202 right away
+    instead of waiting for it (see GET /api/checkpoint for the outcome).
+    """
+    ticket = checkpointer.request()
+    if not _is_truthy(request.args.get('wait', '1')):
+        return jsonify({"message": f"Checkpoint to {CHECKPOINT_FILE} started"}), 202
+    error = checkpointer.wait(ticket)
+    if error is not None:
+        return jsonify({"error": f"Failed to write checkpoint file: {error}"}), 500
+    response = {"message": f"Data checkpointed successfully to {CHECKPOINT_FILE}"}
+    response.update(checkpointer.status())
+    return jsonify(response), 200
+
+
+@app.route('/api/checkpoint', methods=['GET'])
+def checkpoint_status():
+    """
+    API endpoint reporting the last checkpoint: when, how long it took and its
+    size, and with a journal, whether its last write failed.
+    """
+    status = checkpointer.status()
+    status["journal"] = None if store.journal is None else store.journal.status()
+    return jsonify(status)
 
 
 @app.route('/api/restore', methods=['POST'])
 def restore_data():
-    """Restores health_data from a file."""
-    global health_data  # noqa: F824
+    """
+    Restores the board from a file, in JSON or the binary checkpoint format.
+    The new board is built off to the side and swapped in as a whole, so
+    readers see either the old board or the restored one.
+    """
     try:
-        with open('health_data.json', 'r') as f:
-            data_from_file = json.load(f)
-            health_data.clear()
-            health_data.update(data_from_file)
-        return jsonify({"message": "Data restored successfully from health_data.json"}), 200
+        with open(CHECKPOINT_FILE, 'rb') as f:
+            data_from_file = read_checkpoint(f)
+        store.replace(data_from_file)
+        return jsonify({"message": f"Data restored successfully from {CHECKPOINT_FILE}"}), 200
     except FileNotFoundError:
-        return jsonify({"error": "Checkpoint file 'health_data.json' not found"}), 404
+        return jsonify({"error": f"Checkpoint file '{CHECKPOINT_FILE}' not found"}), 404
     except json.JSONDecodeError as e:
         return jsonify({"error": f"Invalid JSON in checkpoint file: {str(e)}"}), 500
+    except CheckpointError as e:
+        return jsonify({"error": f"Invalid checkpoint file: {str(e)}"}), 500
     except IOError as e:  # Catch other potential I/O errors during read
         return jsonify({"error": f"Failed to read checkpoint file: {str(e)}"}), 500
 
 
+# --- Write Damping ---
+
+class WriteDamper:
+    """
+    Damps high-frequency reporters before their updates reach the board, and
+    with it the history, SSE streams and other listeners.
+
+    Coalescing: once an item has been written, further PUTs to it within
+    `window` seconds are merged into one pending update (later fields win),
+    which is written when the window ends and opens the next one. A reporter
+    sending progress every 100ms thus makes one visible change per window.
+
+    Hysteresis: a report that changes an item's status only takes effect once
+    the new status has been reported for hold_seconds, or in hold_updates
+    consecutive reports, whichever comes first; until then the item keeps its
+    status while the rest of the report applies. Reporting the current status
+    again cancels the pending transition. Items in 'unknown' take any status
+    at once.
+    """
+
+    def __init__(self, window=0, hold_seconds=0, hold_updates=0, clock=time.monotonic):
+        self.window = window
+        self.hold_seconds = hold_seconds
+        self.hold_updates = hold_updates
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._window_ends = {}  # (category, item) -> end of its coalescing window
+        self._windows = []  # Heap of (end, category, item)
+        self._pending = {}  # (category, item) -> [merged payload, upsert]
+        self._candidates = {}  # (category, item) -> [status, first reported, reports]
+        self._counters = Counter()
+        self._thread = None
+        self._closed = False
+
+    def submit(self, category_name, item_name, data, upsert):
+        """
+        Merges the update into the item's pending one if its window is open and
+        returns True; returns False if the caller should write it now.
+        """
+        if not self.window:
+            return False
+        key = (category_name, item_name)
+        with self._cond:
+            if self._window_ends.get(key, 0) <= self.clock():
+                return False
+            pending = self._pending.setdefault(key, [{}, False])
+            pending[0].update(data)
+            pending[1] = pending[1] or upsert
+            self._counters['coalesced'] += 1
+            return True
+
+    def written(self, category_name, item_name):
+        """Opens a coalescing window after a write of the item."""
+        if not self.window:
+            return
+        with self._cond:
+            self._open_window((category_name, item_name), self.clock())
+
+    def _open_window(self, key, now):
+        end = now + self.window
+        self._window_ends[key] = end
+        if not self._windows or end < self._windows[0][0]:
+            self._cond.notify()
+        heapq.heappush(self._windows, (end,) + key)
+
+    def flush(self, force=False):
+        """
+        Writes the pending updates whose window has ended, or all of them with
+        force, in one transaction. Returns how many were written.
+        """
+        with self._cond:
+            now = self.clock()
+            due = []
+            while self._windows and (force or self._windows[0][0] <= now):
+                end, category_name, item_name = heapq.heappop(self._windows)
+                key = (category_name, item_name)
+                # Skip entries for windows since reopened by a direct write.
+                if self._window_ends.get(key) != end:
+                    continue
+                del self._window_ends[key]
+                if key in self._pending:
+                    due.append((key, self._pending.pop(key)))
+            if not force:
+                for key, _ in due:
+                    self._open_window(key, now)
+        if not due:
+            return 0
+
+        written = 0
+        with store.transaction() as txn:
+            for (category_name, item_name), (payload, upsert) in due:
+                _, status_code = _update_item(txn, category_name, item_name, payload, upsert)
+                if status_code < 400:
+                    written += 1
+        with self._cond:
+            self._counters['written'] += written
+            # E.g. the item was deleted while its update was pending.
+            self._counters['dropped'] += len(due) - written
+        return written
+
+    def status_for(self, category_name, item_name, current, reported):
+        """
+        Returns the status to write when `reported` arrives for an item that is
+        now in `current` (None for an item created by this update).
+        """
+        if not (self.hold_seconds or self.hold_updates):
+            return reported
+        key = (category_name, item_name)
+        with self._cond:
+            if current is None or current == 'unknown' or reported == current:
+                if self._candidates.pop(key, None) is not None and reported == current:
+                    self._counters['flaps'] += 1
+                return reported
+            now = self.clock()
+            candidate = self._candidates.get(key)
+            if candidate is None or candidate[0] != reported:
+                candidate = self._candidates[key] = [reported, now, 0]
+            candidate[2] += 1
+            if ((self.hold_updates and candidate[2] >= self.hold_updates)
+                    or (self.hold_seconds and now - candidate[1] >= self.hold_seconds)):
+                del self._candidates[key]
+                return reported
+            self._counters['damped'] += 1
+            return current
+
+    def stats(self):
+        with self._cond:
+            return {
+                "window": self.window,
+                "hold_seconds": self.hold_seconds,
+                "hold_updates": self.hold_updates,
+                "pending": len(self._pending),
+                "pending_transitions": len(self._candidates),
+                # Updates merged into a pending one, pending updates written
+                # and dropped, reports whose status change was held back, and
+                # held-back transitions cancelled by a return to the old status.
+                "coalesced": self._counters['coalesced'],
+                "written": self._counters['written'],
+                "dropped": self._counters['dropped'],
+                "damped": self._counters['damped'],
+                "flaps": self._counters['flaps'],
+            }
+
+    def start(self):
+        with self._cond:
+            self._closed = False
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='health-board-coalesce', daemon=True)
+                self._thread.start()
+
+    def close(self):
+        """Stops the flushing thread and writes whatever is still pending."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+        self.flush(force=True)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                timeout = None
+                if self._windows:
+                    timeout = min(max(self._windows[0][0] - self.clock(), 0), 3600)
+                if timeout != 0:
+                    self._cond.wait(timeout)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                app.logger.error(f"Failed to write coalesced updates: {e}")
+                time.sleep(1)
+
+
+write_damper = WriteDamper(COALESCE_WINDOW, HYSTERESIS_SECONDS, HYSTERESIS_UPDATES)
+if COALESCE_WINDOW:
+    write_damper.start()
+atexit.register(write_damper.close)
+
+
+# --- Mutation Helpers ---
+# Each helper applies one change to a store transaction and returns a
+# (body, status_code) pair. They are shared by the single-item routes and the
+# batch endpoint.
+
+def _create_category(txn, category_name):
+    is_valid, error_msg = validate_name(category_name)
+    if not is_valid:
+        return {"error": f"Invalid category_name: {error_msg}"}, 400
+
+    if category_name in txn.data:
+        return {"note": f"Category '{category_name}' already exists"}, 200
+
+    txn.create_category(category_name)
+    return {category_name: {}}, 201
+
+
+def _delete_category(txn, category_name):
+    if category_name not in txn.data:
+        return {"error": f"Category '{category_name}' not found"}, 404
+
+    txn.delete_category(category_name)
+    return {"message": f"Category '{category_name}' deleted successfully"}, 200
+
+
+def _create_item(txn, category_name, item_name):
+    if category_name not in txn.data:
+        return {"error": f"Category '{category_name}' not found"}, 404
+
+    is_valid, error_msg = validate_name(item_name)
+    if not is_valid:
+        return {"error": f"Invalid item_name: {error_msg}"}, 400
+
+    if item_name in txn.data[category_name]:
+        existing_item_data = txn.data[category_name][item_name]
+        response_data = {"note": "Item already existed."}
+        response_data.update(existing_item_data)
+        return response_data, 200
+
+    item = Item('unknown', _utc_timestamp())
+    txn.put_item(category_name, item_name, item)
+    return {item_name: item}, 201
+
+
+def _delete_item(txn, category_name, item_name):
+    if category_name not in txn.data:
+        return {"error": f"Category '{category_name}' not found"}, 404
+    if item_name not in txn.data[category_name]:
+        return {"error": f"Item '{item_name}' not found in category '{category_name}'"}, 404
+
+    txn.delete_item(category_name, item_name)
+    # Optional: if category becomes empty, delete it? For now, allow empty categories.
+    return {"message": f"Item '{item_name}' from category '{category_name}' deleted successfully"}, 200
+
+
+def _update_item(txn, category_name, item_name, data, upsert=False):
+    if not upsert:
+        if category_name not in txn.data:
+            return {"error": f"Category '{category_name}' not found"}, 404
+        if item_name not in txn.data[category_name]:
+            return {"error": f"Item '{item_name}' not found in category '{category_name}'"}, 404
+
+    error_msg = _validate_update(data)
+    if error_msg:
+        return {"error": error_msg}, 400
+    new_status = data['status'].lower() if 'status' in data else None
+
+    status_code = 200
+    if upsert and item_name not in txn.data.get(category_name, {}):
+        # Create whatever is missing so the caller needs only this one request.
+        body, create_status = _create_category(txn, category_name)
+        if create_status >= 400:
+            return body, create_status
+        body, create_status = _create_item(txn, category_name, item_name)
+        if create_status >= 400:
+            return body, create_status
+        status_code = 201
+
+    # Items are immutable, so the update makes a new one.
+    item = txn.data[category_name][item_name]
+    changes = {'updated': _utc_timestamp()}
+
+    if new_status is not None:
+        current = None if status_code == 201 else item.get('status')
+        changes['status'] = write_damper.status_for(category_name, item_name, current, new_status)
+
+    if 'message' in data:
+        changes['message'] = data['message']
+
+    if 'url' in data:
+        if is_safe_url(data['url']):
+            changes['url'] = data['url']
+
+    if 'ttl' in data:
+        changes['ttl'] = data['ttl'] or None
+
+    item = item.replace(**changes)
+    txn.put_item(category_name, item_name, item)
+
+    return {item_name: item}, status_code
+
+
+TTL_ERROR = "ttl must be a positive number of seconds, or 0 or null to clear it"
+
+
+def _validate_update(data):
+    """Checks the fields of an item update. Returns an error message, or None."""
+    if 'status' in data and (not isinstance(data['status'], str) or data['status'].lower() not in STATUS_CONFIG):
+        return f"Invalid status. Must be one of: {', '.join(STATUS_CONFIG.keys())}"
+    for field in ('message', 'url'):
+        if field in data and not isinstance(data[field], str):
+            return f"{field} must be a string"
+    if 'ttl' in data and not _is_valid_ttl(data['ttl']):
+        return TTL_ERROR
+    return None
+
+
+def _is_valid_ttl(value):
+    """Checks an item TTL: seconds, with 0 or None clearing it."""
+    if value is None:
+        return True
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value < float('inf')
+
+
+def _is_truthy(value):
+    """Interprets a query-string flag such as ?upsert=1."""
+    return value.lower() in ('1', 'true', 'yes')
+
+
+def _validate_batch_operation(operation):
+    """
+    Checks a single batch operation before anything is applied.
+    Returns an error message, or None if the operation is well formed.
+    """
+    if not isinstance(operation, dict):
+        return "Operation must be a JSON object"
+
+    op = operation.get('op')
+    if op not in BATCH_OPERATIONS:
+        return f"Invalid op. Must be one of: {', '.join(BATCH_OPERATIONS)}"
+
+    for field in ('category', 'item'):
+        if field not in operation:
+            continue
+        if not isinstance(operation[field], str):
+            return f"{field} must be a string"
+        is_valid, error_msg = validate_name(operation[field])
+        if not is_valid:
+            return f"Invalid {field}: {error_msg}"
+
+    if 'category' not in operation:
+        return "Missing category"
+    if op == 'update' and 'item' not in operation:
+        return "Missing item for update"
+
+    if op == 'update':
+        error_msg = _validate_update(operation)
+        if error_msg:
+            return error_msg
+        if 'upsert' in operation and not isinstance(operation['upsert'], bool):
+            return "upsert must be a boolean"
+    return None
+
+
+def _apply_batch_operation(txn, operation):
+    op = operation['op']
+    category_name = operation['category']
+    item_name = operation.get('item')
+
+    if op == 'create':
+        if item_name is None:
+            return _create_category(txn, category_name)
+        return _create_item(txn, category_name, item_name)
+    if op == 'delete':
+        if item_name is None:
+            return _delete_category(txn, category_name)
+        return _delete_item(txn, category_name, item_name)
+    return _update_item(txn, category_name, item_name, operation, upsert=operation.get('upsert', False))
+
+
+@app.route('/api/batch', methods=['POST'])
+def batch_api():
+    """
+    API endpoint to apply many create, update and delete operations in one request.
+    Every operation is validated before any of them is applied; the valid batch is
+    then applied in order in a single transaction so readers never see it half done.
+    """
+    data = request.get_json()
+    if not isinstance(data, dict) or not isinstance(data.get('operations'), list):
+        return jsonify({"error": "Missing operations list in request body"}), 400
+
+    operations = data['operations']
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return jsonify({"error": f"Too many operations. Maximum is {MAX_BATCH_OPERATIONS}"}), 400
+
+    errors = []
+    for index, operation in enumerate(operations):
+        error_msg = _validate_batch_operation(operation)
+        if error_msg:
+            errors.append({"index": index, "error": error_msg})
+    if errors:
+        return jsonify({"error": "Batch rejected; no operations were applied", "errors": errors}), 400
+
+    results = []
+    with store.transaction() as txn:
+        for operation in operations:
+            body, status_code = _apply_batch_operation(txn, operation)
+            results.append({"status_code": status_code, "body": body})
+    return jsonify({"results": results}), 200
+
+
 @app.route('/api/categories', methods=['POST'])
 def create_category_api():
     """API endpoint to create a new category."""
@@ -115,99 +3290,154 @@ def create_category_api():
     if not data or 'category_name' not in data:
         return jsonify({"error": "Missing category_name in request body"}), 400
 
-    category_name = data['category_name']
-    is_valid, error_msg = validate_name(category_name)
-    if not is_valid:
-        return jsonify({"error": f"Invalid category_name: {error_msg}"}), 400
-
-    if category_name in health_data:
-        return jsonify({"note": f"Category '{category_name}' already exists"}), 200
-
-    health_data[category_name] = {}
-    return jsonify({category_name: health_data[category_name]}), 201
+    with store.transaction() as txn:
+        body, status_code = _create_category(txn, data['category_name'])
+    return jsonify(body), status_code
 
 
 @app.route('/api/categories/<category_name>', methods=['DELETE'])
 def delete_category_api(category_name):
     """API endpoint to delete a category."""
-    if category_name not in health_data:
-        return jsonify({"error": f"Category '{category_name}' not found"}), 404
-
-    del health_data[category_name]
-    return jsonify({"message": f"Category '{category_name}' deleted successfully"}), 200
+    with store.transaction() as txn:
+        body, status_code = _delete_category(txn, category_name)
+    return jsonify(body), status_code
 
 
 @app.route('/api/categories/<category_name>/items', methods=['POST'])
 def create_item_api(category_name):
     """API endpoint to add a new item to a category."""
-    if category_name not in health_data:
+    if category_name not in store.snapshot():
         return jsonify({"error": f"Category '{category_name}' not found"}), 404
 
     data = request.get_json()
     if not data or 'item_name' not in data:
         return jsonify({"error": "Missing item_name in request body"}), 400
 
-    item_name = data['item_name']
-    is_valid, error_msg = validate_name(item_name)
-    if not is_valid:
-        return jsonify({"error": f"Invalid item_name: {error_msg}"}), 400
-
-    if item_name in health_data[category_name]:
-        existing_item_data = health_data[category_name][item_name]
-        response_data = {"note": "Item already existed."}
-        response_data.update(existing_item_data)
-        return jsonify(response_data), 200
-
-    health_data[category_name][item_name] = get_default_item_status()
-    health_data[category_name][item_name]['last_updated'] = datetime.datetime.utcnow().isoformat() + 'Z'
-    return jsonify({item_name: health_data[category_name][item_name]}), 201
+    with store.transaction() as txn:
+        body, status_code = _create_item(txn, category_name, data['item_name'])
+    return jsonify(body), status_code
 
 
 @app.route('/api/categories/<category_name>/items/<item_name>', methods=['DELETE'])
 def delete_item_api(category_name, item_name):
     """API endpoint to delete an item from a category."""
-    if category_name not in health_data:
+    with store.transaction() as txn:
+        body, status_code = _delete_item(txn, category_name, item_name)
+    return jsonify(body), status_code
+
+
+@app.route('/api/summary', methods=['GET'])
+def summary_api():
+    """
+    API endpoint with the number of items in each status, for the whole board
+    and per category, and the worst status color of each. The counters are
+    maintained on every change, so this costs O(categories), not O(items).
+    """
+    return jsonify(board_summary.summary())
+
+
+@app.route('/api/damping', methods=['GET'])
+def damping_api():
+    """
+    API endpoint with the write damping settings and counters: updates
+    coalesced into pending ones, and status changes held back by hysteresis.
+    """
+    return jsonify(write_damper.stats())
+
+
+@app.route('/api/stale', methods=['GET'])
+def stale_api():
+    """
+    API endpoint listing the items not updated for more than ?older_than=
+    seconds, oldest first. Served from the staleness index, so the cost
+    depends on the number of stale items, not the size of the board. ?fields=
+    works as for /api/health.
+    """
+    try:
+        older_than = float(request.args.get('older_than', ''))
+    except ValueError:
+        return jsonify({"error": "older_than must be a number of seconds"}), 400
+    if not 0 <= older_than < float('inf'):
+        return jsonify({"error": "older_than must be a number of seconds"}), 400
+    fields, error = _parse_fields(request.args)
+    if error:
+        return jsonify({"error": error}), 400
+
+    data = store.snapshot()
+    items = []
+    for category_name, item_name in staleness.stale(older_than):
+        item = data.get(category_name, {}).get(item_name)
+        if item is not None:
+            items.append(dict(_project_item(item, fields), category=category_name, item=item_name))
+    return jsonify({"older_than": older_than, "items": items})
+
+
+@app.route('/api/rollups', methods=['GET'])
+def rollups_api():
+    """
+    API endpoint with the uptime of every category over each rollup window:
+    the share of time its items spent in a green status. Served from
+    accumulators, so the cost depends only on the number of categories.
+    """
+    return jsonify({"windows": [name for name, _ in ROLLUP_WINDOWS],
+                    "categories": {name: rollups.category_rollup(name) for name in rollups.category_names()}})
+
+
+@app.route('/api/rollups/<category_name>', methods=['GET'])
+def category_rollups_api(category_name):
+    """API endpoint with the uptime of one category and of each of its items."""
+    items = store.snapshot().get(category_name)
+    category_rollup = rollups.category_rollup(category_name)
+    if items is None or category_rollup is None:
         return jsonify({"error": f"Category '{category_name}' not found"}), 404
-    if item_name not in health_data[category_name]:
-        return jsonify({"error": f"Item '{item_name}' not found in category '{category_name}'"}), 404
+    return jsonify({"windows": [name for name, _ in ROLLUP_WINDOWS], "category": category_rollup,
+                    "items": {item_name: rollups.item_rollup(category_name, item_name) for item_name in items}})
 
-    del health_data[category_name][item_name]
-    # Optional: if category becomes empty, delete it? For now, allow empty categories.
-    # if not health_data[category_name]:
-    #     del health_data[category_name]
-    return jsonify({"message": f"Item '{item_name}' from category '{category_name}' deleted successfully"}), 200
+
+@app.route('/api/categories/<category_name>/items/<item_name>/history', methods=['GET'])
+def item_history_api(category_name, item_name):
+    """
+    API endpoint listing an item's recent status transitions, oldest first.
+    History is kept in memory by each server process and starts when it does.
+    """
+    data = store.snapshot()
+    if category_name not in data:
+        return jsonify({"error": f"Category '{category_name}' not found"}), 404
+    if item_name not in data[category_name]:
+        return jsonify({"error": f"Item '{item_name}' not found in category '{category_name}'"}), 404
+    return jsonify({"category": category_name, "item": item_name,
+                    "history": item_history.get(category_name, item_name)})
 
 
 @app.route('/api/categories/<category_name>/items/<item_name>', methods=['PUT'])
 def update_item_api(category_name, item_name):
-    """API endpoint to update an item's status, message, or url."""
-    if category_name not in health_data:
-        return jsonify({"error": f"Category '{category_name}' not found"}), 404
-    if item_name not in health_data[category_name]:
-        return jsonify({"error": f"Item '{item_name}' not found in category '{category_name}'"}), 404
+    """
+    API endpoint to update an item's status, message, or url.
+    With ?upsert=1 the category and item are created first if they do not exist.
+    """
+    upsert = _is_truthy(request.args.get('upsert', ''))
+    if not upsert:
+        data = store.snapshot()
+        if category_name not in data:
+            return jsonify({"error": f"Category '{category_name}' not found"}), 404
+        if item_name not in data[category_name]:
+            return jsonify({"error": f"Item '{item_name}' not found in category '{category_name}'"}), 404
 
     data = request.get_json()
     if not data:
         return jsonify({"error": "Invalid JSON payload"}), 400
 
-    item = health_data[category_name][item_name]
-
-    if 'status' in data:
-        new_status = data['status'].lower()
-        if new_status not in STATUS_CONFIG:
-            return jsonify({"error": f"Invalid status. Must be one of: {', '.join(STATUS_CONFIG.keys())}"}), 400
-        item['status'] = new_status
-
-    if 'message' in data:
-        item['message'] = data['message']
-
-    if 'url' in data:
-        if is_safe_url(data['url']):
-            item['url'] = data['url']
-
-    item['last_updated'] = datetime.datetime.utcnow().isoformat() + 'Z'
+    error_msg = _validate_update(data)
+    if error_msg:
+        return jsonify({"error": error_msg}), 400
+    if write_damper.submit(category_name, item_name, data, upsert):
+        return jsonify({"message": "Update coalesced; it is written when the item's coalescing window ends"}), 202
 
-    return jsonify({item_name: item})
+    with store.transaction() as txn:
+        body, status_code = _update_item(txn, category_name, item_name, data, upsert=upsert)
+    if status_code < 400:
+        write_damper.written(category_name, item_name)
+    return jsonify(body), status_code
 
 
 if __name__ == '__main__':
@@ -3,6 +3,10 @@ document.addEventListener('DOMContentLoaded', function() {
     const darkModeToggle = document.getElementById('dark-mode-toggle');
     let statusConfig = {};
     let lastFetchedData = {}; // Store last fetched data to re-render on dark mode toggle
+    let healthEtag = null; // ETag of lastFetchedData, sent as If-None-Match when polling
+    let pollTimer = null; // Set while polling, i.e. while the event stream is unavailable
+    let streamOpen = false;
+    let renderPending = false;
 
     // Dark Mode Logic
     const darkModeKey = 'darkMode';
@@ -114,23 +118,64 @@ document.addEventListener('DOMContentLoaded', function() {
             });
     }
 
+    /**
+     * Returns a copy of data with a delta from /api/health?since=... applied.
+     * Tombstones are applied first, since a category or item may have been
+     * deleted and then re-created.
+     */
+    function applyHealthDelta(data, delta) {
+        if (delta.full) {
+            return delta.data;
+        }
+        const merged = Object.assign({}, data);
+        delta.deleted_categories.forEach(categoryName => {
+            delete merged[categoryName];
+        });
+        for (const categoryName in delta.deleted_items) {
+            if (merged.hasOwnProperty(categoryName)) {
+                const items = Object.assign({}, merged[categoryName]);
+                delta.deleted_items[categoryName].forEach(itemName => {
+                    delete items[itemName];
+                });
+                merged[categoryName] = items;
+            }
+        }
+        for (const categoryName in delta.data) {
+            merged[categoryName] = Object.assign({}, merged[categoryName], delta.data[categoryName]);
+        }
+        return merged;
+    }
+
     /**
      * Fetches health data from the API and triggers table update.
+     * After the first full fetch only changes since the last seen version are requested.
      */
     function fetchHealthData() {
-        fetch('api/health')
+        const headers = healthEtag ? { 'If-None-Match': healthEtag } : {};
+        const url = healthEtag ? `api/health?since=${encodeURIComponent(healthEtag)}` : 'api/health';
+        const isDelta = Boolean(healthEtag);
+        // 'no-store' keeps the browser cache out of the way so a 304 reaches us as-is.
+        fetch(url, { headers: headers, cache: 'no-store' })
             .then(response => {
+                if (response.status === 304) {
+                    return null; // Board unchanged since the last fetch
+                }
                 if (!response.ok) {
                     throw new Error(`HTTP error! status: ${response.status}`);
                 }
+                healthEtag = response.headers.get('ETag');
                 return response.json();
             })
             .then(data => {
-                lastFetchedData = data;
-                updateTable(data);
+                if (data === null || streamOpen) {
+                    return; // Unchanged, or the event stream took over while this request was in flight
+                }
+                lastFetchedData = isDelta ? applyHealthDelta(lastFetchedData, data) : data;
+                updateTable(lastFetchedData);
             })
             .catch(error => {
                 console.error('Error fetching health data:', error);
+                healthEtag = null; // Force a full fetch so the error message gets replaced
                 healthTableBody.innerHTML = '<tr><td colspan="6" class="no-data">Error loading data. Check console.</td></tr>';
             });
     }
@@ -250,13 +295,76 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 
     /**
-     * Initializes the application by fetching configuration and then starting the data polling.
+     * Re-renders the table at most once per animation frame, so a burst of
+     * stream events (e.g. a large batch update) costs a single render.
+     */
+    function scheduleRender() {
+        if (renderPending) {
+            return;
+        }
+        renderPending = true;
+        requestAnimationFrame(() => {
+            renderPending = false;
+            updateTable(lastFetchedData);
+        });
+    }
+
+    function startPolling() {
+        if (pollTimer === null) {
+            fetchHealthData();
+            pollTimer = setInterval(fetchHealthData, 30000); // Poll every 30 seconds
+        }
+    }
+
+    function stopPolling() {
+        if (pollTimer !== null) {
+            clearInterval(pollTimer);
+            pollTimer = null;
+        }
+    }
+
+    /**
+     * Applies one event from api/stream. Every event carries a delta in the
+     * same format as api/health?since=..., and its id is the board ETag.
+     */
+    function handleStreamEvent(event) {
+        lastFetchedData = applyHealthDelta(lastFetchedData, JSON.parse(event.data));
+        healthEtag = `"${event.lastEventId}"`;
+        scheduleRender();
+    }
+
+    /**
+     * Subscribes to pushed board changes. While the stream is down the browser
+     * keeps reconnecting on its own (resuming from the last event id) and we
+     * fall back to polling in the meantime.
+     */
+    function connectStream() {
+        const source = new EventSource('api/stream');
+        ['delta', 'reset', 'item', 'item-deleted', 'category', 'category-deleted'].forEach(name => {
+            source.addEventListener(name, handleStreamEvent);
+        });
+        source.onopen = () => {
+            streamOpen = true;
+            stopPolling();
+        };
+        source.onerror = () => {
+            streamOpen = false;
+            startPolling();
+        };
+    }
+
+    /**
+     * Initializes the application by fetching configuration and then subscribing
+     * to board changes, or polling where server-sent events are not supported.
      */
     function initialize() {
         fetchStatusConfig().then(config => {
             statusConfig = config;
-            fetchHealthData(); // Initial fetch
-            setInterval(fetchHealthData, 30000); // Poll every 30 seconds
+            if (window.EventSource) {
+                connectStream();
+            } else {
+                startPolling();
+            }
         });
     }
 
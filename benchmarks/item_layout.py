@@ -0,0 +1,138 @@
+"""
+Compares the memory use and update/serialization throughput of the board's
+compact Item records with the plain dict layout they replaced, and measures
+the memory of each item's uptime rollups.
+
+    python benchmarks/item_layout.py [--items 100000]
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.join(os.path.dirname(__file__), '..'))  # For status_config.json
+from app import app as main_app  # noqa: E402
+
+
+STATUSES = ('passing', 'failing', 'running', 'down', 'unknown')
+
+
+def build_dicts(count):
+    """The previous layout: one 4-key dict per item, last_updated formatted on every write."""
+    return {f'Category {c}': {f'Item {i}': {"status": STATUSES[i % len(STATUSES)],
+                                            "last_updated": datetime.datetime.utcnow().isoformat() + 'Z',
+                                            "message": "", "url": ""}
+                              for i in range(count // 100)}
+            for c in range(100)}
+
+
+def build_items(count):
+    now = time.time()
+    return {sys.intern(f'Category {c}'): {sys.intern(f'Item {i}'): main_app.Item(STATUSES[i % len(STATUSES)], now)
+                                          for i in range(count // 100)}
+            for c in range(100)}
+
+
+def measure_memory(build, count):
+    gc.collect()
+    tracemalloc.start()
+    board = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return board, size
+
+
+def update_dict(item, status):
+    item = dict(item)
+    item['status'] = status
+    item['last_updated'] = datetime.datetime.utcnow().isoformat() + 'Z'
+    return item
+
+
+def update_item(item, status):
+    return item.replace(status=status, updated=time.time())
+
+
+def measure_updates(board, update, rounds):
+    entries = [(items, name) for items in board.values() for name in items]
+    start = time.perf_counter()
+    for n in range(rounds):
+        for items, name in entries:
+            items[name] = update(items[name], STATUSES[n % len(STATUSES)])
+    return rounds * len(entries) / (time.perf_counter() - start)
+
+
+def measure_serialization(board):
+    start = time.perf_counter()
+    json.dumps(board, default=main_app._json_default)
+    return time.perf_counter() - start
+
+
+def measure_kept_memory(board, update):
+    """Bytes the first serialization after an update leaves behind, e.g. the Items' cached dicts."""
+    measure_updates(board, update, 1)
+    gc.collect()
+    tracemalloc.start()
+    json.dumps(board, default=main_app._json_default)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def measure_rollup_memory(count, changes):
+    """Bytes per item of RollupStore after each item changed status `changes` times, a minute apart."""
+    now = time.time()
+    rollups = main_app.RollupStore(clock=lambda: now)
+    data = {'Category': {}}
+    rollups.on_change([main_app.Change(0, 'Category', None, False)], False, data)
+    batch = [main_app.Change(0, 'Category', f'Item {i}', False) for i in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    for n in range(changes + 1):
+        for i in range(count):
+            data['Category'][f'Item {i}'] = {'status': STATUSES[(i + n) % 2]}
+        rollups.on_change(batch, False, data)
+        now += 60
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / count
+
+
+# Rollups of an item that never changed status hold no buckets.
+ROLLUP_BYTES_UNCHANGED = 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.items} items")
+    print(f"{'layout':8} {'memory':>12} {'bytes/item':>11} {'updates/s':>12} {'serialize':>10} {'again':>8} "
+          f"{'kept/item':>10}")
+    for name, build, update in (('dict', build_dicts, update_dict), ('Item', build_items, update_item)):
+        board, size = measure_memory(build, args.items)
+        rate = measure_updates(board, update, args.rounds)
+        # Updated Items build their dict on the first serialization only.
+        first = measure_serialization(board)
+        again = measure_serialization(board)
+        kept = measure_kept_memory(board, update)
+        print(f"{name:8} {size / 1e6:10.1f}MB {size / args.items:11.0f} {rate:12,.0f} "
+              f"{first * 1000:8.0f}ms {again * 1000:6.0f}ms {kept / args.items:10.0f}")
+
+    print(f"\n{'rollups':20} {'bytes/item':>11}")
+    for changes in (0, 1, 10):
+        per_item = measure_rollup_memory(args.items, changes)
+        print(f"{f'{changes} status changes':20} {per_item:11.0f}")
+        if changes == 0:
+            assert per_item < ROLLUP_BYTES_UNCHANGED, f"Rollups use {per_item:.0f} bytes per unchanged item"
+
+
+if __name__ == '__main__':
+    main()
@@ -9,14 +9,15 @@ from health_board_api import HealthBoard
 @click.group()
 @click.option('--verbose', '-v', is_flag=True, help="Enable verbose output.")
 @click.option('--base-url', envvar='HEALTH_BOARD_URL', default='http://127.0.0.1:5000/api', help="Base URL for the Health Dashboard API. Can also be set via HEALTH_BOARD_URL env var.")
-def board(verbose, base_url):
+@click.option('--spool', envvar='HEALTH_BOARD_SPOOL', type=click.Path(dir_okay=False), help="File to keep updates in while the board is unreachable; they are sent with a later update or by 'replay'. Can also be set via HEALTH_BOARD_SPOOL env var.")
+def board(verbose, base_url, spool):
     """A CLI to interact with the Health Dashboard API."""
     # Store flags and resolved base_url in context for other commands to use
     ctx = click.get_current_context()
     ctx.obj = {
         'verbose': verbose,
         'base_url': base_url,
-        'board': HealthBoard(base_url=base_url)
+        'board': HealthBoard(base_url=base_url, spool=spool)
     }
 
 # --- Error Handling Decorator ---
@@ -155,6 +156,21 @@ def update(ctx, category_name, item_name, status, message, url):
     if response: # api_update_item returns None if no parameters were given
         click.echo(json.dumps(response, indent=2))
 
+@board.command()
+@click.pass_context
+@handle_api_exceptions
+def replay(ctx):
+    """Send the updates spooled while the board was unreachable (requires --spool)."""
+    board = ctx.obj['board']
+    if board.spool is None:
+        click.echo(click.style("Error: No spool file given. Use --spool or HEALTH_BOARD_SPOOL.", fg="red"), err=True)
+        return
+    count = len(board.spool.pending())
+    if board.replay_spool():
+        click.echo(f"Sent {count} spooled update(s).")
+    else:
+        click.echo(click.style(f"Board unreachable. {count} update(s) still spooled.", fg="yellow"), err=True)
+
 # Placeholder for save command
 @board.command()
 @click.pass_context
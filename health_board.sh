@@ -188,7 +188,7 @@ api_delete_item() {
 
 # PUT /api/categories/<category_name>/items/<item_name>
 # Usage: api_update_item <category_name> <item_name> [--status <status>] [--message <message>] [--url <item_url>]
-# This function will create the category and item if they don't exist (upsert behavior).
+# Sends ?upsert=1 so the server creates the category and item if they don't exist, in a single request.
 api_update_item() {
     local category_name="$1"
     local item_name="$2"
@@ -199,39 +199,6 @@ api_update_item() {
         return 1
     fi
 
-    # Upsert: Attempt to create category (silently, ignore if exists)
-    local create_cat_url="${BASE_URL}/categories"
-    local create_cat_data="{\"category_name\": \"$category_name\"}"
-    # We don't directly use handle_response here to keep it silent for successful creations or if it already exists.
-    # We only care about actual curl errors or unexpected HTTP codes that aren't "already exists" (400 for category).
-    local create_cat_response=$(curl -s -w "%{http_code}" -X POST -H "Content-Type: application/json" -d "$create_cat_data" "$create_cat_url")
-    local create_cat_http_status=$(echo "$create_cat_response" | tail -n1)
-    if [ $? -ne 0 ]; then
-        echo "Error: curl command failed during category creation for update." >&2
-        return 1
-    elif ! [[ "$create_cat_http_status" -ge 200 && "$create_cat_http_status" -lt 300 || "$create_cat_http_status" -eq 400 ]]; then # 400 if category exists
-        echo "Error: Unexpected HTTP status $create_cat_http_status during category creation for update." >&2
-        echo "$(echo "$create_cat_response" | sed '$d')" >&2
-        return 1
-    fi
-
-    # Upsert: Attempt to create item (silently, ignore if exists)
-    local encoded_category_name_for_item_creation=$(url_encode_bash "$category_name")
-    local create_item_url="${BASE_URL}/categories/${encoded_category_name_for_item_creation}/items"
-    local create_item_data="{\"item_name\": \"$item_name\"}"
-    # Similar to category creation, we want this to be silent on success/already exists.
-    local create_item_response=$(curl -s -w "%{http_code}" -X POST -H "Content-Type: application/json" -d "$create_item_data" "$create_item_url")
-    local create_item_http_status=$(echo "$create_item_response" | tail -n1)
-     if [ $? -ne 0 ]; then
-        echo "Error: curl command failed during item creation for update." >&2
-        return 1
-    # 200 if item already existed, 201 if newly created. 404 if category itself did not exist (should have been created above, but good to check)
-    elif ! [[ "$create_item_http_status" -ge 200 && "$create_item_http_status" -lt 300 ]]; then
-        echo "Error: Unexpected HTTP status $create_item_http_status during item creation for update." >&2
-        echo "$(echo "$create_item_response" | sed '$d')" >&2
-        return 1
-    fi
-
     local status_val=""
     local message_val=""
     local url_val=""
@@ -280,7 +247,7 @@ api_update_item() {
 
     local encoded_category_name=$(url_encode_bash "$category_name")
     local encoded_item_name=$(url_encode_bash "$item_name")
-    local url="${BASE_URL}/categories/${encoded_category_name}/items/${encoded_item_name}"
+    local url="${BASE_URL}/categories/${encoded_category_name}/items/${encoded_item_name}?upsert=1"
 
     verbose_echo "Updating item '$item_name' in category '$category_name' at $url with data: $data"
     response=$(curl -s -w "%{http_code}" -X PUT -H "Content-Type: application/json" -d "$data" "$url")
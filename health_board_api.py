@@ -1,19 +1,213 @@
+import asyncio
+import atexit
+import contextlib
+import gzip
+import itertools
+import json
+import os
+import random
+import ssl
+import threading
+import time
+import urllib.parse
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from typing import Optional, Dict, Any, AsyncIterator, Callable, Iterator, List
+
+try:
+    import fcntl
+except ImportError:  # Windows: spool files are not locked
+    fcntl = None
+
+# Responses worth another attempt: the server is overloaded, restarting or behind a proxy that is.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Only requests that can safely be sent twice are retried; a POST may already have been applied.
+RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of contacting a server that has kept failing, until the breaker's reset timeout passes."""
+
+
+class CircuitBreaker:
+    """
+    Stops requests to a server after `threshold` consecutive failures.
+
+    While open, requests fail at once with CircuitOpenError. After `reset_timeout`
+    seconds a single trial request is let through (half-open): if it succeeds the
+    breaker closes, otherwise it stays open for another `reset_timeout`.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False  # A half-open trial request is in flight
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half-open'."""
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._trial or self.clock() - self._opened_at >= self.reset_timeout:
+                return 'half-open'
+            return 'open'
+
+    def allow(self) -> bool:
+        """Returns True if a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if not self._trial and self.clock() - self._opened_at >= self.reset_timeout:
+                self._trial = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._trial = False
+            if self.threshold and self.failures >= self.threshold:
+                self._opened_at = self.clock()
+
+    def release(self) -> None:
+        """
+        Ends a request let through by allow() whatever its outcome, so that a
+        half-open trial that was interrupted before recording one is not
+        left in flight forever.
+        """
+        with self._lock:
+            self._trial = False
+
+
+def _backoff_delay(attempt: int, backoff: float, max_backoff: float, retry_after: Optional[str] = None) -> float:
+    """Returns a random delay ("full jitter") before the given retry, honouring a Retry-After header in seconds."""
+    delay = random.uniform(0, min(max_backoff, backoff * 2 ** attempt))
+    if retry_after is not None and retry_after.isdigit():
+        delay = max(delay, min(max_backoff, float(retry_after)))
+    return delay
+
+
+def _update_operation(category_name: str, item_name: str, status: Optional[str], message: Optional[str],
+                      url: Optional[str], upsert: bool, ttl: Optional[float]) -> Dict[str, Any]:
+    """Returns the /batch operation for an update_item() call."""
+    operation = {"op": "update", "category": category_name, "item": item_name}
+    if status is not None:
+        operation['status'] = status
+    if message is not None:
+        operation['message'] = message
+    if url is not None:
+        operation['url'] = url
+    if ttl is not None:
+        operation['ttl'] = ttl
+    operation['upsert'] = upsert
+    return operation
+
+
+def _merge_update(pending: Dict[str, Any], later: Dict[str, Any]) -> None:
+    """Merges a later update operation for the same item into a pending one, which then stands for both."""
+    upsert = pending['upsert'] or later['upsert']
+    pending.update(later)
+    pending['upsert'] = upsert
+
+
+def _is_unavailable(error: requests.exceptions.RequestException) -> bool:
+    """True for errors that mean the board could not take a request, rather than that it refused it."""
+    if isinstance(error, requests.exceptions.HTTPError):
+        status_code = error.response.status_code if error.response is not None else 0
+        return status_code >= 500 or status_code in RETRY_STATUSES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def _rejected_indexes(error: Exception, count: int) -> List[int]:
+    """
+    Returns the indexes of the operations a refused batch request was rejected
+    for, as listed by the server, or all of them if it did not say.
+    """
+    try:
+        indexes = sorted({entry['index'] for entry in error.response.json()['errors']})
+    except (AttributeError, TypeError, ValueError, KeyError):
+        indexes = []
+    if not indexes or not all(isinstance(index, int) and 0 <= index < count for index in indexes):
+        return list(range(count))
+    return indexes
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """An HTTPAdapter that applies a default (connect, read) timeout to every request."""
+
+    def __init__(self, timeout, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
 
 class HealthBoard:
     """
     A Python client for the Health Board API.
     """
 
-    def __init__(self, base_url: str = "http://127.0.0.1:5000/api"):
+    def __init__(self, base_url: str = "http://127.0.0.1:5000/api", pool_size: int = 10,
+                 connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 retries: int = 3, backoff: float = 0.5, max_backoff: float = 10.0,
+                 breaker_threshold: int = 5, breaker_reset_timeout: float = 30.0,
+                 spool: Optional[str] = None, spool_max_bytes: int = 1 << 20):
         """
         Initializes the HealthBoard API client.
 
+        Requests share one keep-alive session. Connection errors, timeouts and
+        429/502/503/504 responses are retried for GET, PUT and DELETE requests,
+        waiting a random time of up to backoff * 2**attempt seconds (at most
+        max_backoff) between attempts. After breaker_threshold failed requests
+        in a row, the client stops contacting the server for
+        breaker_reset_timeout seconds and raises CircuitOpenError instead.
+
+        With a spool, update_item() does not raise when the board is unreachable
+        but keeps the update in the spool file, and sends the spooled updates
+        along with a later one once the board is back.
+
         Args:
             base_url: The base URL of the Health Board API.
+            pool_size: The most connections kept open to the server.
+            connect_timeout: Seconds to wait for a connection.
+            read_timeout: Seconds to wait for the server to respond.
+            retries: Extra attempts for a failed request; 0 disables retries.
+            backoff: The base delay in seconds between retries.
+            max_backoff: The longest delay in seconds between retries.
+            breaker_threshold: Consecutive failures that open the circuit breaker; 0 disables it.
+            breaker_reset_timeout: Seconds before an open breaker lets a trial request through.
+            spool: The path of a file to keep updates in while the board is unreachable (see UpdateSpool).
+            spool_max_bytes: The most bytes the spool file may hold.
         """
         self.base_url = base_url
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_reset_timeout)
+        self.spool = UpdateSpool(spool, spool_max_bytes) if spool else None
+        self._spool_failures = 0  # Consecutive failed replays
+        self._spool_retry_at = 0.0
+        self.session = requests.Session()
+        adapter = _TimeoutAdapter((connect_timeout, read_timeout), pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Last /health response and its ETag, used for conditional polling.
+        self._health_etag: Optional[str] = None
+        self._health_data: Dict[str, Any] = {}
+        self._health_fields: Optional[List[str]] = None
 
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """
@@ -29,24 +223,169 @@ class HealthBoard:
 
         Raises:
             requests.exceptions.RequestException: For connection errors or timeouts.
+            CircuitOpenError: If the server has kept failing and is not contacted.
         """
         url = f"{self.base_url}/{endpoint}"
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"Not contacting {self.base_url} after {self.breaker.failures} failed requests")
+        retries = self.retries if method.upper() in RETRY_METHODS else 0
+        attempt = 0
         try:
-            response = requests.request(method, url, **kwargs)
-            response.raise_for_status()  # Raise an exception for bad status codes
-            return response
-        except requests.exceptions.RequestException as e:
-            # Re-raise the exception to be handled by the caller
-            raise e
-
-    def get_health(self) -> Dict[str, Any]:
-        """Fetches the overall health status."""
-        response = self._request('GET', 'health')
+            while True:
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    if attempt >= retries:
+                        self.breaker.record_failure()
+                        raise
+                    delay = self._backoff_delay(attempt)
+                except requests.exceptions.RequestException:
+                    # E.g. the server died in the middle of the response.
+                    self.breaker.record_failure()
+                    raise
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                        if response.status_code >= 500 or response.status_code in RETRY_STATUSES:
+                            self.breaker.record_failure()
+                        else:
+                            self.breaker.record_success()
+                        response.raise_for_status()  # Raise an exception for bad status codes
+                        return response
+                    delay = self._backoff_delay(attempt, response.headers.get('Retry-After'))
+                time.sleep(delay)
+                attempt += 1
+        finally:
+            # Interrupted, e.g. cancelled, without recording a success or a failure.
+            self.breaker.release()
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        return _backoff_delay(attempt, self.backoff, self.max_backoff, retry_after)
+
+    def close(self) -> None:
+        """Closes the pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_health(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Fetches the overall health status.
+
+        After the first call, polls with ?since=<ETag> and If-None-Match, so an
+        unchanged board costs a bodyless 304 and a changed one only the delta,
+        which is merged into the last result. Returned dicts are shared with
+        later calls; treat them as read-only.
+
+        Args:
+            fields: If given, each item only carries these keys, e.g. ['status', 'last_updated'].
+        """
+        params = {}
+        if fields is not None:
+            params['fields'] = ','.join(fields)
+        if self._health_etag is None or self._health_fields != fields:
+            # A first call, or other fields than the copy we hold: fetch in full.
+            self._health_fields = fields
+            if params:
+                response = self._request('GET', 'health', params=params)
+            else:
+                response = self._request('GET', 'health')
+        else:
+            response = self._request('GET', 'health', params=dict(params, since=self._health_etag),
+                                     headers={'If-None-Match': self._health_etag})
+            if response.status_code == 304:
+                return self._health_data
+            self._health_data = self._apply_health_delta(self._health_data, response.json())
+            self._health_etag = response.headers.get('ETag')
+            return self._health_data
+        self._health_etag = response.headers.get('ETag')
+        self._health_data = response.json()
+        return self._health_data
+
+    @staticmethod
+    def _apply_health_delta(data: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns a copy of data with a /health?since= delta applied to it."""
+        if delta.get('full'):
+            return delta['data']
+        merged = dict(data)
+        # Tombstones first: a category or item may have been deleted and re-created.
+        for category_name in delta.get('deleted_categories', []):
+            merged.pop(category_name, None)
+        for category_name, item_names in delta.get('deleted_items', {}).items():
+            if category_name in merged:
+                removed = set(item_names)
+                merged[category_name] = {name: item for name, item in merged[category_name].items()
+                                         if name not in removed}
+        for category_name, items in delta.get('data', {}).items():
+            category = dict(merged.get(category_name, {}))
+            category.update(items)
+            merged[category_name] = category
+        return merged
+
+    def list_items(self, sort: str = 'category', descending: bool = False, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetches one page of items, sorted on the server.
+
+        Args:
+            sort: 'category', 'status' (by severity) or 'last_updated'.
+            descending: If True, the order is reversed.
+            limit: The most items to return (up to 1000).
+            cursor: The 'next_cursor' of the previous page, or None for the first page.
+
+        Returns:
+            A dict with the page's 'items' (each with its 'category' and 'item' name)
+            and the 'next_cursor', which is None on the last page.
+        """
+        params = {'sort': sort, 'order': 'desc' if descending else 'asc', 'limit': limit}
+        if cursor is not None:
+            params['cursor'] = cursor
+        response = self._request('GET', 'items', params=params)
+        return response.json()
+
+    def iter_items(self, sort: str = 'category', descending: bool = False, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Yields every item in the given order, fetching one page at a time.
+        """
+        cursor = None
+        while True:
+            page = self.list_items(sort, descending, page_size, cursor)
+            yield from page['items']
+            cursor = page['next_cursor']
+            if cursor is None:
+                return
+
+    def get_stale(self, older_than: float) -> List[Dict[str, Any]]:
+        """
+        Lists the items not updated for more than older_than seconds, oldest first.
+
+        Returns:
+            The items, each with its 'category' and 'item' name.
+        """
+        response = self._request('GET', 'stale', params={'older_than': older_than})
+        return response.json()['items']
+
+    def checkpoint(self, wait: bool = True) -> Dict[str, Any]:
+        """
+        Saves the current board state.
+
+        Args:
+            wait: If False, return as soon as the server has started the checkpoint.
+
+        Returns:
+            The JSON response from the API.
+        """
+        if wait:
+            response = self._request('POST', 'checkpoint')
+        else:
+            response = self._request('POST', 'checkpoint', params={'wait': 0})
         return response.json()
 
-    def checkpoint(self) -> Dict[str, Any]:
-        """Saves the current board state."""
-        response = self._request('POST', 'checkpoint')
+    def checkpoint_status(self) -> Dict[str, Any]:
+        """Fetches the outcome, duration and size of the last checkpoint."""
+        response = self._request('GET', 'checkpoint')
         return response.json()
 
     def restore(self) -> Dict[str, Any]:
@@ -92,7 +431,7 @@ class HealthBoard:
         endpoint = f'categories/{category_name}/items/{item_name}'
         return self._request('DELETE', endpoint)
 
-    def update_item(self, category_name: str, item_name: str, status: Optional[str] = None, message: Optional[str] = None, url: Optional[str] = None, upsert: bool = True) -> Dict[str, Any]:
+    def update_item(self, category_name: str, item_name: str, status: Optional[str] = None, message: Optional[str] = None, url: Optional[str] = None, upsert: bool = True, ttl: Optional[float] = None) -> Dict[str, Any]:
         """
         Updates an item's status, message, or URL.
 
@@ -103,10 +442,54 @@ class HealthBoard:
             message: The new message for the item.
             url: The new URL for the item.
             upsert: If True, the category and item will be created if they do not exist.
+            ttl: Seconds after which the server flips the item to 'unknown' unless it is
+                updated again; 0 clears it.
 
         Returns:
-            The JSON response from the API.
+            The JSON response from the API. With a spool, a message instead if the
+            update was spooled or sent together with spooled updates.
+        """
+        if self.spool is None:
+            return self._send_update(category_name, item_name, status, message, url, upsert, ttl)
+
+        if not self.spool.pending_bytes():
+            try:
+                return self._send_update(category_name, item_name, status, message, url, upsert, ttl)
+            except requests.exceptions.RequestException as e:
+                if not _is_unavailable(e):
+                    raise
+                self._spool_failed()
+        # Spooled updates go first, or replaying them would undo this one.
+        if not self.spool.append(_update_operation(category_name, item_name, status, message, url, upsert, ttl)):
+            return {"message": "Spool is full. Update dropped."}
+        if self.replay_spool():
+            return {"message": "Update sent with the spooled updates."}
+        return {"message": "Board unreachable. Update spooled."}
+
+    def replay_spool(self) -> bool:
         """
+        Sends the spooled updates, the latest one per item, unless a recent attempt
+        failed. Failed attempts are retried after a random backoff, so reporters
+        do not all retry at once when the board comes back.
+
+        Returns:
+            True if no updates are left in the spool.
+        """
+        if self.spool is None:
+            return True
+        if time.monotonic() < self._spool_retry_at:
+            return False
+        if self.spool.replay(self):
+            self._spool_failures = 0
+            return True
+        self._spool_failed()
+        return False
+
+    def _spool_failed(self) -> None:
+        self._spool_failures += 1
+        self._spool_retry_at = time.monotonic() + _backoff_delay(self._spool_failures, self.backoff, self.max_backoff)
+
+    def _send_update(self, category_name: str, item_name: str, status: Optional[str], message: Optional[str], url: Optional[str], upsert: bool, ttl: Optional[float]) -> Dict[str, Any]:
         payload = {}
         if status is not None:
             payload['status'] = status
@@ -114,6 +497,8 @@ class HealthBoard:
             payload['message'] = message
         if url is not None:
             payload['url'] = url
+        if ttl is not None:
+            payload['ttl'] = ttl
 
         if not payload:
             # If no update parameters are provided, but upsert is True,
@@ -128,12 +513,17 @@ class HealthBoard:
             return {"message": "No update parameters provided. Item state unchanged."}
 
         endpoint = f'categories/{category_name}/items/{item_name}'
-        try:
+        if not upsert:
             response = self._request('PUT', endpoint, json=payload)
             return response.json()
+
+        try:
+            # The server creates the category and item if needed, so this is one round trip.
+            response = self._request('PUT', endpoint, json=payload, params={'upsert': 1})
+            return response.json()
         except requests.exceptions.HTTPError as e:
-            # If the item or category doesn't exist (404), create it and retry.
-            if upsert and e.response.status_code == 404:
+            # Servers without upsert support answer 404 for a missing item: create it and retry.
+            if e.response.status_code == 404:
                 try:
                     self.create_item(category_name, item_name, upsert=True)
                 except requests.exceptions.HTTPError as ce:
@@ -144,13 +534,356 @@ class HealthBoard:
                 return response.json()
             raise
 
+    def batch(self, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Applies many create, update and delete operations in a single request.
+
+        Each operation is a dict with an 'op' of 'create', 'update' or 'delete',
+        a 'category' and, for item operations, an 'item'. Update operations may
+        also carry 'status', 'message' and 'url'. For example:
+
+            [{"op": "create", "category": "Builds", "item": "Main"},
+             {"op": "update", "category": "Builds", "item": "Main", "status": "passing"}]
+
+        Args:
+            operations: The operations to apply, in order.
+
+        Returns:
+            The JSON response from the API, with one entry in 'results' per operation.
+        """
+        response = self._request('POST', 'batch', json={"operations": operations})
+        return response.json()
+
+
+class UpdateSpool:
+    """
+    An append-only file of item updates that could not be sent, to replay once the board is back.
+
+    Each line is a /batch update operation. Replaying sends only the latest state
+    of each item, REPLAY_BATCH_SIZE items per request. The file is capped at
+    max_bytes: when an update does not fit, the file is compacted to one line per
+    item, and if it still does not fit the update is dropped and counted in `dropped`.
+
+    Processes may share a spool file: on systems with fcntl they lock it while
+    appending or replaying.
+    """
+
+    REPLAY_BATCH_SIZE = 1000
+
+    def __init__(self, path: str, max_bytes: int = 1 << 20):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.sent = 0  # Spooled updates the server applied
+        self.dropped = 0  # Updates that did not fit, or that the server rejected on replay
+        self._lock = threading.Lock()
+
+    def pending_bytes(self) -> int:
+        """The size of the spool file; 0 if nothing is spooled."""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """The operations a replay would send, oldest item first."""
+        with self._locked():
+            return self._compact(self._read())
+
+    def append(self, operation: Dict[str, Any]) -> bool:
+        """
+        Adds an update operation to the spool and syncs it to disk.
+
+        Returns:
+            False if the update was dropped because the spool is full.
+        """
+        line = self._encode(operation)
+        with self._locked():
+            if self.pending_bytes() + len(line) > self.max_bytes:
+                data = b''.join(self._encode(op) for op in self._compact(self._read()))
+                if len(data) + len(line) > self.max_bytes:
+                    self.dropped += 1
+                    return False
+                self._rewrite(data)
+            with open(self.path, 'ab') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        return True
+
+    def replay(self, board: 'HealthBoard') -> bool:
+        """
+        Sends the spooled updates with board.batch() and removes those that were sent.
+
+        If the board refuses a batch, the updates it names as invalid are dropped
+        and the rest sent again.
+
+        Returns:
+            True if the spool is now empty, False if the board could not be reached.
+        """
+        with self._locked():
+            operations = self._compact(self._read())
+            while operations:
+                chunk = operations[:self.REPLAY_BATCH_SIZE]
+                try:
+                    results = board.batch(chunk)['results']
+                except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+                    if _is_unavailable(e):
+                        self._rewrite(b''.join(self._encode(op) for op in operations))
+                        return False
+                    rejected = set(_rejected_indexes(e, len(chunk)))
+                    self.dropped += len(rejected)
+                    operations = [op for index, op in enumerate(chunk) if index not in rejected] + operations[len(chunk):]
+                    continue
+                operations = operations[len(chunk):]
+                applied = sum(1 for result in results if result['status_code'] < 400)
+                self.sent += applied
+                self.dropped += len(chunk) - applied
+            self._rewrite(b'')
+        return True
+
+    @staticmethod
+    def _encode(operation: Dict[str, Any]) -> bytes:
+        return (json.dumps(operation, separators=(',', ':')) + '\n').encode('utf-8')
+
+    def _read(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        operations = []
+        for line in data.splitlines():
+            try:
+                operation = json.loads(line)
+            except ValueError:
+                continue  # A line torn by a crash while it was written
+            if isinstance(operation, dict) and 'category' in operation and 'item' in operation:
+                operations.append(operation)
+        return operations
+
+    @staticmethod
+    def _compact(operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        latest: Dict[Any, Dict[str, Any]] = {}
+        for operation in operations:
+            operation.setdefault('upsert', False)
+            key = (operation['category'], operation['item'])
+            if key in latest:
+                _merge_update(latest[key], operation)
+            else:
+                latest[key] = operation
+        return list(latest.values())
+
+    def _rewrite(self, data: bytes) -> None:
+        """Replaces the spool file's contents, atomically."""
+        if not data:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            return
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            # A separate lock file, as _rewrite() replaces the spool file.
+            with open(self.path + '.lock', 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class BufferedUpdater:
+    """
+    Queues item updates in memory and sends them to the board from a background thread.
+
+    update_item() returns at once. Pending updates are sent with one batch request
+    when batch_size distinct items are waiting, or flush_interval seconds after the
+    first of them was queued. Updates to an item that is still waiting are merged
+    into its pending update, so only the latest state of each item is sent.
+
+    If the board is unavailable, a batch's updates are queued again (newer updates
+    win) and sending is retried with backoff. If it refuses the batch, the updates
+    it names as invalid are dropped and the rest sent again. Updates are dropped,
+    and counted in `dropped`, when max_pending items are already waiting, when the
+    server rejects them, or when they are still unsent at close().
+    """
+
+    def __init__(self, board: HealthBoard, batch_size: int = 100, flush_interval: float = 1.0, max_pending: int = 10000,
+                 on_result: Optional[Callable[[Dict[str, Any], Optional[Dict[str, Any]]], None]] = None):
+        """
+        Args:
+            board: The client to send the batches with.
+            batch_size: The most updates per batch request.
+            flush_interval: The most seconds an update waits before it is sent.
+            max_pending: The most items with a pending update.
+            on_result: Called with each queued operation once it is done with, and the
+                body the server returned for it if it was applied, or None if it was dropped.
+        """
+        self.board = board
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.on_result = on_result
+        self.sent = 0  # Updates the server applied
+        self.superseded = 0  # Updates merged into a pending one for the same item
+        self.dropped = 0  # Updates that were not applied
+        self.errors = 0  # Failed batch requests
+        self.last_error: Optional[str] = None
+        self._pending: Dict[Any, Dict[str, Any]] = {}  # (category, item) -> batch operation, oldest first
+        self._due = 0.0  # When the oldest pending update must be sent
+        self._retry_at = 0.0
+        self._failures = 0  # Consecutive failed batch requests
+        self._closed = False
+        self._condition = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='health-board-updater', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def update_item(self, category_name: str, item_name: str, status: Optional[str] = None, message: Optional[str] = None, url: Optional[str] = None, upsert: bool = True, ttl: Optional[float] = None) -> bool:
+        """
+        Queues an update to an item, with the same arguments as HealthBoard.update_item.
+
+        Returns:
+            False if the update was dropped because too many items are waiting.
+        """
+        operation = _update_operation(category_name, item_name, status, message, url, upsert, ttl)
+        key = (category_name, item_name)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BufferedUpdater is closed")
+            pending = self._pending.get(key)
+            if pending is not None:
+                _merge_update(pending, operation)
+                self.superseded += 1
+                return True
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return False
+            if not self._pending:
+                self._due = time.monotonic() + self.flush_interval
+                self._condition.notify()
+            self._pending[key] = operation
+            if len(self._pending) == self.batch_size:
+                self._condition.notify()
+        return True
+
+    def flush(self) -> bool:
+        """
+        Sends every pending update now, in the calling thread.
+
+        Returns:
+            True if nothing is left to send, False if a batch could not be sent.
+        """
+        with self._send_lock:
+            while True:
+                with self._condition:
+                    if not self._pending:
+                        return True
+                    keys = list(itertools.islice(self._pending, self.batch_size))
+                    operations = [self._pending.pop(key) for key in keys]
+                    self._due = time.monotonic() + self.flush_interval
+                try:
+                    results = self.board.batch(operations)['results']
+                except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+                    with self._condition:
+                        self.errors += 1
+                        self.last_error = str(e)
+                        if _is_unavailable(e):
+                            self._requeue(operations)
+                            self._failures += 1
+                            self._retry_at = time.monotonic() + _backoff_delay(self._failures, self.flush_interval, 60.0)
+                            return False
+                        # Refused: drop the operations it named and send the rest again.
+                        rejected = set(_rejected_indexes(e, len(operations)))
+                        self.dropped += len(rejected)
+                        self._requeue([operation for index, operation in enumerate(operations) if index not in rejected])
+                    self._report([(operations[index], None) for index in sorted(rejected)])
+                    continue
+                applied = sum(1 for result in results if result['status_code'] < 400)
+                with self._condition:
+                    self.sent += applied
+                    self.dropped += len(operations) - applied
+                    self._failures = 0
+                self._report([(operation, result.get('body') if result['status_code'] < 400 else None)
+                              for operation, result in zip(operations, results)])
+
+    def _report(self, outcomes: List[Any]) -> None:
+        """Passes (operation, body or None) pairs to on_result."""
+        if self.on_result is not None:
+            for operation, body in outcomes:
+                self.on_result(operation, body)
+
+    def _requeue(self, operations: List[Dict[str, Any]]) -> None:
+        """Queues unsent operations again, merging in updates queued for the same items since."""
+        for operation in operations:
+            key = (operation['category'], operation['item'])
+            newer = self._pending.pop(key, None)
+            if newer is not None:
+                _merge_update(operation, newer)
+            self._pending[key] = operation
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts of pending, sent, superseded and dropped updates."""
+        with self._condition:
+            return {"pending": len(self._pending), "sent": self.sent, "superseded": self.superseded,
+                    "dropped": self.dropped, "errors": self.errors, "last_error": self.last_error}
+
+    def close(self) -> None:
+        """Stops the background thread and makes a last attempt to send pending updates."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        atexit.unregister(self.close)
+        self._thread.join()
+        self.flush()
+        with self._condition:
+            dropped = list(self._pending.values())
+            self.dropped += len(dropped)
+            self._pending.clear()
+        self._report([(operation, None) for operation in dropped])
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    if now < self._retry_at:
+                        self._condition.wait(self._retry_at - now)
+                    elif len(self._pending) >= self.batch_size or (self._pending and now >= self._due):
+                        break
+                    else:
+                        self._condition.wait(self._due - now if self._pending else None)
+                if self._closed:
+                    return
+            self.flush()
+
 
 class HealthBoardUpdater(HealthBoard):
     """
     A specialized HealthBoard client for updating a single item.
+
+    The updater remembers the state the server last acknowledged and skips
+    updates that would not change it, except to refresh the item's
+    last_updated once every keepalive seconds.
     """
 
-    def __init__(self, base_url: str, category: str, item: str):
+    def __init__(self, base_url: str, category: str, item: str, buffered: bool = False,
+                 flush_interval: float = 1.0, max_pending: int = 10000,
+                 suppress_unchanged: bool = True, keepalive: float = 60.0, **kwargs):
         """
         Initializes the HealthBoardUpdater.
 
@@ -158,12 +891,28 @@ class HealthBoardUpdater(HealthBoard):
             base_url: The base URL of the Health Board API.
             category: The name of the category.
             item: The name of the item.
+            buffered: If True, update_item() only queues the update, and a background
+                thread sends the latest one (see BufferedUpdater).
+            flush_interval: With buffered, the most seconds an update waits before it is sent.
+            max_pending: With buffered, the most items with a pending update.
+            suppress_unchanged: If True, updates that change nothing are not sent.
+            keepalive: The most seconds between two updates that are sent, so that the
+                item does not look stale. With a ttl, at most half the ttl is used.
+            **kwargs: Connection settings passed on to HealthBoard, e.g. read_timeout.
         """
-        super().__init__(base_url)
+        super().__init__(base_url, **kwargs)
         self.category = category
         self.item = item
+        self.buffer = (BufferedUpdater(self, flush_interval=flush_interval, max_pending=max_pending, on_result=self._on_result)
+                       if buffered else None)
+        self.suppress_unchanged = suppress_unchanged
+        self.keepalive = keepalive
+        self.suppressed = 0  # Updates that were not sent because they changed nothing
+        self.clock = time.monotonic
+        self._acked: Optional[Dict[str, Any]] = None  # The item as the server last returned it, or as last queued
+        self._acked_at = 0.0
 
-    def update_item(self, status: Optional[str] = None, message: Optional[str] = None, url: Optional[str] = None, upsert: bool = True) -> Dict[str, Any]:
+    def update_item(self, status: Optional[str] = None, message: Optional[str] = None, url: Optional[str] = None, upsert: bool = True, ttl: Optional[float] = None) -> Dict[str, Any]:
         """
         Updates the item's status, message, or URL.
 
@@ -172,11 +921,479 @@ class HealthBoardUpdater(HealthBoard):
             message: The new message for the item.
             url: The new URL for the item.
             upsert: If True, the category and item will be created if they do not exist.
+            ttl: Seconds after which the server flips the item to 'unknown' unless it is
+                updated again; 0 clears it.
 
         Returns:
             The JSON response from the API.
         """
-        return super().update_item(self.category, self.item, status, message, url, upsert)
+        fields = {name: value for name, value in (('status', status), ('message', message), ('url', url), ('ttl', ttl))
+                  if value is not None}
+        now = self.clock()
+        if self._is_unchanged(fields, now):
+            self.suppressed += 1
+            return {"message": "Item unchanged. Update skipped."}
+
+        if self.buffer is not None:
+            if not self.buffer.update_item(self.category, self.item, status, message, url, upsert, ttl):
+                return {"message": "Too many pending updates. Update dropped."}
+            # Queued updates are retried until close(), so compare later ones with what was queued.
+            self._acknowledge(fields, now)
+            return {"message": "Update queued."}
+        response = super().update_item(self.category, self.item, status, message, url, upsert, ttl)
+        # Only what the server says it applied: it may hold back a status change,
+        # and a spooled or coalesced update is not applied yet.
+        self._acknowledge_applied(response, now)
+        return response
+
+    def _is_unchanged(self, fields: Dict[str, Any], now: float) -> bool:
+        if not self.suppress_unchanged or self._acked is None:
+            return False
+        if any(self._acked.get(name) != value for name, value in fields.items()):
+            return False
+        keepalive = self.keepalive
+        if self._acked.get('ttl'):
+            keepalive = min(keepalive, self._acked['ttl'] / 2)
+        return now - self._acked_at < keepalive
+
+    def _acknowledge(self, fields: Dict[str, Any], now: float) -> None:
+        self._acked = dict(self._acked or {}, **fields)
+        self._acked_at = now
+
+    def _acknowledge_applied(self, body: Any, now: float) -> None:
+        """Remembers the item from an update response body, if it has one; forgets it otherwise."""
+        item = body.get(self.item) if isinstance(body, dict) else None
+        if not isinstance(item, dict):
+            self._acked = None
+            return
+        self._acked = {name: item.get(name) for name in ('status', 'message', 'url')}
+        self._acked['ttl'] = item.get('ttl') or 0  # The server stores a ttl of 0 as none
+        self._acked_at = now
+
+    def _on_result(self, operation: Dict[str, Any], body: Optional[Dict[str, Any]]) -> None:
+        """Called by the buffer once a queued update was applied or dropped."""
+        if (operation['category'], operation['item']) == (self.category, self.item):
+            self._acknowledge_applied(body, self.clock())
+
+    def flush(self) -> bool:
+        """With buffered, sends the pending update now; returns False if it could not be sent."""
+        return self.buffer.flush() if self.buffer is not None else True
+
+    def close(self) -> None:
+        """Sends any pending update and closes the pooled connections."""
+        if self.buffer is not None:
+            self.buffer.close()
+        super().close()
+
+
+class AsyncResponse:
+    """The parts of a requests.Response that the clients use, for AsyncHealthBoard."""
+
+    def __init__(self, url: str, status_code: int, reason: str, headers: CaseInsensitiveDict, content: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        """Raises requests.exceptions.HTTPError for a 4xx or 5xx status, as requests does."""
+        if 400 <= self.status_code < 600:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise requests.exceptions.HTTPError(f"{self.status_code} {kind} Error: {self.reason} for url: {self.url}",
+                                                response=self)
+
+
+class _AsyncConnectionPool:
+    """
+    Keep-alive HTTP/1.1 connections to one server, used by at most `size` requests at a time.
+
+    Further requests wait for a connection to become free, so a burst of thousands
+    of reports neither opens thousands of sockets nor overloads the server.
+    """
+
+    def __init__(self, base_url: str, size: int, connect_timeout: float, read_timeout: float):
+        parts = urllib.parse.urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.netloc = parts.netloc
+        self.size = size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.opened = 0  # Connections opened so far
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: List[Any] = []  # (reader, writer) pairs
+
+    async def request(self, method: str, url: str, headers: Dict[str, str], body: Optional[bytes]) -> AsyncResponse:
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self.netloc}", "Accept-Encoding: gzip"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        message = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b'')
+
+        async with self._semaphore:
+            while True:
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await self._connect()
+                try:
+                    writer.write(message)
+                    await writer.drain()
+                    response, keep_alive = await asyncio.wait_for(self._read_response(reader, method, url),
+                                                                  self.read_timeout)
+                except _ConnectionDropped:
+                    writer.close()
+                    if reused:
+                        continue  # The server closed an idle connection: retry on a new one
+                    raise requests.exceptions.ConnectionError(f"Connection to {self.netloc} closed without a response")
+                except asyncio.TimeoutError:
+                    writer.close()
+                    raise requests.exceptions.ReadTimeout(f"No response from {self.netloc} within {self.read_timeout}s")
+                except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+                    writer.close()
+                    if reused and isinstance(e, (BrokenPipeError, ConnectionResetError)):
+                        continue
+                    raise requests.exceptions.ConnectionError(str(e) or repr(e))
+                except asyncio.CancelledError:
+                    writer.close()  # A response may be left half read
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return response
+
+    async def _connect(self):
+        ssl_context = ssl.create_default_context() if self.scheme == 'https' else None
+        try:
+            connection = await asyncio.wait_for(asyncio.open_connection(self.host, self.port, ssl=ssl_context),
+                                                self.connect_timeout)
+        except asyncio.TimeoutError:
+            raise requests.exceptions.ConnectTimeout(f"Could not connect to {self.netloc} within {self.connect_timeout}s")
+        except OSError as e:
+            raise requests.exceptions.ConnectionError(f"Could not connect to {self.netloc}: {e}")
+        self.opened += 1
+        return connection
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader, method: str, url: str):
+        """Reads one response; returns it and whether the connection can be reused."""
+        try:
+            status_line = await reader.readline()
+        except ConnectionResetError:
+            raise _ConnectionDropped()
+        if not status_line:
+            raise _ConnectionDropped()
+        version, status, *reason = status_line.decode('latin-1').split(' ', 2)
+        status_code = int(status)
+        headers = CaseInsensitiveDict()
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name, value = name.strip(), value.strip()
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+
+        keep_alive = version == 'HTTP/1.1' and 'close' not in headers.get('Connection', '').lower()
+        if method == 'HEAD' or status_code in (204, 304) or status_code < 200:
+            content = b''
+        elif 'chunked' in headers.get('Transfer-Encoding', '').lower():
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass  # Trailers
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            content = b''.join(chunks)
+        elif 'Content-Length' in headers:
+            content = await reader.readexactly(int(headers['Content-Length']))
+        else:
+            content = await reader.read()
+            keep_alive = False
+        if headers.get('Content-Encoding', '').lower() == 'gzip':
+            content = gzip.decompress(content)
+        return AsyncResponse(url, status_code, reason[0].strip() if reason else '', headers, content), keep_alive
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+class _ConnectionDropped(Exception):
+    """The server closed the connection before sending a response."""
+
+
+class AsyncHealthBoard:
+    """
+    An asyncio client for the Health Board API, with the same methods as HealthBoard.
+
+    At most pool_size requests are in flight at a time; the others wait for a free
+    connection. Retries, backoff and the circuit breaker work as in HealthBoard.
+    """
+
+    def __init__(self, base_url: str = "http://127.0.0.1:5000/api", pool_size: int = 10,
+                 connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 retries: int = 3, backoff: float = 0.5, max_backoff: float = 10.0,
+                 breaker_threshold: int = 5, breaker_reset_timeout: float = 30.0):
+        """
+        Initializes the AsyncHealthBoard API client.
+
+        Args:
+            base_url: The base URL of the Health Board API.
+            pool_size: The most connections, and concurrent requests, to the server.
+            connect_timeout: Seconds to wait for a connection.
+            read_timeout: Seconds to wait for the server to respond.
+            retries: Extra attempts for a failed request; 0 disables retries.
+            backoff: The base delay in seconds between retries.
+            max_backoff: The longest delay in seconds between retries.
+            breaker_threshold: Consecutive failures that open the circuit breaker; 0 disables it.
+            breaker_reset_timeout: Seconds before an open breaker lets a trial request through.
+        """
+        self.base_url = base_url
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_reset_timeout)
+        self.pool = _AsyncConnectionPool(base_url, pool_size, connect_timeout, read_timeout)
+        self._health_etag: Optional[str] = None
+        self._health_data: Dict[str, Any] = {}
+        self._health_fields: Optional[List[str]] = None
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> AsyncResponse:
+        """
+        A helper method to make requests to the API.
+
+        Args:
+            method: The HTTP method to use (e.g., 'GET', 'POST').
+            endpoint: The API endpoint to target.
+            **kwargs: 'params', 'json' and 'headers', as for requests.
+
+        Raises:
+            requests.exceptions.RequestException: For connection errors, timeouts and bad status codes.
+            CircuitOpenError: If the server has kept failing and is not contacted.
+        """
+        # Let requests encode the URL, query and body, so both clients send the same requests.
+        prepared = requests.Request(method, f"{self.base_url}/{endpoint}", **kwargs).prepare()
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"Not contacting {self.base_url} after {self.breaker.failures} failed requests")
+        retries = self.retries if method.upper() in RETRY_METHODS else 0
+        attempt = 0
+        try:
+            while True:
+                try:
+                    response = await self.pool.request(prepared.method, prepared.url, prepared.headers, prepared.body)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    if attempt >= retries:
+                        self.breaker.record_failure()
+                        raise
+                    delay = _backoff_delay(attempt, self.backoff, self.max_backoff)
+                except requests.exceptions.RequestException:
+                    # E.g. the server died in the middle of the response.
+                    self.breaker.record_failure()
+                    raise
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                        if response.status_code >= 500 or response.status_code in RETRY_STATUSES:
+                            self.breaker.record_failure()
+                        else:
+                            self.breaker.record_success()
+                        response.raise_for_status()
+                        return response
+                    delay = _backoff_delay(attempt, self.backoff, self.max_backoff, response.headers.get('Retry-After'))
+                await asyncio.sleep(delay)
+                attempt += 1
+        finally:
+            # Interrupted, e.g. cancelled, without recording a success or a failure.
+            self.breaker.release()
+
+    async def close(self) -> None:
+        """Closes the pooled connections."""
+        await self.pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get_health(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Fetches the overall health status, polling for changes only after the first
+        call as HealthBoard.get_health does.
+        """
+        params = {}
+        if fields is not None:
+            params['fields'] = ','.join(fields)
+        if self._health_etag is None or self._health_fields != fields:
+            self._health_fields = fields
+            response = await self._request('GET', 'health', params=params)
+        else:
+            response = await self._request('GET', 'health', params=dict(params, since=self._health_etag),
+                                           headers={'If-None-Match': self._health_etag})
+            if response.status_code == 304:
+                return self._health_data
+            self._health_data = HealthBoard._apply_health_delta(self._health_data, response.json())
+            self._health_etag = response.headers.get('ETag')
+            return self._health_data
+        self._health_etag = response.headers.get('ETag')
+        self._health_data = response.json()
+        return self._health_data
+
+    async def list_items(self, sort: str = 'category', descending: bool = False, limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Fetches one page of items, sorted on the server (see HealthBoard.list_items)."""
+        params = {'sort': sort, 'order': 'desc' if descending else 'asc', 'limit': limit}
+        if cursor is not None:
+            params['cursor'] = cursor
+        response = await self._request('GET', 'items', params=params)
+        return response.json()
+
+    async def iter_items(self, sort: str = 'category', descending: bool = False, page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """Yields every item in the given order, fetching one page at a time."""
+        cursor = None
+        while True:
+            page = await self.list_items(sort, descending, page_size, cursor)
+            for item in page['items']:
+                yield item
+            cursor = page['next_cursor']
+            if cursor is None:
+                return
+
+    async def get_stale(self, older_than: float) -> List[Dict[str, Any]]:
+        """Lists the items not updated for more than older_than seconds, oldest first."""
+        response = await self._request('GET', 'stale', params={'older_than': older_than})
+        return response.json()['items']
+
+    async def checkpoint(self, wait: bool = True) -> Dict[str, Any]:
+        """Saves the current board state; with wait=False, returns once the checkpoint has started."""
+        response = await self._request('POST', 'checkpoint', params={} if wait else {'wait': 0})
+        return response.json()
+
+    async def checkpoint_status(self) -> Dict[str, Any]:
+        """Fetches the outcome, duration and size of the last checkpoint."""
+        response = await self._request('GET', 'checkpoint')
+        return response.json()
+
+    async def restore(self) -> Dict[str, Any]:
+        """Restores the board state from a checkpoint."""
+        response = await self._request('POST', 'restore')
+        return response.json()
+
+    async def create_category(self, category_name: str) -> Dict[str, Any]:
+        """Creates a new category."""
+        response = await self._request('POST', 'categories', json={"category_name": category_name})
+        return response.json()
+
+    async def delete_category(self, category_name: str) -> AsyncResponse:
+        """Deletes a category."""
+        return await self._request('DELETE', f'categories/{category_name}')
+
+    async def create_item(self, category_name: str, item_name: str, upsert: bool = True) -> Dict[str, Any]:
+        """Creates an item within a category, and the category too if upsert is True and it does not exist."""
+        endpoint = f'categories/{category_name}/items'
+        try:
+            response = await self._request('POST', endpoint, json={"item_name": item_name})
+            return response.json()
+        except requests.exceptions.HTTPError as e:
+            if upsert and e.response.status_code == 404:
+                await self.create_category(category_name)
+                response = await self._request('POST', endpoint, json={"item_name": item_name})
+                return response.json()
+            raise
+
+    async def delete_item(self, category_name: str, item_name: str) -> AsyncResponse:
+        """Deletes an item."""
+        return await self._request('DELETE', f'categories/{category_name}/items/{item_name}')
+
+    async def update_item(self, category_name: str, item_name: str, status: Optional[str] = None, message: Optional[str] = None, url: Optional[str] = None, upsert: bool = True, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Updates an item's status, message, URL or TTL, creating the category and
+        item first if upsert is True and they do not exist (see HealthBoard.update_item).
+        """
+        payload = {}
+        if status is not None:
+            payload['status'] = status
+        if message is not None:
+            payload['message'] = message
+        if url is not None:
+            payload['url'] = url
+        if ttl is not None:
+            payload['ttl'] = ttl
+
+        if not payload:
+            if upsert:
+                try:
+                    await self.create_item(category_name, item_name, upsert=True)
+                except requests.exceptions.HTTPError as e:
+                    if e.response.status_code != 409:
+                        raise
+            return {"message": "No update parameters provided. Item state unchanged."}
+
+        endpoint = f'categories/{category_name}/items/{item_name}'
+        if not upsert:
+            response = await self._request('PUT', endpoint, json=payload)
+            return response.json()
+
+        try:
+            response = await self._request('PUT', endpoint, json=payload, params={'upsert': 1})
+            return response.json()
+        except requests.exceptions.HTTPError as e:
+            # Servers without upsert support answer 404 for a missing item: create it and retry.
+            if e.response.status_code == 404:
+                try:
+                    await self.create_item(category_name, item_name, upsert=True)
+                except requests.exceptions.HTTPError as ce:
+                    if ce.response.status_code != 409:
+                        raise
+                response = await self._request('PUT', endpoint, json=payload)
+                return response.json()
+            raise
+
+    async def batch(self, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Applies many create, update and delete operations in a single request (see HealthBoard.batch)."""
+        response = await self._request('POST', 'batch', json={"operations": operations})
+        return response.json()
+
+
+class AsyncHealthBoardUpdater(AsyncHealthBoard):
+    """
+    An AsyncHealthBoard for updating a single item.
+    """
+
+    def __init__(self, base_url: str, category: str, item: str, **kwargs):
+        """
+        Initializes the AsyncHealthBoardUpdater.
+
+        Args:
+            base_url: The base URL of the Health Board API.
+            category: The name of the category.
+            item: The name of the item.
+            **kwargs: Connection settings passed on to AsyncHealthBoard, e.g. pool_size.
+        """
+        super().__init__(base_url, **kwargs)
+        self.category = category
+        self.item = item
+
+    async def update_item(self, status: Optional[str] = None, message: Optional[str] = None, url: Optional[str] = None, upsert: bool = True, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """Updates the item's status, message, URL or TTL."""
+        return await super().update_item(self.category, self.item, status, message, url, upsert, ttl)
 
 
 if __name__ == '__main__':
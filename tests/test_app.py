@@ -14,23 +14,18 @@ class TestAppAPI(unittest.TestCase):
         """Set up for each test."""
         main_app.app.testing = True
         self.client = main_app.app.test_client()
-        main_app.health_data.clear()
+        main_app.store.reset()
 
-        # Patch datetime.datetime within the 'app' module's scope
-        self.patcher_datetime = patch('app.app.datetime.datetime')
-        self.mocked_datetime_class = self.patcher_datetime.start()
-
-        # Configure the mock for the chain: datetime.datetime.utcnow().isoformat()
-        # self.mocked_datetime_class.utcnow.return_value will be a MagicMock by default
-        self.mocked_datetime_class.utcnow.return_value.isoformat.return_value = "2023-01-01T12:00:00"
+        # Pin the clock of every write to 2023-01-01T12:00:00Z
+        self.patcher_clock = patch('app.app._utc_timestamp', return_value=1672574400.0)
+        self.patcher_clock.start()
 
     def tearDown(self):
         """Clean up after each test."""
-        self.patcher_datetime.stop()
+        self.patcher_clock.stop()
 
     def _get_expected_timestamp(self):
-        # Access the configured return value through the mocked class structure
-        return self.mocked_datetime_class.utcnow.return_value.isoformat.return_value + 'Z'
+        return "2023-01-01T12:00:00Z"
 
 
     # Category Tests
@@ -38,7 +33,7 @@ class TestAppAPI(unittest.TestCase):
         response = self.client.post('/api/categories', json={'category_name': 'Cat1'})
         self.assertEqual(response.status_code, 201)
         self.assertIn('Cat1', response.json)
-        self.assertEqual(main_app.health_data['Cat1'], {})
+        self.assertEqual(main_app.store.snapshot()['Cat1'], {})
 
     def test_create_category_duplicate(self):
         self.client.post('/api/categories', json={'category_name': 'Cat1'})
@@ -55,7 +50,7 @@ class TestAppAPI(unittest.TestCase):
         self.client.post('/api/categories', json={'category_name': 'Cat1'})
         response = self.client.delete('/api/categories/Cat1')
         self.assertEqual(response.status_code, 200)
-        self.assertNotIn('Cat1', main_app.health_data)
+        self.assertNotIn('Cat1', main_app.store.snapshot())
 
     def test_delete_category_not_found(self):
         response = self.client.delete('/api/categories/NonExistentCat')
@@ -73,7 +68,7 @@ class TestAppAPI(unittest.TestCase):
             "url": ""
         }
         self.assertEqual(response.json['Item1'], expected_item_data)
-        self.assertEqual(main_app.health_data['Cat1']['Item1'], expected_item_data)
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1'], expected_item_data)
 
     def test_create_item_category_not_found(self):
         response = self.client.post('/api/categories/NonExistentCat/items', json={'item_name': 'Item1'})
@@ -117,7 +112,7 @@ class TestAppAPI(unittest.TestCase):
             "url": "http://example.com"
         }
         self.assertEqual(response.json['Item1'], expected_item_data)
-        self.assertEqual(main_app.health_data['Cat1']['Item1'], expected_item_data)
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1'], expected_item_data)
 
     def test_update_item_partial(self):
         self.client.post('/api/categories', json={'category_name': 'Cat1'})
@@ -134,7 +129,7 @@ class TestAppAPI(unittest.TestCase):
             "url": ""
         }
         self.assertEqual(response.json['Item1'], expected_item_data)
-        self.assertEqual(main_app.health_data['Cat1']['Item1'], expected_item_data)
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1'], expected_item_data)
 
     def test_update_item_invalid_status(self):
         self.client.post('/api/categories', json={'category_name': 'Cat1'})
@@ -157,7 +152,7 @@ class TestAppAPI(unittest.TestCase):
             "url": ""
         }
         self.assertEqual(response.json['Item1'], expected_item_data)
-        self.assertEqual(main_app.health_data['Cat1']['Item1'], expected_item_data)
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1'], expected_item_data)
 
     def test_update_item_category_not_found(self):
         response = self.client.put('/api/categories/NonExistentCat/items/Item1', json={'status': 'passing'})
@@ -168,12 +163,40 @@ class TestAppAPI(unittest.TestCase):
         response = self.client.put('/api/categories/Cat1/items/NonExistentItem', json={'status': 'passing'})
         self.assertEqual(response.status_code, 404)
 
+    def test_update_item_upsert_creates_category_and_item(self):
+        response = self.client.put('/api/categories/NewCat/items/NewItem?upsert=1', json={"status": "passing", "message": "Created"})
+        self.assertEqual(response.status_code, 201)
+
+        expected_item_data = {
+            "status": "passing",
+            "last_updated": self._get_expected_timestamp(),
+            "message": "Created",
+            "url": ""
+        }
+        self.assertEqual(response.json['NewItem'], expected_item_data)
+        self.assertEqual(main_app.store.snapshot(), {"NewCat": {"NewItem": expected_item_data}})
+
+    def test_update_item_upsert_existing_item(self):
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        self.client.post('/api/categories/Cat1/items', json={'item_name': 'Item1'})
+
+        response = self.client.put('/api/categories/Cat1/items/Item1?upsert=true', json={"status": "down"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1']['status'], 'down')
+
+    def test_update_item_upsert_invalid_input_creates_nothing(self):
+        response = self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={"status": "invalid_state"})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.put('/api/categories/Bad$Cat/items/Item1?upsert=1', json={"status": "up"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(main_app.store.snapshot(), {})
+
     def test_delete_item(self):
         self.client.post('/api/categories', json={'category_name': 'Cat1'})
         self.client.post('/api/categories/Cat1/items', json={'item_name': 'Item1'})
         response = self.client.delete('/api/categories/Cat1/items/Item1')
         self.assertEqual(response.status_code, 200)
-        self.assertNotIn('Item1', main_app.health_data['Cat1'])
+        self.assertNotIn('Item1', main_app.store.snapshot()['Cat1'])
 
     def test_delete_item_category_not_found(self):
         response = self.client.delete('/api/categories/NonExistentCat/items/Item1')
@@ -203,13 +226,45 @@ class TestAppAPI(unittest.TestCase):
             }
         }
         self.assertEqual(response.json, expected_data)
-        self.assertEqual(main_app.health_data, expected_data)
+        self.assertEqual(main_app.store.snapshot(), expected_data)
+
+    def test_get_health_data_not_modified(self):
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        first = self.client.get('/api/health')
+        etag = first.headers['ETag']
+        self.assertTrue(etag)
+
+        response = self.client.get('/api/health', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+
+    def test_mutations_change_health_etag(self):
+        etags = [self.client.get('/api/health').headers['ETag']]
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        etags.append(self.client.get('/api/health').headers['ETag'])
+        self.client.post('/api/categories/Cat1/items', json={'item_name': 'Item1'})
+        etags.append(self.client.get('/api/health').headers['ETag'])
+        self.client.put('/api/categories/Cat1/items/Item1', json={'status': 'up'})
+        etags.append(self.client.get('/api/health').headers['ETag'])
+        self.client.delete('/api/categories/Cat1/items/Item1')
+        etags.append(self.client.get('/api/health').headers['ETag'])
+        self.client.delete('/api/categories/Cat1')
+        etags.append(self.client.get('/api/health').headers['ETag'])
+        self.assertEqual(len(set(etags)), len(etags))
+
+        # Requests that change nothing keep the tag.
+        self.client.delete('/api/categories/Cat1')
+        self.assertEqual(self.client.get('/api/health').headers['ETag'], etags[-1])
+
+        response = self.client.get('/api/health', headers={'If-None-Match': etags[0]})
+        self.assertEqual(response.status_code, 200)
 
     def test_get_empty_health_data(self):
         response = self.client.get('/api/health')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json, {})
-        self.assertEqual(main_app.health_data, {})
+        self.assertEqual(main_app.store.snapshot(), {})
 
     # Checkpoint and Restore Tests
     def test_checkpoint_and_restore(self):
@@ -219,7 +274,7 @@ class TestAppAPI(unittest.TestCase):
         update_payload = {"status": "passing", "message": "Checkpoint test", "url": "http://checkpoint.example.com"}
         self.client.put('/api/categories/TestCat/items/TestItem', json=update_payload)
 
-        initial_data = main_app.health_data.copy()
+        initial_data = main_app.store.snapshot()
 
         # 2. Test /checkpoint
         response_checkpoint = self.client.post('/api/checkpoint')
@@ -233,14 +288,13 @@ class TestAppAPI(unittest.TestCase):
         self.assertEqual(data_from_file, initial_data)
 
         # 3. Modify in-memory data to ensure restore actually works
-        main_app.health_data.clear()
-        main_app.health_data['AnotherCat'] = {} # Make it different from checkpointed data
+        main_app.store.replace({'AnotherCat': {}}) # Make it different from checkpointed data
 
         # 4. Test /restore
         response_restore = self.client.post('/api/restore')
         self.assertEqual(response_restore.status_code, 200)
         self.assertIn("Data restored successfully", response_restore.json['message'])
-        self.assertEqual(main_app.health_data, initial_data) # Should be back to original
+        self.assertEqual(main_app.store.snapshot(), initial_data) # Should be back to original
 
         # 5. Clean up
         if os.path.exists('health_data.json'):
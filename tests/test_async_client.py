@@ -0,0 +1,203 @@
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+import unittest.mock
+import requests
+from werkzeug.serving import make_server, WSGIRequestHandler
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+from health_board_api import AsyncHealthBoard, AsyncHealthBoardUpdater, CircuitOpenError
+
+
+class _KeepAliveHandler(WSGIRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+
+class _ConcurrencyCounter:
+    """WSGI middleware that records the most requests handled at once."""
+
+    def __init__(self, app):
+        self.app = app
+        self.active = self.most = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        with self.lock:
+            self.active += 1
+            self.most = max(self.most, self.active)
+        try:
+            time.sleep(0.01)
+            return self.app(environ, start_response)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestAsyncHealthBoard(unittest.IsolatedAsyncioTestCase):
+    """Runs the client against the board app served on a local port."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = make_server('127.0.0.1', 0, main_app.app, threaded=True, request_handler=_KeepAliveHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/api"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    async def asyncSetUp(self):
+        main_app.store.reset()
+        self.board = AsyncHealthBoard(self.base_url, pool_size=4)
+
+    async def asyncTearDown(self):
+        await self.board.close()
+
+    async def test_update_item_upserts(self):
+        response = await self.board.update_item('Build Jobs', 'Main Nightly', status='passing', message='All good')
+        self.assertEqual(response['Main Nightly']['status'], 'passing')
+        health = await self.board.get_health()
+        self.assertEqual(health['Build Jobs']['Main Nightly']['message'], 'All good')
+
+    async def test_create_item_creates_the_category(self):
+        await self.board.create_item('Cat1', 'Item1')
+        await self.board.update_item('Cat1', 'Item2')  # No fields: only makes sure it exists
+        self.assertEqual(sorted((await self.board.get_health())['Cat1']), ['Item1', 'Item2'])
+        with self.assertRaises(requests.exceptions.HTTPError) as cm:
+            await self.board.create_item('Cat2', 'Item1', upsert=False)
+        self.assertEqual(cm.exception.response.status_code, 404)
+
+    async def test_get_health_polls_for_changes(self):
+        await self.board.update_item('Cat1', 'Item1', status='up')
+        first = await self.board.get_health(fields=['status'])
+        self.assertIs(await self.board.get_health(fields=['status']), first)  # 304
+        await self.board.update_item('Cat1', 'Item1', status='down')
+        await self.board.delete_item('Cat1', 'Item1')
+        await self.board.update_item('Cat2', 'Item1', status='up')
+        self.assertEqual(await self.board.get_health(fields=['status']), {'Cat1': {}, 'Cat2': {'Item1': {'status': 'up'}}})
+
+    async def test_other_endpoints(self):
+        result = await self.board.batch([{"op": "create", "category": "Cat1"}] +
+                                        [{"op": "create", "category": "Cat1", "item": f"Item{i}"} for i in range(5)])
+        self.assertEqual(len(result['results']), 6)
+        names = [item['item'] async for item in self.board.iter_items(page_size=2)]
+        self.assertEqual(names, [f'Item{i}' for i in range(5)])
+        self.assertEqual(await self.board.get_stale(10 ** 6), [])
+        await self.board.delete_category('Cat1')
+        self.assertEqual(await self.board.get_health(), {})
+
+    async def test_concurrency_is_bounded_by_the_pool(self):
+        await self.board.create_category('Probes')
+        self.server.app = _ConcurrencyCounter(main_app.app)
+        try:
+            await asyncio.gather(*(self.board.update_item('Probes', f'probe-{i}', status='up') for i in range(50)))
+        finally:
+            counter, self.server.app = self.server.app, main_app.app
+        self.assertEqual(len((await self.board.get_health())['Probes']), 50)
+        self.assertLessEqual(counter.most, 4)
+        self.assertGreater(counter.most, 1)
+
+    async def test_updater(self):
+        async with AsyncHealthBoardUpdater(self.base_url, 'services', 'database') as updater:
+            await updater.update_item(status='down', message='Maintenance', ttl=60)
+            item = (await updater.get_health())['services']['database']
+        self.assertEqual((item['status'], item['ttl']), ('down', 60))
+
+    async def test_errors(self):
+        with self.assertRaises(requests.exceptions.HTTPError) as cm:
+            await self.board.delete_category('Nope')
+        self.assertEqual(cm.exception.response.status_code, 404)
+
+        # Nothing listens on a closed port.
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        async with AsyncHealthBoard(f"http://127.0.0.1:{port}/api", retries=1, backoff=0.01, breaker_threshold=2) as board:
+            for _ in range(2):
+                with self.assertRaises(requests.exceptions.ConnectionError):
+                    await board.get_health()
+            with self.assertRaises(CircuitOpenError):
+                await board.get_health()
+
+
+
+class TestAsyncConnectionPool(unittest.IsolatedAsyncioTestCase):
+    """Runs the client against a stand-in server that keeps connections open, unlike the development server."""
+
+    async def asyncSetUp(self):
+        self.connections = 0
+        self.requests = []
+        self.server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        self.base_url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/api"
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while (line := await reader.readline()) != b'\r\n':
+                    name, _, value = line.decode().partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                await reader.readexactly(int(headers.get('content-length', 0)))
+                self.requests.append(request_line.decode().split()[1])
+                if request_line.startswith(b'GET /api/stale'):
+                    # A chunked body, after which the server drops the connection.
+                    writer.write(b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+                                 b'5\r\n{"ite\r\nb\r\nms": [1, 2]\r\n1\r\n}\r\n0\r\n\r\n')
+                    await writer.drain()
+                    break
+                writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 2\r\n\r\n{}')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def test_connections_are_reused(self):
+        async with AsyncHealthBoard(self.base_url, pool_size=2) as board:
+            for _ in range(5):
+                await board.update_item('Cat 1', 'Item1', status='up')
+            await asyncio.gather(*(board.get_health() for _ in range(10)))
+            self.assertEqual(self.connections, 2)
+            self.assertEqual(self.requests[0], '/api/categories/Cat%201/items/Item1?upsert=1')
+
+    async def test_cancelled_trial_does_not_lock_the_breaker(self):
+        async with AsyncHealthBoard(self.base_url, retries=0, breaker_threshold=1) as board:
+            now = [0.0]
+            board.breaker.clock = lambda: now[0]
+            board.breaker.record_failure()
+            now[0] += board.breaker.reset_timeout
+            request = board.pool.request
+            board.pool.request = unittest.mock.AsyncMock(side_effect=asyncio.CancelledError())
+            with self.assertRaises(asyncio.CancelledError):
+                await board.get_stale(1)
+            board.pool.request = request
+            self.assertEqual(await board.get_stale(1), [1, 2])
+            self.assertEqual(board.breaker.state, 'closed')
+
+    async def test_closed_idle_connection_is_replaced(self):
+        async with AsyncHealthBoard(self.base_url, pool_size=1, retries=0) as board:
+            await board.get_health()
+            self.assertEqual(await board.get_stale(1), [1, 2])
+            await board.get_health()  # The pooled connection was closed by the server
+            self.assertEqual(self.connections, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+class TestBatchAPI(unittest.TestCase):
+
+    def setUp(self):
+        """Set up for each test."""
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.reset()
+
+        # Pin the clock of every write to 2023-01-01T12:00:00Z
+        self.patcher_clock = patch('app.app._utc_timestamp', return_value=1672574400.0)
+        self.patcher_clock.start()
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.patcher_clock.stop()
+
+    def test_batch_create_update_delete(self):
+        operations = [
+            {"op": "create", "category": "Builds"},
+            {"op": "create", "category": "Builds", "item": "Main"},
+            {"op": "create", "category": "Builds", "item": "Nightly"},
+            {"op": "update", "category": "Builds", "item": "Main", "status": "PASSING", "message": "Green", "url": "http://ci.example.com"},
+            {"op": "delete", "category": "Builds", "item": "Nightly"},
+        ]
+        response = self.client.post('/api/batch', json={"operations": operations})
+        self.assertEqual(response.status_code, 200)
+
+        results = response.json['results']
+        self.assertEqual([r['status_code'] for r in results], [201, 201, 201, 200, 200])
+        self.assertEqual(results[3]['body']['Main']['status'], 'passing')
+        self.assertEqual(main_app.store.snapshot(), {
+            "Builds": {
+                "Main": {
+                    "status": "passing",
+                    "last_updated": "2023-01-01T12:00:00Z",
+                    "message": "Green",
+                    "url": "http://ci.example.com"
+                }
+            }
+        })
+
+    def test_batch_reports_per_operation_outcomes(self):
+        operations = [
+            {"op": "update", "category": "Missing", "item": "Item1", "status": "up"},
+            {"op": "delete", "category": "Missing"},
+            {"op": "create", "category": "Cat1"},
+            {"op": "create", "category": "Cat1"},
+        ]
+        response = self.client.post('/api/batch', json={"operations": operations})
+        self.assertEqual(response.status_code, 200)
+
+        results = response.json['results']
+        self.assertEqual([r['status_code'] for r in results], [404, 404, 201, 200])
+        self.assertIn('error', results[0]['body'])
+        self.assertIn('note', results[3]['body'])
+        self.assertEqual(main_app.store.snapshot(), {"Cat1": {}})
+
+    def test_batch_invalid_operation_rejects_whole_batch(self):
+        operations = [
+            {"op": "create", "category": "Cat1"},
+            {"op": "update", "category": "Cat1", "item": "Item1", "status": "not_a_status"},
+            {"op": "create", "category": "<script>"},
+            {"op": "rename", "category": "Cat1"},
+            {"op": "update", "category": "Cat1"},
+        ]
+        response = self.client.post('/api/batch', json={"operations": operations})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([e['index'] for e in response.json['errors']], [1, 2, 3, 4])
+        self.assertEqual(main_app.store.snapshot(), {})
+
+    def test_batch_unsafe_url_is_ignored(self):
+        operations = [
+            {"op": "create", "category": "Cat1"},
+            {"op": "create", "category": "Cat1", "item": "Item1"},
+            {"op": "update", "category": "Cat1", "item": "Item1", "url": "javascript:alert(1)"},
+        ]
+        response = self.client.post('/api/batch', json={"operations": operations})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1']['url'], "")
+
+    def test_batch_update_upsert(self):
+        operations = [
+            {"op": "update", "category": "Cat1", "item": "Item1", "status": "up", "upsert": True},
+            {"op": "update", "category": "Cat1", "item": "Item1", "message": "Still up", "upsert": True},
+        ]
+        response = self.client.post('/api/batch', json={"operations": operations})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r['status_code'] for r in response.json['results']], [201, 200])
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1']['status'], 'up')
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1']['message'], 'Still up')
+
+    def test_batch_missing_operations(self):
+        response = self.client.post('/api/batch', json={"ops": []})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json)
+
+    def test_batch_body_not_an_object(self):
+        for body in ([{"op": "create", "category": "Cat1"}], "operations", 1):
+            with self.subTest(body=body):
+                response = self.client.post('/api/batch', json=body)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', response.json)
+        self.assertEqual(main_app.store.snapshot(), {})
+
+    def test_batch_too_many_operations(self):
+        operations = [{"op": "create", "category": "Cat1"}] * (main_app.MAX_BATCH_OPERATIONS + 1)
+        response = self.client.post('/api/batch', json={"operations": operations})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(main_app.store.snapshot(), {})
+
+if __name__ == '__main__':
+    unittest.main()
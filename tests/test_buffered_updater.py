@@ -0,0 +1,177 @@
+import threading
+import unittest
+from unittest.mock import patch, Mock
+import requests
+from health_board_api import BufferedUpdater, HealthBoardUpdater
+
+
+def _accept_all(operations):
+    return {"results": [{"status_code": 200, "body": {}} for _ in operations]}
+
+
+def _refused(body=None):
+    response = Mock(status_code=400)
+    response.json.return_value = body or {"error": "Missing operations list in request body"}
+    return requests.exceptions.HTTPError("400 Client Error", response=response)
+
+
+class TestBufferedUpdater(unittest.TestCase):
+
+    def setUp(self):
+        self.board = Mock()
+        self.board.batch.side_effect = _accept_all
+
+    def _updater(self, **kwargs):
+        updater = BufferedUpdater(self.board, **dict({'flush_interval': 60}, **kwargs))
+        self.addCleanup(updater.close)
+        return updater
+
+    def test_pending_updates_are_superseded(self):
+        updater = self._updater()
+        updater.update_item('Cat1', 'Item1', status='up', upsert=False)
+        updater.update_item('Cat1', 'Item2', status='up')
+        updater.update_item('Cat1', 'Item1', message='Slow')
+        updater.update_item('Cat1', 'Item1', status='down', upsert=False)
+        self.board.batch.assert_not_called()
+
+        self.assertTrue(updater.flush())
+        self.board.batch.assert_called_once_with([
+            # Created if any of the merged updates asked for it.
+            {"op": "update", "category": "Cat1", "item": "Item1", "status": "down", "message": "Slow", "upsert": True},
+            {"op": "update", "category": "Cat1", "item": "Item2", "status": "up", "upsert": True},
+        ])
+        self.assertEqual(updater.stats()['sent'], 2)
+        self.assertEqual(updater.stats()['superseded'], 2)
+
+    def test_size_trigger(self):
+        sent = threading.Event()
+        self.board.batch.side_effect = lambda operations: (sent.set(), _accept_all(operations))[1]
+        updater = self._updater(batch_size=3)
+        for i in range(3):
+            updater.update_item('Cat1', f'Item{i}', status='up')
+        self.assertTrue(sent.wait(5))
+        self.assertEqual(len(self.board.batch.call_args.args[0]), 3)
+
+    def test_time_trigger(self):
+        sent = threading.Event()
+        self.board.batch.side_effect = lambda operations: (sent.set(), _accept_all(operations))[1]
+        updater = self._updater(flush_interval=0.05)
+        updater.update_item('Cat1', 'Item1', status='up')
+        self.assertTrue(sent.wait(5))
+
+    def test_batches_are_split(self):
+        updater = self._updater(batch_size=2)
+        with updater._condition:  # Keep the background thread from sending
+            for i in range(5):
+                updater.update_item('Cat1', f'Item{i}', status='up')
+        updater.flush()
+        self.assertEqual(updater.sent, 5)
+        self.assertEqual(self.board.batch.call_count, 3)
+
+    def test_failed_batch_is_queued_again(self):
+        updater = self._updater()
+        self.board.batch.side_effect = requests.exceptions.ConnectionError("refused")
+        updater.update_item('Cat1', 'Item1', status='up', message='First')
+        self.assertFalse(updater.flush())
+        updater.update_item('Cat1', 'Item1', status='down')
+
+        self.board.batch.side_effect = _accept_all
+        self.assertTrue(updater.flush())
+        self.assertEqual(self.board.batch.call_args.args[0],
+                         [{"op": "update", "category": "Cat1", "item": "Item1", "status": "down", "message": "First", "upsert": True}])
+        self.assertEqual(updater.stats(), {"pending": 0, "sent": 1, "superseded": 1, "dropped": 0,
+                                           "errors": 1, "last_error": "refused"})
+
+    def test_updates_beyond_max_pending_are_dropped(self):
+        updater = self._updater(max_pending=2)
+        self.assertTrue(updater.update_item('Cat1', 'Item1', status='up'))
+        self.assertTrue(updater.update_item('Cat1', 'Item2', status='up'))
+        self.assertFalse(updater.update_item('Cat1', 'Item3', status='up'))
+        self.assertTrue(updater.update_item('Cat1', 'Item1', status='down'))
+        self.assertEqual(updater.dropped, 1)
+
+    def test_rejected_updates_are_dropped(self):
+        self.board.batch.side_effect = lambda operations: {"results": [{"status_code": 404, "body": {}}]}
+        updater = self._updater()
+        updater.update_item('Cat1', 'Item1', status='up', upsert=False)
+        updater.flush()
+        self.assertEqual((updater.sent, updater.dropped), (0, 1))
+
+    def test_refused_batch_is_dropped_not_queued_again(self):
+        self.board.batch.side_effect = _refused()
+        updater = self._updater()
+        updater.update_item('Cat1', 'Item1', status='up')
+        updater.update_item('Cat1', 'Item2', status='up')
+        self.assertTrue(updater.flush())
+        self.board.batch.assert_called_once()
+        self.assertEqual(updater.stats(), {"pending": 0, "sent": 0, "superseded": 0, "dropped": 2,
+                                           "errors": 1, "last_error": "400 Client Error"})
+        self.assertEqual(updater._retry_at, 0.0)
+
+    def test_invalid_updates_are_dropped_and_the_rest_sent(self):
+        self.board.batch.side_effect = [
+            _refused({"error": "Batch rejected; no operations were applied",
+                      "errors": [{"index": 1, "error": "Invalid status"}]}),
+            _accept_all([None, None]),
+        ]
+        updater = self._updater()
+        for item, status in (('Item1', 'up'), ('Item2', 'bogus'), ('Item3', 'down')):
+            updater.update_item('Cat1', item, status=status)
+        self.assertTrue(updater.flush())
+        self.assertEqual([operation['item'] for operation in self.board.batch.call_args.args[0]], ['Item1', 'Item3'])
+        self.assertEqual((updater.sent, updater.dropped), (2, 1))
+
+    def test_close_sends_or_drops_what_is_left(self):
+        updater = self._updater()
+        updater.update_item('Cat1', 'Item1', status='up')
+        updater.close()
+        self.assertEqual(updater.sent, 1)
+        with self.assertRaises(RuntimeError):
+            updater.update_item('Cat1', 'Item1', status='up')
+
+        self.board.batch.side_effect = requests.exceptions.ConnectionError()
+        updater = self._updater()
+        updater.update_item('Cat1', 'Item1', status='up')
+        updater.close()
+        self.assertEqual(updater.stats()['dropped'], 1)
+        self.assertEqual(updater.stats()['pending'], 0)
+
+
+class TestBufferedHealthBoardUpdater(unittest.TestCase):
+
+    @patch('health_board_api.HealthBoard.batch', side_effect=_accept_all)
+    @patch('health_board_api.HealthBoard.update_item')
+    def test_buffered_mode(self, mock_update_item, mock_batch):
+        updater = HealthBoardUpdater("http://fake-url.com", "Jobs", "nightly", buffered=True, flush_interval=60)
+        self.assertEqual(updater.update_item(status='running'), {"message": "Update queued."})
+        updater.update_item(status='passing', message='Done')
+        updater.close()
+
+        mock_update_item.assert_not_called()
+        mock_batch.assert_called_once_with(
+            [{"op": "update", "category": "Jobs", "item": "nightly", "status": "passing", "message": "Done", "upsert": True}])
+        self.assertEqual(updater.buffer.sent, 1)
+
+    @patch('health_board_api.HealthBoard.batch')
+    def test_dropped_or_held_back_updates_are_sent_again(self, mock_batch):
+        updater = HealthBoardUpdater("http://fake-url.com", "Jobs", "nightly", buffered=True, flush_interval=60)
+        self.addCleanup(updater.close)
+        mock_batch.side_effect = _refused()
+        updater.update_item(status='passing')
+        updater.flush()
+        updater.update_item(status='passing')
+        self.assertEqual(updater.buffer.stats()['pending'], 1)
+
+        # The server held the change back and still shows the item as passing.
+        mock_batch.side_effect = lambda operations: {"results": [
+            {"status_code": 200, "body": {"nightly": {"status": "passing", "message": "", "url": ""}}}]}
+        updater.flush()
+        updater.update_item(status='failing')
+        updater.flush()
+        updater.update_item(status='failing')
+        self.assertEqual(updater.buffer.stats()['pending'], 1)
+        self.assertEqual(updater.suppressed, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,11 @@
 import unittest
+import io
 import json
 import os
+import shutil
 import sys
+import tempfile
+import time
 from unittest.mock import patch
 
 # Adjust path to import app from the parent directory
@@ -14,7 +18,7 @@ class TestCheckpoint(unittest.TestCase):
         """Set up for each test."""
         main_app.app.testing = True
         self.client = main_app.app.test_client()
-        main_app.health_data.clear()
+        main_app.store.reset()
 
         # Ensure we are working with a clean slate for files
         if os.path.exists('health_data.json'):
@@ -27,7 +31,7 @@ class TestCheckpoint(unittest.TestCase):
 
     def test_checkpoint_data_success(self):
         """Test successful checkpointing of data."""
-        main_app.health_data['TestCat'] = {'TestItem': {'status': 'ok'}}
+        main_app.store.replace({'TestCat': {'TestItem': {'status': 'ok'}}})
 
         response = self.client.post('/api/checkpoint')
         self.assertEqual(response.status_code, 200)
@@ -36,7 +40,7 @@ class TestCheckpoint(unittest.TestCase):
         self.assertTrue(os.path.exists('health_data.json'))
         with open('health_data.json', 'r') as f:
             data = json.load(f)
-        self.assertEqual(data, main_app.health_data)
+        self.assertEqual(data, main_app.store.snapshot())
 
     def test_restore_data_success(self):
         """Test successful restoration of data."""
@@ -47,7 +51,7 @@ class TestCheckpoint(unittest.TestCase):
         response = self.client.post('/api/restore')
         self.assertEqual(response.status_code, 200)
         self.assertIn("Data restored successfully", response.json['message'])
-        self.assertEqual(main_app.health_data, initial_data)
+        self.assertEqual(main_app.store.snapshot(), initial_data)
 
     def test_restore_data_io_error(self):
         """Test error handling when reading checkpoint file fails."""
@@ -67,5 +71,184 @@ class TestCheckpoint(unittest.TestCase):
             self.assertEqual(response.status_code, 500)
             self.assertIn("Failed to write checkpoint file: Simulated write error", response.json['error'])
 
+    def test_checkpoint_reports_duration_and_size(self):
+        main_app.store.replace({'TestCat': {'TestItem': {'status': 'ok'}}})
+        response = self.client.post('/api/checkpoint')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['size_bytes'], os.path.getsize('health_data.json'))
+        self.assertFalse(os.path.exists('health_data.json.tmp'))
+
+        status = self.client.get('/api/checkpoint').json
+        self.assertEqual(status['version'], response.json['version'])
+        self.assertIsNotNone(status['duration_ms'])
+        self.assertFalse(status['dirty'])
+
+        self.client.post('/api/categories', json={'category_name': 'NewCat'})
+        self.assertTrue(self.client.get('/api/checkpoint').json['dirty'])
+
+    def test_checkpoint_without_waiting(self):
+        main_app.store.replace({'TestCat': {}})
+        response = self.client.post('/api/checkpoint?wait=0')
+        self.assertEqual(response.status_code, 202)
+
+        deadline = time.monotonic() + 5
+        while self.client.get('/api/checkpoint').json['dirty'] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with open('health_data.json', 'r') as f:
+            self.assertEqual(json.load(f), {'TestCat': {}})
+
+    def test_failed_write_keeps_previous_checkpoint(self):
+        main_app.store.replace({'TestCat': {}})
+        self.client.post('/api/checkpoint')
+        main_app.store.replace({'OtherCat': {}})
+        with patch('app.app.json.dump', side_effect=IOError("Disk full")):
+            response = self.client.post('/api/checkpoint')
+        self.assertEqual(response.status_code, 500)
+        with open('health_data.json', 'r') as f:
+            self.assertEqual(json.load(f), {'TestCat': {}})
+        self.assertEqual(self.client.get('/api/checkpoint').json['error'], "Disk full")
+        self.assertFalse(os.path.exists('health_data.json.tmp'))
+
+    def test_unexpected_error_does_not_block_waiters(self):
+        main_app.store.replace({'TestCat': {}})
+        with patch('app.app.json.dump', side_effect=TypeError("Object of type set is not JSON serializable")):
+            response = self.client.post('/api/checkpoint')
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("not JSON serializable", response.json['error'])
+        self.assertFalse(os.path.exists('health_data.json.tmp'))
+        # The thread survives and writes the next checkpoint.
+        self.assertEqual(self.client.post('/api/checkpoint').status_code, 200)
+
+
+class TestCheckpointScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'board.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _wait_for_checkpoint(self, checkpointer, version):
+        deadline = time.monotonic() + 5
+        while checkpointer.version != version and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(checkpointer.version, version)
+
+    def test_checkpoints_only_when_dirty(self):
+        store = main_app.HealthStore(change_log_size=100)
+        checkpointer = main_app.Checkpointer(store, self.path, interval=0.02)
+        self.addCleanup(checkpointer.close)
+        with patch.object(checkpointer, '_write', wraps=checkpointer._write) as write:
+            checkpointer.start()
+            with store.transaction() as txn:
+                txn.create_category('Cat1')
+            self._wait_for_checkpoint(checkpointer, 1)
+            time.sleep(0.1)
+            self.assertEqual(write.call_count, 1)  # Nothing changed since
+
+            with store.transaction() as txn:
+                txn.create_category('Cat2')
+            self._wait_for_checkpoint(checkpointer, 2)
+        with open(self.path, 'r') as f:
+            self.assertEqual(json.load(f), {'Cat1': {}, 'Cat2': {}})
+
+
+class TestBinaryCheckpoint(unittest.TestCase):
+
+    BOARD = {
+        'Builds': {
+            'Main': {'status': 'passing', 'last_updated': '2023-01-01T12:00:00Z', 'message': 'Gr\u00fcn', 'url': ''},
+            'Nightly': {'status': 'failing', 'last_updated': None, 'message': '', 'url': 'http://ci.example.com'},
+        },
+        'Empty': {},
+    }
+
+    def _write(self, data, compression='none'):
+        f = io.BytesIO()
+        main_app.write_binary_checkpoint(f, data, compression)
+        return f.getvalue()
+
+    def test_round_trip(self):
+        for compression in main_app.CHECKPOINT_COMPRESSIONS:
+            with self.subTest(compression=compression):
+                encoded = self._write(self.BOARD, compression)
+                self.assertEqual(main_app.read_binary_checkpoint(io.BytesIO(encoded)), self.BOARD)
+                self.assertEqual(main_app.read_checkpoint(io.BytesIO(encoded)), self.BOARD)
+
+    def test_item_ttl(self):
+        board = {'Cat1': {'Item1': {'status': 'up', 'last_updated': None, 'message': '', 'url': '', 'ttl': 300.0},
+                          'Item2': {'status': 'up', 'last_updated': None, 'message': '', 'url': ''}}}
+        self.assertEqual(main_app.read_binary_checkpoint(io.BytesIO(self._write(board))), board)
+
+    def test_smaller_than_json(self):
+        board = {f'Category {c}': {f'Item {i}': {'status': 'passing', 'last_updated': '2023-01-01T12:00:00Z',
+                                                 'message': '', 'url': ''} for i in range(50)} for c in range(20)}
+        encoded = self._write(board)
+        self.assertLess(len(encoded), len(json.dumps(board, indent=4)) / 2)
+        self.assertLess(len(self._write(board, 'zlib')), len(encoded))
+        self.assertEqual(main_app.read_binary_checkpoint(io.BytesIO(encoded)), board)
+
+    def test_damage_is_detected(self):
+        encoded = self._write(self.BOARD)
+        corrupted = bytearray(encoded)
+        corrupted[-20] ^= 0xFF  # Flip bits in one of the last records
+        cases = {
+            'corrupted': bytes(corrupted),
+            'truncated': encoded[:-5],
+            'not binary': b'{"Cat": {}}',
+            'future version': encoded[:4] + b'\x09' + encoded[5:],
+            'bad zlib': self._write(self.BOARD, 'zlib')[:20] + b'\x00' * 10,
+        }
+        for name, data in cases.items():
+            with self.subTest(name):
+                with self.assertRaises(main_app.CheckpointError):
+                    main_app.read_binary_checkpoint(io.BytesIO(data))
+
+    def test_read_checkpoint_still_reads_json(self):
+        self.assertEqual(main_app.read_checkpoint(io.BytesIO(json.dumps(self.BOARD).encode())), self.BOARD)
+
+
+class TestBinaryCheckpointAPI(unittest.TestCase):
+
+    def setUp(self):
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.replace(TestBinaryCheckpoint.BOARD)
+        self.addCleanup(lambda: os.path.exists('health_data.json') and os.remove('health_data.json'))
+
+    def test_binary_checkpoint_and_restore(self):
+        with patch.multiple(main_app.checkpointer, format='binary', compression='gzip'):
+            response = self.client.post('/api/checkpoint')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['format'], 'binary')
+        with open('health_data.json', 'rb') as f:
+            self.assertEqual(f.read(4), main_app.CHECKPOINT_MAGIC)
+
+        main_app.store.reset()
+        response = self.client.post('/api/restore')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(main_app.store.snapshot(), TestBinaryCheckpoint.BOARD)
+
+    def test_updates_the_format_cannot_encode_are_rejected(self):
+        for payload in ({'message': 42}, {'url': ['http://ci.example.com']}, {'status': 1}):
+            with self.subTest(payload=payload):
+                response = self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json=payload)
+                self.assertEqual(response.status_code, 400)
+                response = self.client.post('/api/batch', json={'operations': [
+                    dict(payload, op='update', category='Cat1', item='Item1', upsert=True)]})
+                self.assertEqual(response.status_code, 400)
+        with patch.multiple(main_app.checkpointer, format='binary', compression='none'):
+            self.assertEqual(self.client.post('/api/checkpoint').status_code, 200)
+
+    def test_corrupt_binary_checkpoint_is_rejected(self):
+        with open('health_data.json', 'wb') as f:
+            f.write(main_app.CHECKPOINT_MAGIC + b'\x01\x00C')
+        response = self.client.post('/api/restore')
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("Invalid checkpoint file", response.json['error'])
+        self.assertEqual(main_app.store.snapshot(), TestBinaryCheckpoint.BOARD)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,163 @@
+import unittest
+from unittest.mock import patch, Mock
+import requests
+from health_board_api import HealthBoard, CircuitBreaker, CircuitOpenError
+
+
+def _response(status_code=200, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {'items': []}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    else:
+        response.raise_for_status.return_value = None
+    return response
+
+
+class TestSession(unittest.TestCase):
+
+    def test_pool_and_timeouts(self):
+        board = HealthBoard("http://mock-api.com", pool_size=4, connect_timeout=1.5, read_timeout=7)
+        adapter = board.session.get_adapter("http://mock-api.com/health")
+        self.assertEqual(adapter.timeout, (1.5, 7))
+        self.assertEqual(adapter._pool_maxsize, 4)
+        self.assertIs(board.session.get_adapter("https://mock-api.com/health"), adapter)
+
+    def test_close(self):
+        board = HealthBoard("http://mock-api.com")
+        with patch.object(board.session, 'close') as close:
+            with board:
+                pass
+        close.assert_called_once_with()
+
+
+@patch('time.sleep')
+@patch('requests.Session.request')
+class TestRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.board = HealthBoard("http://mock-api.com", retries=2, backoff=1, max_backoff=3)
+
+    def test_retryable_status_is_retried(self, mock_request, mock_sleep):
+        mock_request.side_effect = [_response(503), _response(502), _response(200)]
+        self.board.get_stale(10)
+        self.assertEqual(mock_request.call_count, 3)
+        first, second = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertTrue(0 <= first <= 1 and 0 <= second <= 2)
+
+    def test_gives_up_after_retries(self, mock_request, mock_sleep):
+        mock_request.side_effect = requests.exceptions.ConnectionError()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.board.delete_item('Cat1', 'Item1')
+        self.assertEqual(mock_request.call_count, 3)
+
+        mock_request.reset_mock(side_effect=True)
+        mock_request.return_value = _response(503)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.board.get_stale(10)
+        self.assertEqual(mock_request.call_count, 3)
+
+    def test_retry_after_is_honoured(self, mock_request, mock_sleep):
+        mock_request.side_effect = [_response(429, {'Retry-After': '2'}), _response(200)]
+        self.board.get_stale(10)
+        self.assertGreaterEqual(mock_sleep.call_args.args[0], 2)
+
+    def test_client_errors_and_posts_are_not_retried(self, mock_request, mock_sleep):
+        mock_request.return_value = _response(404)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.board.delete_category('Nope')
+        mock_request.reset_mock()
+        mock_request.return_value = _response(503)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.board.create_category('Cat1')
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.breaker = CircuitBreaker(threshold=2, reset_timeout=30, clock=lambda: self.now)
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, 'closed')
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, 'open')
+        self.assertFalse(self.breaker.allow())
+
+    def test_single_trial_after_reset_timeout(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.now += 30
+        self.assertEqual(self.breaker.state, 'half-open')
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, 'open')
+        self.now += 30
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, 'closed')
+
+    def test_disabled(self):
+        breaker = CircuitBreaker(threshold=0)
+        for _ in range(10):
+            breaker.record_failure()
+        self.assertTrue(breaker.allow())
+
+    @patch('time.sleep')
+    @patch('requests.Session.request')
+    def test_client_stops_calling_a_down_server(self, mock_request, mock_sleep):
+        board = HealthBoard("http://mock-api.com", retries=0, breaker_threshold=3)
+        mock_request.side_effect = requests.exceptions.ConnectionError()
+        for _ in range(3):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                board.update_item('Cat1', 'Item1', status='up')
+        with self.assertRaises(CircuitOpenError):
+            board.update_item('Cat1', 'Item1', status='up')
+        self.assertEqual(mock_request.call_count, 3)
+        # Callers that handle RequestException keep working.
+        self.assertTrue(issubclass(CircuitOpenError, requests.exceptions.RequestException))
+
+    @patch('requests.Session.request')
+    def test_interrupted_trial_does_not_lock_the_breaker(self, mock_request):
+        board = HealthBoard("http://mock-api.com", retries=0, breaker_threshold=1, breaker_reset_timeout=30)
+        board.breaker.clock = lambda: self.now
+        mock_request.side_effect = requests.exceptions.ConnectionError()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            board.get_stale(10)
+        for error in (requests.exceptions.ChunkedEncodingError(), KeyboardInterrupt()):
+            self.now += 30
+            mock_request.side_effect = error
+            with self.assertRaises(type(error)):
+                board.get_stale(10)
+        self.now += 30
+        mock_request.side_effect = None
+        mock_request.return_value = _response(200)
+        board.get_stale(10)
+        self.assertEqual(board.breaker.state, 'closed')
+
+    @patch('requests.Session.request')
+    def test_server_errors_count_client_errors_do_not(self, mock_request):
+        board = HealthBoard("http://mock-api.com", retries=0, breaker_threshold=2)
+        mock_request.return_value = _response(404)
+        for _ in range(3):
+            with self.assertRaises(requests.exceptions.HTTPError):
+                board.delete_category('Nope')
+        self.assertEqual(board.breaker.state, 'closed')
+        mock_request.return_value = _response(500)
+        for _ in range(2):
+            with self.assertRaises(requests.exceptions.HTTPError):
+                board.delete_category('Cat1')
+        self.assertEqual(board.breaker.state, 'open')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import os
+import sys
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+class TestHealthDelta(unittest.TestCase):
+
+    def setUp(self):
+        """Set up for each test."""
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.reset()
+
+    def _etag(self):
+        return self.client.get('/api/health').headers['ETag']
+
+    def _delta(self, since):
+        response = self.client.get('/api/health', query_string={'since': since})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['ETag'].strip('"'), response.json['version'])
+        return response.json
+
+    def test_delta_contains_only_changes(self):
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+        self.client.put('/api/categories/Cat1/items/Item2?upsert=1', json={'status': 'up'})
+        since = self._etag()
+
+        self.client.put('/api/categories/Cat1/items/Item2', json={'status': 'down'})
+        self.client.put('/api/categories/Cat1/items/Item2', json={'message': 'still down'})
+
+        delta = self._delta(since)
+        self.assertFalse(delta['full'])
+        self.assertEqual(list(delta['data']), ['Cat1'])
+        self.assertEqual(list(delta['data']['Cat1']), ['Item2'])
+        self.assertEqual(delta['data']['Cat1']['Item2']['status'], 'down')
+        self.assertEqual(delta['data']['Cat1']['Item2']['message'], 'still down')
+        self.assertEqual(delta['deleted_categories'], [])
+        self.assertEqual(delta['deleted_items'], {})
+
+    def test_delta_reports_tombstones(self):
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+        self.client.put('/api/categories/Cat2/items/Item1?upsert=1', json={'status': 'up'})
+        since = self._etag()
+
+        self.client.delete('/api/categories/Cat1/items/Item1')
+        self.client.delete('/api/categories/Cat2')
+
+        delta = self._delta(since)
+        self.assertEqual(delta['data'], {})
+        self.assertEqual(delta['deleted_items'], {'Cat1': ['Item1']})
+        self.assertEqual(delta['deleted_categories'], ['Cat2'])
+
+    def test_delta_recreated_category(self):
+        self.client.put('/api/categories/Cat1/items/Old?upsert=1', json={'status': 'up'})
+        since = self._etag()
+
+        self.client.delete('/api/categories/Cat1')
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        self.client.put('/api/categories/Cat1/items/New?upsert=1', json={'status': 'down'})
+
+        delta = self._delta(since)
+        self.assertEqual(delta['deleted_categories'], ['Cat1'])
+        self.assertEqual(list(delta['data']['Cat1']), ['New'])
+
+    def test_delta_with_current_version_is_empty(self):
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        delta = self._delta(self._etag())
+        self.assertFalse(delta['full'])
+        self.assertEqual(delta['data'], {})
+
+    def test_unknown_version_gets_full_snapshot(self):
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+        for since in ('"otherinstance-3"', 'garbage', '0'):
+            delta = self._delta(since)
+            self.assertTrue(delta['full'])
+            self.assertEqual(delta['data'], main_app.store.snapshot())
+
+    def test_truncated_log_gets_full_snapshot(self):
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        since = self._etag()
+        with main_app.store.transaction() as txn:
+            for i in range(main_app.CHANGE_LOG_SIZE + 1):
+                txn.create_category('Cat1')
+
+        delta = self._delta(since)
+        self.assertTrue(delta['full'])
+
+    def test_restore_forces_full_snapshot(self):
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        self.client.post('/api/checkpoint')
+        since = self._etag()
+        self.client.post('/api/restore')
+        try:
+            delta = self._delta(since)
+            self.assertTrue(delta['full'])
+        finally:
+            if os.path.exists('health_data.json'):
+                os.remove('health_data.json')
+
+if __name__ == '__main__':
+    unittest.main()
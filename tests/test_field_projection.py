@@ -0,0 +1,72 @@
+import unittest
+import gzip
+import json
+import os
+import sys
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+ITEM = {'status': 'up', 'last_updated': '2023-01-01T12:00:00Z', 'message': 'A long message', 'url': 'http://example.com'}
+
+
+class TestFieldProjection(unittest.TestCase):
+
+    def setUp(self):
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.replace({'Cat1': {'Item1': ITEM, 'Item2': dict(ITEM, status='down', ttl=10 ** 12)}, 'Empty': {}})
+
+    def test_full_board(self):
+        response = self.client.get('/api/health?fields=status,last_updated')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {
+            'Cat1': {'Item1': {'status': 'up', 'last_updated': ITEM['last_updated']},
+                     'Item2': {'status': 'down', 'last_updated': ITEM['last_updated']}},
+            'Empty': {}})
+
+    def test_missing_keys_are_left_out(self):
+        self.assertEqual(self.client.get('/api/health?fields=ttl').json['Cat1'], {'Item1': {}, 'Item2': {'ttl': 10 ** 12}})
+
+    def test_with_filters(self):
+        self.assertEqual(self.client.get('/api/health?fields=status&status=down').json, {'Cat1': {'Item2': {'status': 'down'}}})
+        self.assertEqual(self.client.get('/api/health?fields=url&category=Empty').json, {'Empty': {}})
+
+    def test_delta(self):
+        etag = self.client.get('/api/health').headers['ETag']
+        self.client.put('/api/categories/Cat1/items/Item1', json={'message': 'Changed'})
+        delta = self.client.get('/api/health', query_string={'since': etag, 'fields': 'message'}).json
+        self.assertEqual(delta['data'], {'Cat1': {'Item1': {'message': 'Changed'}}})
+
+    def test_items_and_stale(self):
+        page = self.client.get('/api/items?fields=status').json
+        self.assertEqual(page['items'][0], {'category': 'Cat1', 'item': 'Item1', 'status': 'up'})
+        stale = self.client.get('/api/stale?older_than=0&fields=status').json
+        self.assertEqual(stale['items'][0], {'category': 'Cat1', 'item': 'Item1', 'status': 'up'})
+
+    def test_projections_are_cached_per_version(self):
+        version = main_app.store.version
+        self.client.get('/api/health?fields=status')
+        self.client.get('/api/health?fields=last_updated,status')
+        self.client.get('/api/health')
+        cached_version, entries = main_app.health_cache._state
+        self.assertEqual(cached_version, version)
+        self.assertIn(('full', ('status',)), entries)
+        self.assertIn(('full', ('status', 'last_updated')), entries)
+        self.assertIn('full', entries)
+
+        response = self.client.get('/api/health?fields=status', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(json.loads(gzip.decompress(response.data) if response.headers.get('Content-Encoding') else response.data),
+                         {'Cat1': {'Item1': {'status': 'up'}, 'Item2': {'status': 'down'}}, 'Empty': {}})
+
+    def test_invalid_fields(self):
+        for fields in ('', 'status,secret', ','):
+            with self.subTest(fields=fields):
+                self.assertEqual(self.client.get('/api/health', query_string={'fields': fields}).status_code, 400)
+        self.assertEqual(self.client.get('/api/items?fields=nope').status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,7 +21,7 @@ class TestHealthBoardAPI(unittest.TestCase):
 
         return mock_resp
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_get_health_success(self, mock_request):
         expected_data = {"status": "healthy"}
         mock_request.return_value = self._mock_response(json_data=expected_data)
@@ -31,7 +31,73 @@ class TestHealthBoardAPI(unittest.TestCase):
         self.assertEqual(data, expected_data)
         mock_request.assert_called_once_with('GET', f"{self.base_url}/health")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
+    def test_get_health_conditional(self, mock_request):
+        expected_data = {"Cat": {}}
+        first = self._mock_response(json_data=expected_data)
+        first.headers = {'ETag': '"abc-1"'}
+        not_modified = self._mock_response(status_code=304)
+        mock_request.side_effect = [first, not_modified]
+
+        self.assertEqual(self.board.get_health(), expected_data)
+        self.assertEqual(self.board.get_health(), expected_data)
+
+        mock_request.assert_called_with('GET', f"{self.base_url}/health", params={'since': '"abc-1"'}, headers={'If-None-Match': '"abc-1"'})
+        not_modified.json.assert_not_called()
+
+    @patch('requests.Session.request')
+    def test_get_health_applies_delta(self, mock_request):
+        first = self._mock_response(json_data={
+            "Cat1": {"Item1": {"status": "up"}, "Item2": {"status": "up"}},
+            "Cat2": {"Item1": {"status": "up"}},
+        })
+        first.headers = {'ETag': '"abc-1"'}
+        delta = self._mock_response(json_data={
+            "version": "abc-4", "full": False,
+            "data": {"Cat1": {"Item1": {"status": "down"}}, "Cat3": {}},
+            "deleted_categories": ["Cat2"],
+            "deleted_items": {"Cat1": ["Item2"]},
+        })
+        delta.headers = {'ETag': '"abc-4"'}
+        mock_request.side_effect = [first, delta]
+
+        original = self.board.get_health()
+        data = self.board.get_health()
+
+        self.assertEqual(data, {"Cat1": {"Item1": {"status": "down"}}, "Cat3": {}})
+        self.assertIn("Cat2", original)  # Earlier results are not modified in place
+        self.assertEqual(self.board._health_etag, '"abc-4"')
+
+    @patch('requests.Session.request')
+    def test_get_health_full_snapshot_fallback(self, mock_request):
+        first = self._mock_response(json_data={"Cat1": {}})
+        first.headers = {'ETag': '"abc-1"'}
+        snapshot = self._mock_response(json_data={
+            "version": "def-1", "full": True, "data": {"Cat9": {}},
+            "deleted_categories": [], "deleted_items": {},
+        })
+        snapshot.headers = {'ETag': '"def-1"'}
+        mock_request.side_effect = [first, snapshot]
+
+        self.board.get_health()
+        self.assertEqual(self.board.get_health(), {"Cat9": {}})
+
+    @patch('requests.Session.request')
+    def test_get_health_fields(self, mock_request):
+        first = self._mock_response(json_data={"Cat1": {"Item1": {"status": "up"}}})
+        first.headers = {'ETag': '"abc-1"'}
+        second = self._mock_response(status_code=304)
+        mock_request.side_effect = [first, second, self._mock_response(json_data={})]
+
+        self.assertEqual(self.board.get_health(fields=['status']), {"Cat1": {"Item1": {"status": "up"}}})
+        mock_request.assert_called_with('GET', f"{self.base_url}/health", params={'fields': 'status'})
+        self.board.get_health(fields=['status'])
+        mock_request.assert_called_with('GET', f"{self.base_url}/health", params={'fields': 'status', 'since': '"abc-1"'}, headers={'If-None-Match': '"abc-1"'})
+        # Other fields than the copy held: fetched in full.
+        self.board.get_health()
+        mock_request.assert_called_with('GET', f"{self.base_url}/health")
+
+    @patch('requests.Session.request')
     def test_checkpoint_success(self, mock_request):
         expected_data = {"message": "Checkpoint created"}
         mock_request.return_value = self._mock_response(json_data=expected_data)
@@ -41,7 +107,23 @@ class TestHealthBoardAPI(unittest.TestCase):
         self.assertEqual(data, expected_data)
         mock_request.assert_called_once_with('POST', f"{self.base_url}/checkpoint")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
+    def test_checkpoint_without_waiting(self, mock_request):
+        mock_request.return_value = self._mock_response(status_code=202, json_data={"message": "Checkpoint started"})
+
+        self.board.checkpoint(wait=False)
+
+        mock_request.assert_called_once_with('POST', f"{self.base_url}/checkpoint", params={'wait': 0})
+
+    @patch('requests.Session.request')
+    def test_checkpoint_status(self, mock_request):
+        expected_data = {"duration_ms": 1.5, "size_bytes": 120, "dirty": False}
+        mock_request.return_value = self._mock_response(json_data=expected_data)
+
+        self.assertEqual(self.board.checkpoint_status(), expected_data)
+        mock_request.assert_called_once_with('GET', f"{self.base_url}/checkpoint")
+
+    @patch('requests.Session.request')
     def test_restore_success(self, mock_request):
         expected_data = {"message": "Restored from checkpoint"}
         mock_request.return_value = self._mock_response(json_data=expected_data)
@@ -51,7 +133,7 @@ class TestHealthBoardAPI(unittest.TestCase):
         self.assertEqual(data, expected_data)
         mock_request.assert_called_once_with('POST', f"{self.base_url}/restore")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_category_success(self, mock_request):
         category_name = "test-category"
         expected_data = {"category_name": category_name}
@@ -62,7 +144,7 @@ class TestHealthBoardAPI(unittest.TestCase):
         self.assertEqual(data, expected_data)
         mock_request.assert_called_once_with('POST', f"{self.base_url}/categories", json={"category_name": category_name})
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_delete_category_success(self, mock_request):
         category_name = "test-category"
         mock_request.return_value = self._mock_response(status_code=204)
@@ -72,7 +154,7 @@ class TestHealthBoardAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 204)
         mock_request.assert_called_once_with('DELETE', f"{self.base_url}/categories/{category_name}")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_item_success(self, mock_request):
         category_name = "test-category"
         item_name = "test-item"
@@ -89,7 +171,7 @@ class TestHealthBoardAPI(unittest.TestCase):
         self.assertEqual(mock_request.call_count, 1)
         mock_request.assert_called_once_with('POST', f"{self.base_url}/categories/{category_name}/items", json={"item_name": item_name})
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_item_upsert_category_not_found(self, mock_request):
         category_name = "new-category"
         item_name = "new-item"
@@ -109,7 +191,7 @@ class TestHealthBoardAPI(unittest.TestCase):
         self.assertEqual(mock_request.call_count, 3)
         mock_request.assert_any_call('POST', f"{self.base_url}/categories", json={"category_name": category_name})
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_item_upsert_category_exists(self, mock_request):
         category_name = "existing-category"
         item_name = "new-item"
@@ -124,7 +206,7 @@ class TestHealthBoardAPI(unittest.TestCase):
         self.assertEqual(data, expected_item_data)
         self.assertEqual(mock_request.call_count, 1)
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_create_item_no_upsert_fails(self, mock_request):
         category_name = "non-existent-category"
         item_name = "some-item"
@@ -137,7 +219,7 @@ class TestHealthBoardAPI(unittest.TestCase):
 
         mock_request.assert_called_once_with('POST', f"{self.base_url}/categories/{category_name}/items", json={"item_name": item_name})
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_delete_item_success(self, mock_request):
         category_name = "test-category"
         item_name = "test-item"
@@ -148,7 +230,7 @@ class TestHealthBoardAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 204)
         mock_request.assert_called_once_with('DELETE', f"{self.base_url}/categories/{category_name}/items/{item_name}")
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_update_item_success(self, mock_request):
         category_name = "test-category"
         item_name = "test-item"
@@ -163,16 +245,53 @@ class TestHealthBoardAPI(unittest.TestCase):
 
         self.assertEqual(data, expected_data)
         self.assertEqual(mock_request.call_count, 1)
-        mock_request.assert_called_once_with('PUT', f"{self.base_url}/categories/{category_name}/items/{item_name}", json=update_payload)
+        mock_request.assert_called_once_with('PUT', f"{self.base_url}/categories/{category_name}/items/{item_name}", json=update_payload, params={'upsert': 1})
+
+    @patch('requests.Session.request')
+    def test_update_item_with_ttl(self, mock_request):
+        mock_request.return_value = self._mock_response(200, {})
+        self.board.update_item("cat", "item", status="passing", ttl=300)
+        mock_request.assert_called_once_with('PUT', f"{self.base_url}/categories/cat/items/item", json={"status": "passing", "ttl": 300}, params={'upsert': 1})
+
+    @patch('requests.Session.request')
+    def test_iter_items_follows_cursors(self, mock_request):
+        mock_request.side_effect = [
+            self._mock_response(json_data={"items": [{"item": "a"}], "next_cursor": "c1"}),
+            self._mock_response(json_data={"items": [{"item": "b"}], "next_cursor": None}),
+        ]
+        self.assertEqual([entry["item"] for entry in self.board.iter_items(sort='status', descending=True, page_size=1)], ["a", "b"])
+        mock_request.assert_called_with('GET', f"{self.base_url}/items", params={'sort': 'status', 'order': 'desc', 'limit': 1, 'cursor': 'c1'})
+
+    @patch('requests.Session.request')
+    def test_get_stale(self, mock_request):
+        stale = [{"category": "cat", "item": "item", "status": "unknown"}]
+        mock_request.return_value = self._mock_response(json_data={"older_than": 600, "items": stale})
+        self.assertEqual(self.board.get_stale(600), stale)
+        mock_request.assert_called_once_with('GET', f"{self.base_url}/stale", params={'older_than': 600})
+
+    @patch('requests.Session.request')
+    def test_update_item_upsert_single_request(self, mock_request):
+        category_name = "new-category"
+        item_name = "new-item"
+        expected_data = {item_name: {"status": "passing"}}
 
-    @patch('requests.request')
+        # The server creates the category and item itself, so a new item costs one request.
+        mock_request.return_value = self._mock_response(201, expected_data)
+
+        data = self.board.update_item(category_name, item_name, status="passing", upsert=True)
+
+        self.assertEqual(data, expected_data)
+        mock_request.assert_called_once_with('PUT', f"{self.base_url}/categories/{category_name}/items/{item_name}", json={"status": "passing"}, params={'upsert': 1})
+
+    @patch('requests.Session.request')
     def test_update_item_upsert_needed(self, mock_request):
         category_name = "new-category"
         item_name = "new-item"
         update_payload = {"status": "passing"}
         expected_data = {"status": "passing"}
 
-        # Simulate PUT failing 404, then create_item (which tries POST item, fails 404, creates cat, retries POST item), then PUT retry.
+        # A server without upsert support answers 404, so the client falls back to
+        # creating the item explicitly. Simulate PUT failing 404, then create_item (which tries POST item, fails 404, creates cat, retries POST item), then PUT retry.
         mock_put_404 = self._mock_response(404, raise_for_status=requests.exceptions.HTTPError(response=self._mock_response(404)))
         mock_post_item_404 = self._mock_response(404, raise_for_status=requests.exceptions.HTTPError(response=self._mock_response(404)))
         mock_create_cat = self._mock_response(201, {"category_name": category_name})
@@ -185,6 +304,7 @@ class TestHealthBoardAPI(unittest.TestCase):
 
         self.assertEqual(data, expected_data)
         self.assertEqual(mock_request.call_count, 5)
+        mock_request.assert_called_with('PUT', f"{self.base_url}/categories/{category_name}/items/{item_name}", json=update_payload)
 
     def test_update_item_no_params(self):
         # This test is no longer valid as the method now returns a message instead of raising an error.
@@ -198,7 +318,7 @@ class TestHealthBoardAPI(unittest.TestCase):
             mock_create.assert_called_once_with(category_name, item_name, upsert=True)
 
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
     def test_update_item_no_upsert_fails(self, mock_request):
         category_name = "non-existent-category"
         item_name = "some-item"
@@ -211,7 +331,21 @@ class TestHealthBoardAPI(unittest.TestCase):
 
         mock_request.assert_called_once_with('PUT', f"{self.base_url}/categories/{category_name}/items/{item_name}", json={"status": "failing"})
 
-    @patch('requests.request')
+    @patch('requests.Session.request')
+    def test_batch_success(self, mock_request):
+        operations = [
+            {"op": "create", "category": "cat", "item": "item"},
+            {"op": "update", "category": "cat", "item": "item", "status": "passing"},
+        ]
+        expected_data = {"results": [{"status_code": 201, "body": {}}, {"status_code": 200, "body": {}}]}
+        mock_request.return_value = self._mock_response(json_data=expected_data)
+
+        data = self.board.batch(operations)
+
+        self.assertEqual(data, expected_data)
+        mock_request.assert_called_once_with('POST', f"{self.base_url}/batch", json={"operations": operations})
+
+    @patch('requests.Session.request')
     def test_request_failure(self, mock_request):
         mock_request.side_effect = requests.exceptions.RequestException("Connection error")
 
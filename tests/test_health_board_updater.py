@@ -1,7 +1,25 @@
 import unittest
 from unittest.mock import patch, MagicMock
+import requests
 from health_board_api import HealthBoardUpdater
 
+def _board(held_status=None):
+    """A stand-in for HealthBoard.update_item that answers like the server, optionally holding a status back."""
+    item = {'status': 'unknown', 'last_updated': None, 'message': '', 'url': ''}
+
+    def update_item(category_name, item_name, status=None, message=None, url=None, upsert=True, ttl=None):
+        if status is not None and status != held_status:
+            item['status'] = status
+        if message is not None:
+            item['message'] = message
+        if url is not None:
+            item['url'] = url
+        if ttl:
+            item['ttl'] = ttl
+        return {item_name: dict(item)}
+    return update_item
+
+
 class TestHealthBoardUpdater(unittest.TestCase):
 
     def setUp(self):
@@ -24,7 +42,8 @@ class TestHealthBoardUpdater(unittest.TestCase):
             status,
             message,
             url,
-            False
+            False,
+            None
         )
 
     @patch('health_board_api.HealthBoard.update_item')
@@ -39,7 +58,8 @@ class TestHealthBoardUpdater(unittest.TestCase):
             status,
             None,
             None,
-            True
+            True,
+            None
         )
 
     @patch('health_board_api.HealthBoard.update_item')
@@ -52,5 +72,98 @@ class TestHealthBoardUpdater(unittest.TestCase):
             None,
             None,
             None,
-            True
+            True,
+            None
+        )
+
+    @patch('health_board_api.HealthBoard.update_item')
+    def test_update_item_with_ttl(self, mock_update_item):
+        self.updater.update_item(status="passing", ttl=300)
+
+        mock_update_item.assert_called_once_with(
+            self.category,
+            self.item,
+            "passing",
+            None,
+            None,
+            True,
+            300
         )
+
+    @patch('health_board_api.HealthBoard.update_item')
+    def test_unchanged_updates_are_skipped(self, mock_update_item):
+        mock_update_item.side_effect = _board()
+        now = [1000.0]
+        self.updater.clock = lambda: now[0]
+        self.updater.update_item(status="passing", message="OK")
+        self.assertEqual(self.updater.update_item(status="passing"), {"message": "Item unchanged. Update skipped."})
+        self.updater.update_item(status="passing", message="OK")
+        self.assertEqual(mock_update_item.call_count, 1)
+        self.assertEqual(self.updater.suppressed, 2)
+
+        self.updater.update_item(status="passing", message="Slow")
+        self.assertEqual(mock_update_item.call_count, 2)
+
+        # Repeats are sent once per keepalive interval to refresh last_updated.
+        now[0] += 59
+        self.updater.update_item(status="passing", message="Slow")
+        self.assertEqual(mock_update_item.call_count, 2)
+        now[0] += 1
+        self.updater.update_item(status="passing", message="Slow")
+        self.assertEqual(mock_update_item.call_count, 3)
+
+    @patch('health_board_api.HealthBoard.update_item')
+    def test_keepalive_respects_ttl(self, mock_update_item):
+        mock_update_item.side_effect = _board()
+        now = [1000.0]
+        self.updater.clock = lambda: now[0]
+        self.updater.update_item(status="running", ttl=30)
+        now[0] += 14
+        self.updater.update_item(status="running", ttl=30)
+        self.assertEqual(mock_update_item.call_count, 1)
+        now[0] += 1
+        self.updater.update_item(status="running")
+        self.assertEqual(mock_update_item.call_count, 2)
+
+    @patch('health_board_api.HealthBoard.update_item')
+    def test_held_back_status_is_sent_again(self, mock_update_item):
+        # E.g. server hysteresis: the item stays passing until failing has been reported a few times.
+        mock_update_item.side_effect = _board(held_status='failing')
+        self.updater.update_item(status="passing")
+        self.updater.update_item(status="passing")
+        self.assertEqual(mock_update_item.call_count, 1)
+        for _ in range(3):
+            self.updater.update_item(status="failing")
+        self.assertEqual(mock_update_item.call_count, 4)
+
+    @patch('health_board_api.HealthBoard.update_item')
+    def test_failed_updates_are_not_remembered(self, mock_update_item):
+        board = _board()
+        mock_update_item.side_effect = [requests.exceptions.ConnectionError(), board]
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.updater.update_item(status="passing")
+        mock_update_item.side_effect = board
+        self.updater.update_item(status="passing")
+        self.updater.update_item(status="passing")
+        self.assertEqual(mock_update_item.call_count, 2)
+
+    @patch('health_board_api.HealthBoard.update_item')
+    def test_dropped_or_spooled_updates_are_not_remembered(self, mock_update_item):
+        board = _board()
+        responses = iter([{"message": "Spool is full. Update dropped."}, {"message": "Board unreachable. Update spooled."}])
+        mock_update_item.side_effect = lambda *args: next(responses, None) or board(*args)
+        for _ in range(4):
+            self.updater.update_item(status="passing")
+        self.assertEqual(mock_update_item.call_count, 3)
+
+        updater = HealthBoardUpdater(self.base_url, self.category, self.item, buffered=True, max_pending=0)
+        self.addCleanup(updater.close)
+        self.assertEqual(updater.update_item(status="passing"), {"message": "Too many pending updates. Update dropped."})
+        self.assertIsNone(updater._acked)
+
+    @patch('health_board_api.HealthBoard.update_item')
+    def test_suppression_can_be_disabled(self, mock_update_item):
+        updater = HealthBoardUpdater(self.base_url, self.category, self.item, suppress_unchanged=False)
+        updater.update_item(status="passing")
+        updater.update_item(status="passing")
+        self.assertEqual(mock_update_item.call_count, 2)
@@ -0,0 +1,93 @@
+import unittest
+import os
+import sys
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+class TestHealthIndex(unittest.TestCase):
+
+    def setUp(self):
+        main_app.store.reset()
+
+    def _put(self, category_name, item_name, status):
+        with main_app.store.transaction() as txn:
+            if category_name not in main_app.store.snapshot():
+                txn.create_category(category_name)
+            txn.put_item(category_name, item_name, {'status': status})
+
+    def test_indexes_follow_mutations(self):
+        index = main_app.health_index
+        self._put('Cat1', 'web-1', 'up')
+        self._put('Cat1', 'web-2', 'down')
+        self._put('Cat2', 'db-1', 'down')
+        self.assertEqual(sorted(index.by_status({'down'})), [('Cat1', 'web-2'), ('Cat2', 'db-1')])
+        self.assertEqual(index.by_prefix('web'), [('Cat1', 'web-1'), ('Cat1', 'web-2')])
+
+        self._put('Cat1', 'web-2', 'up')
+        self.assertEqual(index.by_status({'down'}), [('Cat2', 'db-1')])
+        with main_app.store.transaction() as txn:
+            txn.delete_category('Cat1')
+        self.assertEqual(index.by_prefix('web'), [])
+        self.assertEqual(index.count_status({'up'}), 0)
+
+    def test_replace_rebuilds(self):
+        self._put('Cat1', 'Item1', 'up')
+        main_app.store.replace({'Cat2': {'Item2': {'status': 'failing'}}})
+        self.assertEqual(main_app.health_index.by_status({'up'}), [])
+        self.assertEqual(main_app.health_index.by_prefix('Item'), [('Cat2', 'Item2')])
+        self.assertEqual(main_app.health_index.statuses_with_color({'red'}), {'failing'})
+
+
+class TestHealthFilterAPI(unittest.TestCase):
+
+    def setUp(self):
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.replace({
+            'Web': {'web-1': {'status': 'up'}, 'web-2': {'status': 'down'}},
+            'DB': {'db-1': {'status': 'failing'}, 'db-2': {'status': 'unknown'}},
+            'Empty': {},
+        })
+
+    def _get(self, query):
+        response = self.client.get('/api/health?' + query)
+        self.assertEqual(response.status_code, 200)
+        return response.json
+
+    def test_status_filter(self):
+        self.assertEqual(self._get('status=down,failing'),
+                         {'Web': {'web-2': {'status': 'down'}}, 'DB': {'db-1': {'status': 'failing'}}})
+
+    def test_color_filter(self):
+        self.assertEqual(self._get('color=orange'), {'DB': {'db-2': {'status': 'unknown'}}})
+
+    def test_category_filter_includes_empty_categories(self):
+        self.assertEqual(self._get('category=Empty,Web,Nope'),
+                         {'Empty': {}, 'Web': {'web-1': {'status': 'up'}, 'web-2': {'status': 'down'}}})
+
+    def test_prefix_filter(self):
+        self.assertEqual(self._get('prefix=db-'),
+                         {'DB': {'db-1': {'status': 'failing'}, 'db-2': {'status': 'unknown'}}})
+
+    def test_filters_combine(self):
+        self.assertEqual(self._get('color=red&prefix=web'), {'Web': {'web-2': {'status': 'down'}}})
+        self.assertEqual(self._get('category=DB&status=up'), {})
+
+    def test_filtered_responses_are_cached_per_version(self):
+        first = self.client.get('/api/health?status=up')
+        self.assertEqual(self.client.get('/api/health?status=up', headers={'If-None-Match': first.headers['ETag']}).status_code, 304)
+        self.client.put('/api/categories/DB/items/db-2', json={'status': 'up'})
+        second = self.client.get('/api/health?status=up')
+        self.assertNotEqual(second.headers['ETag'], first.headers['ETag'])
+        self.assertEqual(second.json['DB'], {'db-2': second.json['DB']['db-2']})
+
+    def test_since_cannot_be_filtered(self):
+        response = self.client.get('/api/health?status=up&since=0')
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
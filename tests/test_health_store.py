@@ -0,0 +1,138 @@
+import unittest
+import os
+import sys
+import threading
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+class TestHealthStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = main_app.HealthStore(change_log_size=100)
+
+    def test_transaction_publishes_on_commit(self):
+        before = self.store.snapshot()
+        with self.store.transaction() as txn:
+            txn.create_category('Cat1')
+            txn.put_item('Cat1', 'Item1', {'status': 'up'})
+            self.assertEqual(self.store.snapshot(), {})
+        self.assertEqual(before, {})  # Published snapshots are never modified
+        self.assertEqual(self.store.read(), (2, {'Cat1': {'Item1': {'status': 'up'}}}))
+
+    def test_failed_transaction_is_discarded(self):
+        with self.assertRaises(RuntimeError):
+            with self.store.transaction() as txn:
+                txn.create_category('Cat1')
+                raise RuntimeError('boom')
+        self.assertEqual(self.store.read(), (0, {}))
+
+    def test_untouched_categories_are_shared(self):
+        with self.store.transaction() as txn:
+            txn.create_category('Cat1')
+            txn.create_category('Cat2')
+        before = self.store.snapshot()
+        with self.store.transaction() as txn:
+            txn.put_item('Cat1', 'Item1', {'status': 'up'})
+        after = self.store.snapshot()
+        self.assertIs(after['Cat2'], before['Cat2'])
+        self.assertEqual(before['Cat1'], {})
+
+    def test_changes_and_listeners(self):
+        calls = []
+        self.store.add_listener(lambda changes, reset: calls.append((changes, reset)))
+        with self.store.transaction() as txn:
+            txn.create_category('Cat1')
+            txn.delete_category('Cat1')
+        self.store.replace({'Cat2': {}})
+
+        self.assertEqual(calls, [
+            ([main_app.Change(1, 'Cat1', None, False), main_app.Change(2, 'Cat1', None, True)], False),
+            ([], True),
+        ])
+        self.assertIsNone(self.store.changes.changes_between(0, 3))
+        self.assertEqual(self.store.changes.changes_between(3, 3), [])
+
+    def test_concurrent_writers_and_readers(self):
+        """Hammers the store from several threads and checks no write is lost or seen half done."""
+        writers, items_per_writer = 8, 200
+        errors = []
+        done = threading.Event()
+
+        def write(writer):
+            category_name = f'Cat{writer}'
+            with self.store.transaction() as txn:
+                txn.create_category(category_name)
+            for i in range(items_per_writer):
+                with self.store.transaction() as txn:
+                    # Each item and its counter move together, so readers can check consistency.
+                    txn.put_item(category_name, f'Item{i}', {'status': 'up', 'message': str(i)})
+                    txn.put_item(category_name, 'count', {'status': 'up', 'message': str(i + 1)})
+
+        def read():
+            while not done.is_set():
+                version, data = self.store.read()
+                try:
+                    for category_name, items in data.items():
+                        count = int(items['count']['message']) if 'count' in items else 0
+                        if len(items) != (count + 1 if count else 0):
+                            errors.append(f'{category_name} at version {version}: {len(items)} items, count {count}')
+                except Exception as e:  # e.g. "dictionary changed size during iteration"
+                    errors.append(repr(e))
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(writers)]
+        for thread in readers + threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        version, data = self.store.read()
+        self.assertEqual(version, writers * (1 + 2 * items_per_writer))
+        self.assertEqual(len(data), writers)
+        for items in data.values():
+            self.assertEqual(len(items), items_per_writer + 1)
+
+
+class TestConcurrentRequests(unittest.TestCase):
+
+    def setUp(self):
+        main_app.app.testing = True
+        main_app.store.reset()
+
+    def test_parallel_updates_through_the_api(self):
+        """Concurrent upserts and reads through the routes all land and leave a consistent board."""
+        threads_count, updates = 8, 50
+        failures = []
+
+        def worker(n):
+            client = main_app.app.test_client()
+            for i in range(updates):
+                response = client.put(f'/api/categories/Cat{n % 2}/items/Item{n}?upsert=1',
+                                      json={'status': 'up', 'message': str(i)})
+                if response.status_code not in (200, 201):
+                    failures.append(response.status_code)
+                if client.get('/api/health').status_code != 200:
+                    failures.append('read')
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(failures, [])
+        data = main_app.app.test_client().get('/api/health').json
+        self.assertEqual(sorted(data), ['Cat0', 'Cat1'])
+        for n in range(threads_count):
+            self.assertEqual(data[f'Cat{n % 2}'][f'Item{n}']['message'], str(updates - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import os
+import sys
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+class TestHistoryStore(unittest.TestCase):
+
+    def test_ring_buffer_keeps_latest_transitions(self):
+        history = main_app.HistoryStore(capacity=3, max_bytes=1 << 20)
+        for i, status in enumerate(['up', 'down', 'up', 'down', 'warning']):
+            history.record('Cat1', 'Item1', status, timestamp=1700000000 + i)
+        entries = history.get('Cat1', 'Item1')
+        self.assertEqual([e['status'] for e in entries], ['up', 'down', 'warning'])
+        self.assertEqual(entries[0]['timestamp'], '2023-11-14T22:13:22.000000Z')
+
+    def test_unchanged_status_is_not_recorded(self):
+        history = main_app.HistoryStore(capacity=10, max_bytes=1 << 20)
+        for status in ['up', 'up', 'down', 'down', 'up']:
+            history.record('Cat1', 'Item1', status)
+        self.assertEqual([e['status'] for e in history.get('Cat1', 'Item1')], ['up', 'down', 'up'])
+
+    def test_statuses_outside_the_config_get_codes(self):
+        history = main_app.HistoryStore(capacity=10, max_bytes=1 << 20)
+        history.record('Cat1', 'Item1', 'ok')
+        history.record('Cat1', 'Item1', None)
+        self.assertEqual([e['status'] for e in history.get('Cat1', 'Item1')], ['ok', None])
+
+    def test_least_recently_used_histories_are_evicted(self):
+        entry_bytes = main_app.ItemHistory.OVERHEAD_BYTES + 9
+        history = main_app.HistoryStore(capacity=10, max_bytes=entry_bytes * 3)
+        for name in ('A', 'B', 'C'):
+            history.record('Cat1', name, 'up')
+        history.get('Cat1', 'A')  # Reading counts as a use
+        history.record('Cat1', 'D', 'up')
+
+        self.assertEqual(history.get('Cat1', 'B'), [])
+        self.assertEqual(len(history.get('Cat1', 'A')), 1)
+        self.assertEqual(history.stats()['evictions'], 1)
+        self.assertLessEqual(history.stats()['bytes'], entry_bytes * 3)
+
+    def test_forget_category(self):
+        history = main_app.HistoryStore(capacity=10, max_bytes=1 << 20)
+        history.record('Cat1', 'A', 'up')
+        history.record('Cat1', 'B', 'up')
+        history.record('Cat2', 'A', 'up')
+        history.forget('Cat1')
+        self.assertEqual(history.get('Cat1', 'A'), [])
+        self.assertEqual(history.stats()['items'], 1)
+
+
+class TestHistoryAPI(unittest.TestCase):
+
+    def setUp(self):
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.reset()
+
+    def _history(self, category='Cat1', item='Item1'):
+        response = self.client.get(f'/api/categories/{category}/items/{item}/history')
+        self.assertEqual(response.status_code, 200)
+        return [entry['status'] for entry in response.json['history']]
+
+    def test_transitions_are_recorded(self):
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        self.client.post('/api/categories/Cat1/items', json={'item_name': 'Item1'})
+        for status in ['up', 'up', 'down', 'up']:
+            self.client.put('/api/categories/Cat1/items/Item1', json={'status': status})
+        self.client.put('/api/categories/Cat1/items/Item1', json={'message': 'No status change'})
+        self.assertEqual(self._history(), ['unknown', 'up', 'down', 'up'])
+
+    def test_deleted_item_starts_over(self):
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'down'})
+        self.client.delete('/api/categories/Cat1/items/Item1')
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+        self.assertEqual(self._history(), ['up'])
+
+    def test_restore_records_restored_statuses(self):
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+        main_app.store.replace({'Cat1': {'Item1': {'status': 'failing'}}})
+        self.assertEqual(self._history(), ['up', 'failing'])
+
+    def test_transitions_are_recorded_at_update_time(self):
+        main_app.store.replace({'Cat1': {'Item1': {'status': 'failing', 'last_updated': '2023-11-14T22:13:20Z'}}})
+        with main_app.store.transaction() as txn:
+            txn.put_item('Cat1', 'Item2', main_app.Item('up', 1700000100.0))
+        history = self.client.get('/api/categories/Cat1/items/Item1/history').json['history']
+        self.assertEqual(history[0]['timestamp'], '2023-11-14T22:13:20.000000Z')
+        history = self.client.get('/api/categories/Cat1/items/Item2/history').json['history']
+        self.assertEqual(history[0]['timestamp'], '2023-11-14T22:15:00.000000Z')
+
+    def test_missing_item(self):
+        self.assertEqual(self.client.get('/api/categories/Nope/items/Item1/history').status_code, 404)
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        self.assertEqual(self.client.get('/api/categories/Cat1/items/Nope/history').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import os
+import sys
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+def _item(status, seconds):
+    return {'status': status, 'last_updated': main_app._format_timestamp(1700000000 + seconds), 'message': '', 'url': ''}
+
+
+class TestItemPages(unittest.TestCase):
+
+    def setUp(self):
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.replace({
+            'B': {'b1': _item('failing', 3), 'b2': _item('passing', 1)},
+            'A': {'a2': _item('unknown', 2), 'a1': _item('passing', 5)},
+            'C': {'c1': _item('down', 4)},
+        })
+
+    def _list(self, **params):
+        response = self.client.get('/api/items', query_string=params)
+        self.assertEqual(response.status_code, 200)
+        return response.json
+
+    def _all(self, **params):
+        """Follows next_cursor to the end; returns the (category, item) names in order."""
+        names = []
+        cursor = None
+        while True:
+            page = self._list(**params, **({'cursor': cursor} if cursor else {}))
+            names.extend((entry['category'], entry['item']) for entry in page['items'])
+            cursor = page['next_cursor']
+            if cursor is None:
+                return names
+
+    def test_sorted_by_category(self):
+        expected = [('A', 'a1'), ('A', 'a2'), ('B', 'b1'), ('B', 'b2'), ('C', 'c1')]
+        self.assertEqual(self._all(limit=2), expected)
+        self.assertEqual(self._all(limit=2, order='desc'), expected[::-1])
+
+    def test_sorted_by_status_severity(self):
+        names = self._all(sort='status', order='desc', limit=2)
+        self.assertEqual(names[:2], [('B', 'b1'), ('C', 'c1')])  # red: failing, then down
+        self.assertEqual(names[2], ('A', 'a2'))  # orange
+        self.assertEqual(sorted(names[3:]), [('A', 'a1'), ('B', 'b2')])
+
+    def test_sorted_by_last_updated(self):
+        self.assertEqual(self._all(sort='last_updated', limit=3),
+                         [('B', 'b2'), ('A', 'a2'), ('B', 'b1'), ('C', 'c1'), ('A', 'a1')])
+
+    def test_page_contents(self):
+        page = self._list(limit=1)
+        self.assertEqual(page['items'], [dict(_item('passing', 5), category='A', item='a1')])
+        self.assertEqual(page['version'], main_app._board_etag(main_app.store.version))
+
+    def test_pages_are_stable_while_the_board_changes(self):
+        first = self._list(limit=2)
+        with main_app.store.transaction() as txn:
+            txn.delete_item('A', 'a1')
+            txn.put_item('A', 'a0', _item('passing', 6))
+        second = self._list(limit=10, cursor=first['next_cursor'])
+        self.assertEqual([(e['category'], e['item']) for e in second['items']], [('B', 'b1'), ('B', 'b2'), ('C', 'c1')])
+        self.assertIsNone(second['next_cursor'])
+
+    def test_invalid_parameters(self):
+        cursor = self._list(limit=1)['next_cursor']
+        for params in ({'sort': 'message'}, {'order': 'up'}, {'limit': 0}, {'limit': 'all'},
+                       {'cursor': 'garbage'}, {'cursor': cursor, 'sort': 'status'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get('/api/items', query_string=params).status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import json
+import os
+import sys
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+Item = main_app.Item
+
+
+class TestItem(unittest.TestCase):
+
+    def test_reads_like_a_dict(self):
+        item = Item('passing', 1672574400.0, 'Green', 'http://ci.example.com')
+        expected = {'status': 'passing', 'last_updated': '2023-01-01T12:00:00Z',
+                    'message': 'Green', 'url': 'http://ci.example.com'}
+        self.assertEqual(item, expected)
+        self.assertEqual(dict(item), expected)
+        self.assertEqual(list(item), ['status', 'last_updated', 'message', 'url'])
+        self.assertEqual(item.get('ttl', 'none'), 'none')
+        self.assertNotIn('ttl', item)
+        with self.assertRaises(KeyError):
+            item['nope']
+
+    def test_last_updated_is_formatted_once(self):
+        item = Item('up', 1700000000.25)
+        self.assertEqual(item['last_updated'], '2023-11-14T22:13:20.250000Z')
+        self.assertIs(item['last_updated'], item['last_updated'])
+
+    def test_from_mapping_keeps_what_it_was_given(self):
+        for mapping in ({'status': 'ok'},
+                        {'status': 'up', 'last_updated': '2023-11-14T22:13:20.000000Z', 'message': '', 'url': '', 'extra': [1]},
+                        {'status': None, 'last_updated': None, 'ttl': 30},
+                        {'last_updated': 'yesterday'}):
+            with self.subTest(mapping=mapping):
+                item = Item.from_mapping(mapping)
+                self.assertEqual(item, mapping)
+                self.assertEqual(len(item), len(mapping))
+                self.assertEqual(json.loads(json.dumps(item, default=main_app._json_default)), mapping)
+        self.assertEqual(Item.from_mapping({'last_updated': '2023-01-01T12:00:00Z'}).updated, 1672574400.0)
+
+    def test_replace(self):
+        item = Item.from_mapping({'status': 'up', 'last_updated': '2023-01-01T12:00:00Z', 'message': 'a', 'url': ''})
+        changed = item.replace(status='down', updated=1672574401.5, ttl=60)
+        self.assertEqual(changed, {'status': 'down', 'last_updated': '2023-01-01T12:00:01.500000Z',
+                                   'message': 'a', 'url': '', 'ttl': 60})
+        self.assertEqual(item['status'], 'up')
+        self.assertNotIn('ttl', changed.replace(ttl=None))
+        with self.assertRaises(TypeError):
+            item.replace(colour='red')
+
+    def test_store_keeps_items_compact(self):
+        main_app.store.replace({'Cat1': {'Item1': {'status': 'up', 'last_updated': None, 'message': '', 'url': ''}}})
+        with main_app.store.transaction() as txn:
+            txn.put_item('Cat1', 'Item2', {'status': 'down'})
+        for item in main_app.store.snapshot()['Cat1'].values():
+            self.assertIsInstance(item, Item)
+        self.assertFalse(hasattr(main_app.store.snapshot()['Cat1']['Item1'], '__dict__'))
+
+
+if __name__ == '__main__':
+    unittest.main()
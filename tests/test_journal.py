@@ -0,0 +1,196 @@
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+ITEM = {'status': 'up', 'last_updated': None, 'message': '', 'url': ''}
+
+
+class _FullDisk:
+    """Wraps the journal file: the next write stores half its data and then fails."""
+
+    def __init__(self, f):
+        self.f = f
+        self.failing = True
+
+    def write(self, data):
+        if self.failing:
+            self.failing = False
+            self.f.write(data[:len(data) // 2])
+            raise OSError(28, 'No space left on device')
+        return self.f.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.f, name)
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'board.journal')
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        shutil.rmtree(self.tmpdir)
+
+    def _open(self, **kwargs):
+        """Starts a store from the journal, like a server restart would."""
+        store = main_app.HealthStore(change_log_size=100)
+        store.open_journal(main_app.Journal(self.path, **kwargs))
+        self.stores.append(store)
+        return store
+
+    def _restart(self, store, **kwargs):
+        store.close()
+        return self._open(**kwargs)
+
+    def _populate(self, store):
+        with store.transaction() as txn:
+            txn.create_category('Cat1')
+            txn.put_item('Cat1', 'Item1', ITEM)
+        with store.transaction() as txn:
+            txn.put_item('Cat1', 'Item2', dict(ITEM, status='down'))
+            txn.delete_item('Cat1', 'Item1')
+        with store.transaction() as txn:
+            txn.create_category('Cat2')
+            txn.delete_category('Cat2')
+        with store.transaction() as txn:
+            txn.put_item('Cat1', 'Item3', ITEM)
+            txn.delete_item('Cat1', 'Item3')
+            txn.put_item('Cat1', 'Item3', dict(ITEM, message='again'))
+
+    def test_replay_restores_board_and_version(self):
+        store = self._open(fsync='always')
+        self._populate(store)
+        expected = store.read()
+
+        restarted = self._restart(store)
+        self.assertEqual(restarted.read(), expected)
+        with restarted.transaction() as txn:
+            txn.create_category('Cat3')
+        self.assertEqual(restarted.version, expected[0] + 1)
+        self.assertEqual(self._restart(restarted).snapshot(), {'Cat1': {'Item2': dict(ITEM, status='down'), 'Item3': dict(ITEM, message='again')}, 'Cat3': {}})
+
+    def test_replace_is_journaled(self):
+        store = self._open()
+        self._populate(store)
+        store.replace({'Restored': {'Item': ITEM}})
+        self.assertEqual(self._restart(store).read(), (10, {'Restored': {'Item': ITEM}}))
+
+    def test_always_policy_writes_before_returning(self):
+        store = self._open(fsync='always')
+        with patch('app.app.os.fsync') as fsync:
+            with store.transaction() as txn:
+                txn.create_category('Cat1')
+            self.assertTrue(fsync.called)
+        with open(self.path) as f:
+            self.assertEqual(json.loads(f.readline()), {'version': 1, 'changes': [['Cat1', None, False, None]]})
+
+    def test_never_policy_does_not_fsync(self):
+        store = self._open(fsync='never')
+        with patch('app.app.os.fsync') as fsync:
+            self._populate(store)
+            store.journal.flush()
+            fsync.assert_not_called()
+        self.assertGreater(os.path.getsize(self.path), 0)
+
+    def test_torn_last_record_is_ignored(self):
+        store = self._open()
+        self._populate(store)
+        expected = store.read()
+        store.close()
+        with open(self.path, 'ab') as f:
+            f.write(b'{"version": 10, "chan')
+        self.assertEqual(self._open().read(), expected)
+
+    def test_compaction(self):
+        store = self._open()
+        self._populate(store)
+        store.journal.compact()
+        with store.transaction() as txn:
+            txn.create_category('After')
+        store.journal.flush()
+        expected = store.read()
+
+        with open(store.journal.checkpoint_path) as f:
+            self.assertEqual(json.load(f)['version'], 9)
+        with open(self.path) as f:
+            self.assertEqual([json.loads(line)['version'] for line in f], [10])
+        self.assertEqual(self._restart(store).read(), expected)
+
+    def test_compaction_runs_in_background_past_threshold(self):
+        store = self._open(compact_bytes=2000)
+        with store.transaction() as txn:
+            txn.create_category('Cat1')
+        for i in range(50):
+            with store.transaction() as txn:
+                txn.put_item('Cat1', f'Item{i}', ITEM)
+        store.journal.flush()
+        deadline = time.monotonic() + 5
+        while not os.path.exists(store.journal.checkpoint_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(os.path.exists(store.journal.checkpoint_path))
+        expected = store.read()
+        self.assertEqual(self._restart(store).read(), expected)
+
+    def test_failed_write_is_reported_and_recovered_from(self):
+        store = self._open(fsync='always')
+        with store.transaction() as txn:
+            txn.create_category('Cat1')
+        store.journal._file = _FullDisk(store.journal._file)
+        with patch.object(main_app.app.logger, 'error') as log:
+            with self.assertRaises(IOError):
+                with store.transaction() as txn:
+                    txn.put_item('Cat1', 'Item1', ITEM)
+        self.assertIn('No space left on device', log.call_args.args[0])
+        self.assertEqual(store.journal.status()['error'], '[Errno 28] No space left on device')
+        self.assertEqual(store.journal.status()['failed_writes'], 1)
+        # The torn record was cut off again.
+        with open(self.path) as f:
+            self.assertEqual([json.loads(line)['version'] for line in f], [1])
+
+        with store.transaction() as txn:
+            txn.put_item('Cat1', 'Item2', ITEM)
+        self.assertIsNone(store.journal.status()['error'])
+        # A compaction makes the checkpoint cover the lost record.
+        store.journal._compaction.join()
+        with store.transaction() as txn:
+            txn.create_category('Cat2')
+        expected = store.read()
+        self.assertEqual(self._restart(store).read(), expected)
+
+    def test_failed_write_is_reported_with_interval_policy(self):
+        store = self._open()
+        store.journal._file = _FullDisk(store.journal._file)
+        store.journal.append({"version": 1, "changes": [['Cat1', None, False, None]]})
+        with patch.object(main_app.app.logger, 'error'):
+            with self.assertRaises(IOError):
+                store.journal.flush()
+        self.assertIsNotNone(store.journal.status()['error'])
+
+    def test_status_endpoint(self):
+        main_app.app.testing = True
+        store = self._open()
+        with patch.object(main_app, 'store', store):
+            status = main_app.app.test_client().get('/api/checkpoint').json['journal']
+        self.assertEqual((status['path'], status['fsync'], status['error']), (self.path, 'interval', None))
+
+    def test_invalid_fsync_policy(self):
+        with self.assertRaises(ValueError):
+            main_app.Journal(self.path, fsync='sometimes')
+
+
+if __name__ == '__main__':
+    unittest.main()
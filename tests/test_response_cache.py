@@ -0,0 +1,111 @@
+import unittest
+import gzip
+import json
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_builds_once_per_version(self):
+        cache = main_app.ResponseCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return 1, b'{}'
+
+        first = cache.get(1, 'full', build)
+        second = cache.get(1, 'full', build)
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+
+        cache.invalidate()
+        cache.get(1, 'full', build)
+        self.assertEqual(len(calls), 2)
+
+    def test_new_version_rebuilds(self):
+        cache = main_app.ResponseCache()
+        cache.get(1, 'full', lambda: (1, b'one'))
+        entry = cache.get(2, 'full', lambda: (2, b'two'))
+        self.assertEqual((entry.version, entry.body), (2, b'two'))
+
+    def test_gzip_is_built_lazily_and_skipped_for_small_bodies(self):
+        cache = main_app.ResponseCache()
+        body = json.dumps({"x": "y" * main_app.GZIP_MIN_SIZE}).encode('utf-8')
+        entry = cache.get(1, 'full', lambda: (1, body))
+        self.assertIsNone(entry.gzipped)
+        entry = cache.get(1, 'full', lambda: (1, body), want_gzip=True)
+        self.assertEqual(gzip.decompress(entry.gzipped), body)
+
+        small = cache.get(1, 'small', lambda: (1, b'{}'), want_gzip=True)
+        self.assertIsNone(small.gzipped)
+
+    def test_concurrent_readers_share_one_build(self):
+        cache = main_app.ResponseCache()
+        calls = []
+        release = threading.Event()
+
+        def build():
+            calls.append(1)
+            release.wait(5)
+            return 1, b'{}'
+
+        threads = [threading.Thread(target=cache.get, args=(1, 'full', build)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+
+
+class TestCachedReadEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        """Set up for each test."""
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.reset()
+        main_app.health_cache.invalidate()
+
+    def test_health_served_from_cache_until_mutation(self):
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+        with patch('app.app._encode_json', wraps=main_app._encode_json) as encode:
+            first = self.client.get('/api/health')
+            second = self.client.get('/api/health')
+            self.assertEqual(encode.call_count, 1)
+            self.assertEqual(first.data, second.data)
+            self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+
+            self.client.put('/api/categories/Cat1/items/Item1', json={'status': 'down'})
+            third = self.client.get('/api/health')
+            self.assertEqual(encode.call_count, 2)
+        self.assertEqual(third.json['Cat1']['Item1']['status'], 'down')
+
+    def test_health_gzip(self):
+        for i in range(50):
+            self.client.put(f'/api/categories/Cat1/items/Item{i}?upsert=1', json={'status': 'up', 'message': 'ok'})
+
+        response = self.client.get('/api/health', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertEqual(json.loads(gzip.decompress(response.data)), main_app.store.snapshot())
+
+        plain = self.client.get('/api/health', headers={'Accept-Encoding': 'gzip;q=0'})
+        self.assertNotIn('Content-Encoding', plain.headers)
+        self.assertEqual(plain.json, main_app.store.snapshot())
+
+    def test_status_config_cached(self):
+        with patch('app.app._encode_json', wraps=main_app._encode_json) as encode:
+            for _ in range(3):
+                self.assertEqual(self.client.get('/api/status-config').json, main_app.STATUS_CONFIG)
+        self.assertLessEqual(encode.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import unittest
+import os
+import sys
+import tracemalloc
+from unittest.mock import patch
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+Change = main_app.Change
+
+# A start time on a bucket boundary of every window.
+T0 = 7 * 24 * 3600 * 2800
+
+
+class TestRollupStore(unittest.TestCase):
+
+    def setUp(self):
+        self.now = T0
+        self.rollups = main_app.RollupStore(clock=lambda: self.now)
+        self.data = {}
+        self.version = 0
+
+    def _put(self, category_name, item_name, status):
+        changes = []
+        if category_name not in self.data:
+            self.data[category_name] = {}
+            changes.append((category_name, None, False))
+        self.data[category_name][item_name] = {'status': status}
+        changes.append((category_name, item_name, False))
+        self._notify(changes)
+
+    def _delete(self, category_name, item_name=None):
+        if item_name is None:
+            del self.data[category_name]
+        else:
+            del self.data[category_name][item_name]
+        self._notify([(category_name, item_name, True)])
+
+    def _notify(self, changes):
+        numbered = []
+        for category_name, item_name, deleted in changes:
+            self.version += 1
+            numbered.append(Change(self.version, category_name, item_name, deleted))
+        self.rollups.on_change(numbered, False, self.data)
+
+    def test_item_uptime(self):
+        self._put('Cat1', 'Item1', 'up')
+        self.now += 1800
+        self._put('Cat1', 'Item1', 'down')
+        self.now += 1800
+
+        rollup = self.rollups.item_rollup('Cat1', 'Item1')
+        self.assertEqual(rollup['24h']['uptime'], 50.0)
+        self.assertEqual(rollup['24h']['seconds'], {'green': 1800.0, 'none': 0.0, 'orange': 0.0, 'red': 1800.0})
+        self.assertEqual(rollup['7d']['tracked_seconds'], 3600.0)
+        # The 1h window is accurate to one 2-minute bucket.
+        self.assertAlmostEqual(rollup['1h']['uptime'], 50.0, delta=100 * 120 / 3600)
+
+    def test_old_time_leaves_the_window(self):
+        self._put('Cat1', 'Item1', 'down')
+        self.now += 3600
+        self._put('Cat1', 'Item1', 'passing')
+        self.now += 2 * 3600
+        rollup = self.rollups.item_rollup('Cat1', 'Item1')
+        self.assertEqual(rollup['1h']['uptime'], 100.0)
+        self.assertAlmostEqual(rollup['24h']['uptime'], 100 * 2 / 3, places=3)
+
+    def test_category_uptime_weighs_items(self):
+        self._put('Cat1', 'Green', 'running')
+        self._put('Cat1', 'Red', 'failing')
+        self.now += 600
+        self._delete('Cat1', 'Red')
+        self.now += 600
+
+        rollup = self.rollups.category_rollup('Cat1')
+        self.assertEqual(rollup['24h']['seconds']['green'], 1200.0)
+        self.assertEqual(rollup['24h']['seconds']['red'], 600.0)
+        self.assertAlmostEqual(rollup['24h']['uptime'], 100 * 1200 / 1800, places=3)
+
+    def test_statuses_are_classified_by_color(self):
+        self._put('Cat1', 'Item1', 'unknown')
+        self._put('Cat1', 'Item2', 'not-configured')
+        self.now += 60
+        seconds = self.rollups.category_rollup('Cat1')['24h']['seconds']
+        self.assertEqual(seconds['orange'], 60.0)
+        self.assertEqual(seconds['none'], 60.0)
+        self.assertEqual(self.rollups.category_rollup('Cat1')['24h']['uptime'], 0.0)
+
+    def test_deleted_category_is_dropped(self):
+        self._put('Cat1', 'Item1', 'up')
+        self._delete('Cat1')
+        self.assertIsNone(self.rollups.category_rollup('Cat1'))
+        self.assertIsNone(self.rollups.item_rollup('Cat1', 'Item1'))
+
+    def test_nothing_tracked_yet(self):
+        self._put('Cat1', 'Item1', 'up')
+        self.assertIsNone(self.rollups.item_rollup('Cat1', 'Item1')['1h']['uptime'])
+
+
+class TestUptimeAccumulator(unittest.TestCase):
+
+    def _bytes_per_accumulator(self, *colors):
+        tracemalloc.start()
+        accumulators = []
+        for _ in range(1000):
+            accumulator = main_app.UptimeAccumulator(T0)
+            for minutes, color in enumerate(colors):
+                accumulator.set_counts(T0 + 60 * minutes, [int(index == color) for index in range(len(main_app.ROLLUP_COLORS))])
+            accumulators.append(accumulator)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return size / len(accumulators)
+
+    def test_rings_are_allocated_on_use(self):
+        slots = len(main_app.ROLLUP_WINDOWS) * main_app.ROLLUP_BUCKETS
+        # An item that never changed status has no rings at all.
+        self.assertLess(self._bytes_per_accumulator(0), 512)
+        # One that changed once has the slot ids and a ring for the color it left.
+        self.assertLess(self._bytes_per_accumulator(0, 1), 2 * 8 * slots + 512)
+
+    def test_ring_of_a_new_color_starts_empty(self):
+        green, red = main_app._COLOR_INDEX['green'], main_app._COLOR_INDEX['red']
+        accumulator = main_app.UptimeAccumulator(T0)
+        accumulator.adjust(T0, green, 1)
+        accumulator.set_counts(T0 + 30, [int(index == red) for index in range(len(main_app.ROLLUP_COLORS))])
+        accumulator.set_counts(T0 + 60, [int(index == green) for index in range(len(main_app.ROLLUP_COLORS))])
+        seconds = accumulator.rollup(T0 + 60)['1h']['seconds']
+        self.assertEqual((seconds['green'], seconds['red']), (30.0, 30.0))
+
+
+class TestRollupAPI(unittest.TestCase):
+
+    def setUp(self):
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        self.now = T0
+        patcher = patch.object(main_app.rollups, 'clock', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        main_app.store.reset()
+
+    def test_rollup_endpoints(self):
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+        self.client.put('/api/categories/Cat1/items/Item2?upsert=1', json={'status': 'up'})
+        self.now += 300
+        self.client.put('/api/categories/Cat1/items/Item2', json={'status': 'down'})
+        self.now += 300
+
+        response = self.client.get('/api/rollups')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['windows'], ['1h', '24h', '7d'])
+        self.assertEqual(response.json['categories']['Cat1']['24h']['uptime'], 75.0)
+
+        response = self.client.get('/api/rollups/Cat1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['category']['24h']['uptime'], 75.0)
+        self.assertEqual(response.json['items']['Item1']['24h']['uptime'], 100.0)
+        self.assertEqual(response.json['items']['Item2']['24h']['uptime'], 50.0)
+
+    def test_unknown_category(self):
+        self.assertEqual(self.client.get('/api/rollups/Nope').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
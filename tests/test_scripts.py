@@ -14,23 +14,18 @@ class TestShellScriptsSimulated(unittest.TestCase):
         """Set up for each test."""
         main_app.app.testing = True
         self.client = main_app.app.test_client()
-        main_app.health_data.clear()
-
-        # Patch datetime.datetime within the 'app' module's scope
-        self.patcher_datetime = patch('app.app.datetime.datetime')
-        self.mocked_datetime_class = self.patcher_datetime.start()
-
-        # Configure the mock for the chain: datetime.datetime.utcnow().isoformat()
-        self.mocked_datetime_class.utcnow.return_value.isoformat.return_value = "2023-01-01T12:00:00"
+        main_app.store.reset()
 
+        # Pin the clock of every write to 2023-01-01T12:00:00Z
+        self.patcher_clock = patch('app.app._utc_timestamp', return_value=1672574400.0)
+        self.patcher_clock.start()
 
     def tearDown(self):
         """Clean up after each test."""
-        self.patcher_datetime.stop()
+        self.patcher_clock.stop()
 
     def _get_expected_timestamp(self):
-        # Access the configured return value through the mocked class structure
-        return self.mocked_datetime_class.utcnow.return_value.isoformat.return_value + 'Z'
+        return "2023-01-01T12:00:00Z"
 
     def simulate_setup_dashboard_sh(self):
         """Simulates the actions of setup_dashboard.sh using the test client."""
@@ -75,7 +70,7 @@ class TestShellScriptsSimulated(unittest.TestCase):
         """Test the state of health_data after simulating setup_dashboard.sh."""
         self.simulate_setup_dashboard_sh()
 
-        health = main_app.health_data
+        health = main_app.store.snapshot()
         self.assertIn("Builds", health)
         self.assertIn("Main Build", health["Builds"])
         self.assertEqual(health["Builds"]["Main Build"]["status"], "unknown")
@@ -100,7 +95,7 @@ class TestShellScriptsSimulated(unittest.TestCase):
         self.simulate_setup_dashboard_sh()
         self.simulate_update_status_examples_sh()
 
-        health = main_app.health_data
+        health = main_app.store.snapshot()
         ts = self._get_expected_timestamp() # Timestamp of the update operations
 
         self.assertEqual(health["Builds"]["Main Build"]["status"], "passing")
@@ -6,12 +6,9 @@ class TestSecurityValidation(unittest.TestCase):
     def setUp(self):
         self.app = app.test_client()
         self.app.testing = True
-        # Clear health_data before each test if possible, or just rely on new names.
-        # Since `health_data` is global in app.py, tests might interfere if not careful.
-        # Ideally, I would reset it, but `app.py` doesn't expose a reset function easily
-        # without restarting or importing the global. Let's just import it and clear it.
-        from app.app import health_data
-        health_data.clear()
+        # The board is global in app.py, so empty it to keep tests independent.
+        from app.app import store
+        store.reset()
 
     def test_create_category_valid(self):
         response = self.app.post('/api/categories', json={'category_name': 'Valid_Name-123'})
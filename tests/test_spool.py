@@ -0,0 +1,161 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch, Mock
+import requests
+from click.testing import CliRunner
+import health_board
+from health_board_api import HealthBoard, UpdateSpool
+
+
+def _update(item, **fields):
+    return dict({"op": "update", "category": "Cat1", "item": item, "upsert": True}, **fields)
+
+
+def _accept_all(operations):
+    return {"results": [{"status_code": 200, "body": {}} for _ in operations]}
+
+
+def _refused(body=None):
+    response = Mock(status_code=400)
+    response.json.return_value = body or {"error": "Missing operations list in request body"}
+    return requests.exceptions.HTTPError(response=response)
+
+
+class SpoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.path = os.path.join(self.temp_dir, 'updates.spool')
+
+
+class TestUpdateSpool(SpoolTestCase):
+
+    def test_replay_sends_latest_per_item(self):
+        spool = UpdateSpool(self.path)
+        spool.append(_update('Item1', status='up', message='Started'))
+        spool.append(_update('Item2', status='up'))
+        spool.append(_update('Item1', status='down'))
+        self.assertEqual(spool.pending(), [_update('Item1', status='down', message='Started'), _update('Item2', status='up')])
+
+        board = Mock()
+        board.batch.side_effect = _accept_all
+        self.assertTrue(spool.replay(board))
+        board.batch.assert_called_once_with([_update('Item1', status='down', message='Started'), _update('Item2', status='up')])
+        self.assertEqual(spool.sent, 2)
+        self.assertEqual(spool.pending_bytes(), 0)
+
+    def test_failed_replay_keeps_updates(self):
+        spool = UpdateSpool(self.path)
+        spool.append(_update('Item1', status='up'))
+        board = Mock()
+        board.batch.side_effect = requests.exceptions.ConnectionError()
+        self.assertFalse(spool.replay(board))
+        # The spool survives the process.
+        self.assertEqual(UpdateSpool(self.path).pending(), [_update('Item1', status='up')])
+
+    @patch.object(UpdateSpool, 'REPLAY_BATCH_SIZE', 2)
+    def test_refused_batch_is_dropped_and_replay_goes_on(self):
+        spool = UpdateSpool(self.path)
+        for i in range(4):
+            spool.append(_update(f'Item{i}', status='up'))
+        board = Mock()
+        board.batch.side_effect = [_refused(), _accept_all([None, None])]
+        self.assertTrue(spool.replay(board))
+        self.assertEqual([op['item'] for op in board.batch.call_args.args[0]], ['Item2', 'Item3'])
+        self.assertEqual((spool.sent, spool.dropped), (2, 2))
+        self.assertEqual(spool.pending_bytes(), 0)
+
+    def test_invalid_updates_are_dropped_and_the_rest_sent(self):
+        spool = UpdateSpool(self.path)
+        for item, status in (('Item1', 'up'), ('Item2', 'bogus'), ('Item3', 'down')):
+            spool.append(_update(item, status=status))
+        board = Mock()
+        board.batch.side_effect = [
+            _refused({"error": "Batch rejected; no operations were applied",
+                      "errors": [{"index": 1, "error": "Invalid status"}]}),
+            _accept_all([None, None]),
+        ]
+        self.assertTrue(spool.replay(board))
+        self.assertEqual(board.batch.call_args.args[0], [_update('Item1', status='up'), _update('Item3', status='down')])
+        self.assertEqual((spool.sent, spool.dropped), (2, 1))
+
+    def test_size_cap_compacts_then_drops(self):
+        line_bytes = len(UpdateSpool._encode(_update('Item1', status='down')))
+        spool = UpdateSpool(self.path, max_bytes=line_bytes * 2)
+        for status in ('up', 'down', 'up', 'down'):
+            self.assertTrue(spool.append(_update('Item1', status=status)))
+        self.assertTrue(spool.append(_update('Item2', status='down')))
+        self.assertFalse(spool.append(_update('Item3', status='down')))
+        self.assertEqual(spool.dropped, 1)
+        self.assertLessEqual(spool.pending_bytes(), line_bytes * 2)
+        self.assertEqual([op['item'] for op in spool.pending()], ['Item1', 'Item2'])
+
+    def test_torn_lines_are_skipped(self):
+        spool = UpdateSpool(self.path)
+        spool.append(_update('Item1', status='up'))
+        with open(self.path, 'ab') as f:
+            f.write(b'{"op": "update", "cat')
+        self.assertEqual(spool.pending(), [_update('Item1', status='up')])
+
+
+@patch('time.sleep')
+@patch('requests.Session.request')
+class TestHealthBoardSpool(SpoolTestCase):
+
+    def _response(self, status_code=200, json_data=None):
+        response = Mock(status_code=status_code, headers={})
+        response.json.return_value = json_data if json_data is not None else {}
+        if status_code >= 400:
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+        return response
+
+    def test_unreachable_board_spools_and_replays(self, mock_request, mock_sleep):
+        board = HealthBoard("http://mock-api.com", spool=self.path, retries=0)
+        mock_request.side_effect = requests.exceptions.ConnectionError()
+        self.assertEqual(board.update_item('Cat1', 'Item1', status='down'), {"message": "Board unreachable. Update spooled."})
+        # Further updates are spooled without contacting the board until the retry time.
+        board.update_item('Cat1', 'Item1', status='up', message='Back')
+        board.update_item('Cat1', 'Item2', status='up')
+        self.assertEqual(mock_request.call_count, 1)
+
+        board._spool_retry_at = 0
+        mock_request.side_effect = lambda method, url, json=None, **kwargs: self._response(json_data=_accept_all(json['operations']))
+        self.assertEqual(board.update_item('Cat1', 'Item3', status='up'), {"message": "Update sent with the spooled updates."})
+        mock_request.assert_called_with('POST', "http://mock-api.com/batch", json={"operations": [
+            _update('Item1', status='up', message='Back'), _update('Item2', status='up'), _update('Item3', status='up')]})
+        self.assertEqual(board.spool.pending_bytes(), 0)
+
+        mock_request.side_effect = None
+        mock_request.return_value = self._response()
+        board.update_item('Cat1', 'Item1', status='up')
+        mock_request.assert_called_with('PUT', "http://mock-api.com/categories/Cat1/items/Item1",
+                                        json={'status': 'up'}, params={'upsert': 1})
+
+    def test_rejected_updates_are_not_spooled(self, mock_request, mock_sleep):
+        board = HealthBoard("http://mock-api.com", spool=self.path)
+        mock_request.return_value = self._response(400)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            board.update_item('Cat1', 'Item1', status='bogus')
+        self.assertEqual(board.spool.pending_bytes(), 0)
+
+    def test_cli(self, mock_request, mock_sleep):
+        runner = CliRunner()
+        mock_request.side_effect = requests.exceptions.ConnectionError()
+        result = runner.invoke(health_board.board, ['--spool', self.path, 'update', 'Cat1', 'Item1', '--status', 'up'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Update spooled", result.output)
+
+        result = runner.invoke(health_board.board, ['--spool', self.path, 'replay'])
+        self.assertIn("1 update(s) still spooled", result.output)
+
+        mock_request.side_effect = lambda method, url, json=None, **kwargs: self._response(json_data=_accept_all(json['operations']))
+        result = runner.invoke(health_board.board, ['replay'], env={'HEALTH_BOARD_SPOOL': self.path})
+        self.assertIn("Sent 1 spooled update(s).", result.output)
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+class TestSQLiteHealthStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'board.db')
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        shutil.rmtree(self.tmpdir)
+
+    def _open(self, change_log_size=100):
+        """Opens the database like one more server worker would."""
+        store = main_app.SQLiteHealthStore(self.path, change_log_size)
+        self.stores.append(store)
+        return store
+
+    def _populate(self, store):
+        with store.transaction() as txn:
+            txn.create_category('Cat1')
+            txn.put_item('Cat1', 'Item1', {'status': 'up', 'last_updated': None, 'message': 'ok', 'url': ''})
+            txn.create_category('Cat2')
+
+    def test_board_survives_reopening(self):
+        store = self._open()
+        self._populate(store)
+        store.close()
+
+        reopened = self._open()
+        self.assertEqual(reopened.read(), store.read())
+        self.assertEqual(reopened.board_id, store.board_id)
+        self.assertEqual(self._open().snapshot()['Cat1']['Item1']['status'], 'up')
+
+    def test_item_ttl_is_stored(self):
+        store = self._open()
+        with store.transaction() as txn:
+            txn.create_category('Cat1')
+            txn.put_item('Cat1', 'Item1', {'status': 'up', 'last_updated': None, 'message': '', 'url': '', 'ttl': 60.0})
+        self.assertEqual(self._open().snapshot()['Cat1']['Item1']['ttl'], 60.0)
+        self.assertNotIn('ttl', self._open().snapshot()['Cat1'].get('Item2', {}))
+
+    def test_workers_see_each_others_writes(self):
+        first, second = self._open(), self._open()
+        calls = []
+        second.add_listener(lambda changes, reset: calls.append((changes, reset)))
+
+        self._populate(first)
+        self.assertEqual(second.read(), first.read())
+        self.assertEqual([c.version for c in calls[0][0]], [1, 2, 3])
+        self.assertFalse(calls[0][1])
+
+        with second.transaction() as txn:
+            txn.delete_item('Cat1', 'Item1')
+        self.assertEqual(first.snapshot(), {'Cat1': {}, 'Cat2': {}})
+        self.assertEqual(first.changes.changes_between(2, 4),
+                         [main_app.Change(4, 'Cat1', 'Item1', True), main_app.Change(3, 'Cat2', None, False)])
+
+    def test_category_deleted_and_recreated_in_one_transaction(self):
+        store = self._open()
+        self._populate(store)
+        with store.transaction() as txn:
+            txn.delete_category('Cat1')
+            txn.create_category('Cat1')
+            txn.put_item('Cat1', 'Item2', {'status': 'down', 'last_updated': None, 'message': '', 'url': ''})
+        self.assertEqual(list(self._open().snapshot()['Cat1']), ['Item2'])
+
+    def test_failed_transaction_writes_nothing(self):
+        store = self._open()
+        with self.assertRaises(RuntimeError):
+            with store.transaction() as txn:
+                txn.create_category('Cat1')
+                raise RuntimeError('boom')
+        self.assertEqual(self._open().read(), (0, {}))
+        self._populate(store)  # The store is still usable afterwards
+        self.assertEqual(store.version, 3)
+
+    def test_lagging_worker_reloads_in_full(self):
+        first, second = self._open(change_log_size=2), self._open(change_log_size=2)
+        calls = []
+        second.add_listener(lambda changes, reset: calls.append(reset))
+        self._populate(first)
+        self.assertIsNone(second.changes.changes_between(0, 3))
+        self.assertEqual(second.read(), first.read())
+        self.assertEqual(calls, [True])
+
+    def test_replace_reaches_other_workers(self):
+        first, second = self._open(), self._open()
+        self._populate(first)
+        second.read()
+        first.replace({'Restored': {}})
+        self.assertEqual(second.read(), (4, {'Restored': {}}))
+        self.assertIsNone(second.changes.changes_between(3, 4))
+
+    def test_concurrent_writers_in_two_workers(self):
+        first, second = self._open(), self._open()
+        per_thread = 50
+
+        def write(store, category_name):
+            with store.transaction() as txn:
+                txn.create_category(category_name)
+            for i in range(per_thread):
+                with store.transaction() as txn:
+                    txn.put_item(category_name, f'Item{i}', {'status': 'up', 'last_updated': None,
+                                                             'message': str(i), 'url': ''})
+
+        threads = [threading.Thread(target=write, args=(store, f'Cat{n}'))
+                   for n, store in enumerate([first, second, first, second])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(first.read(), second.read())
+        self.assertEqual(first.version, 4 * (per_thread + 1))
+        self.assertEqual(self._open().snapshot(), first.snapshot())
+
+
+class TestCreateStore(unittest.TestCase):
+
+    def test_unknown_backend_is_rejected(self):
+        original = main_app.STORAGE_BACKEND
+        main_app.STORAGE_BACKEND = 'redis'
+        try:
+            with self.assertRaises(RuntimeError):
+                main_app.create_store()
+        finally:
+            main_app.STORAGE_BACKEND = original
+
+
+if __name__ == '__main__':
+    unittest.main()
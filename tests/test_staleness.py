@@ -0,0 +1,116 @@
+import unittest
+import os
+import sys
+import time
+from unittest.mock import patch
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+class TestStaleness(unittest.TestCase):
+
+    def setUp(self):
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        self.now = time.time()
+        patcher = patch.object(main_app.staleness, 'clock', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        main_app.store.reset()
+
+    def _put(self, item, **payload):
+        return self.client.put(f'/api/categories/Cat1/items/{item}?upsert=1', json=payload)
+
+    def _status(self, item):
+        return main_app.store.snapshot()['Cat1'][item]['status']
+
+    def test_expired_item_becomes_unknown(self):
+        self._put('Item1', status='up', ttl=60)
+        self._put('Item2', status='up')
+        self.now += 30
+        main_app.staleness.expire()
+        self.assertEqual(self._status('Item1'), 'up')
+
+        self.now += 31
+        main_app.staleness.expire()
+        self.assertEqual(self._status('Item1'), 'unknown')
+        self.assertEqual(self._status('Item2'), 'up')
+        self.assertIsNotNone(main_app.store.snapshot()['Cat1']['Item1']['last_updated'])
+
+    def test_update_pushes_the_deadline_back(self):
+        self._put('Item1', status='up', ttl=60)
+        self.now += 50
+        with patch.object(main_app, '_utc_timestamp', return_value=self.now):
+            self._put('Item1', message='still here')
+        self.now += 50
+        main_app.staleness.expire()
+        self.assertEqual(self._status('Item1'), 'up')
+
+    def test_ttl_can_be_cleared(self):
+        self._put('Item1', status='up', ttl=60)
+        self._put('Item1', ttl=None)
+        self.assertNotIn('ttl', main_app.store.snapshot()['Cat1']['Item1'])
+        self.now += 120
+        main_app.staleness.expire()
+        self.assertEqual(self._status('Item1'), 'up')
+
+    def test_invalid_ttl(self):
+        for ttl in (-1, 'soon', True):
+            with self.subTest(ttl=ttl):
+                self.assertEqual(self._put('Item1', status='up', ttl=ttl).status_code, 400)
+        response = self.client.post('/api/batch', json={'operations': [
+            {'op': 'update', 'category': 'Cat1', 'item': 'Item1', 'upsert': True, 'ttl': -5}]})
+        self.assertEqual(response.status_code, 400)
+
+    def test_deleted_item_does_not_expire(self):
+        self._put('Item1', status='up', ttl=10)
+        self.client.delete('/api/categories/Cat1/items/Item1')
+        self.now += 20
+        self.assertEqual(main_app.staleness.expire(), 0)
+
+    def test_stale_query(self):
+        main_app.store.replace({'Cat1': {
+            'Old': {'status': 'up', 'last_updated': main_app._format_timestamp(self.now - 3600)},
+            'Older': {'status': 'down', 'last_updated': main_app._format_timestamp(self.now - 7200)},
+            'Fresh': {'status': 'up', 'last_updated': main_app._format_timestamp(self.now - 10)},
+        }})
+        response = self.client.get('/api/stale?older_than=600')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([entry['item'] for entry in response.json['items']], ['Older', 'Old'])
+        self.assertEqual(response.json['items'][0]['status'], 'down')
+        self.assertEqual(len(self.client.get('/api/stale?older_than=0').json['items']), 3)
+
+    def test_restored_board_is_indexed_in_one_sort(self):
+        board = {'Cat1': {f'Item{i}': {'status': 'up', 'ttl': 60,
+                                       'last_updated': main_app._format_timestamp(self.now - 30 - i)}
+                          for i in range(50)}}
+        with patch('bisect.insort', side_effect=AssertionError("insort on reset")):
+            main_app.store.replace(board)
+        stale = main_app.staleness.stale(0)
+        self.assertEqual(stale[0], ('Cat1', 'Item49'))
+        self.assertEqual(len(stale), 50)
+        self.now += 15
+        self.assertEqual(main_app.staleness.expire(), 35)  # Items 15 to 49 passed their TTL
+
+    def test_stale_query_requires_older_than(self):
+        self.assertEqual(self.client.get('/api/stale').status_code, 400)
+        self.assertEqual(self.client.get('/api/stale?older_than=-1').status_code, 400)
+
+
+class TestExpiryThread(unittest.TestCase):
+
+    def test_background_expiry(self):
+        main_app.app.testing = True
+        main_app.store.reset()
+        client = main_app.app.test_client()
+        client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up', 'ttl': 0.05})
+        deadline = time.monotonic() + 5
+        while main_app.store.snapshot()['Cat1']['Item1']['status'] != 'unknown' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1']['status'], 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+def parse_event(chunk):
+    """Parses one server-sent event chunk into (event, id, data)."""
+    fields = {}
+    for line in chunk.decode('utf-8').splitlines():
+        if line and not line.startswith(':'):
+            key, _, value = line.partition(': ')
+            fields[key] = value
+    return fields.get('event'), fields.get('id'), json.loads(fields['data']) if 'data' in fields else None
+
+
+class TestEventHub(unittest.TestCase):
+
+    def test_publish_shares_payload_with_all_subscribers(self):
+        hub = main_app.EventHub(queue_size=10)
+        first, second = hub.subscribe(), hub.subscribe()
+        payload = b'data: {}\n\n'
+        hub.publish(1, payload)
+        self.assertIs(first.queue.get_nowait()[1], payload)
+        self.assertIs(second.queue.get_nowait()[1], payload)
+
+    def test_slow_subscriber_is_dropped_and_flagged(self):
+        hub = main_app.EventHub(queue_size=2)
+        slow = hub.subscribe()
+        for version in range(1, 4):
+            hub.publish(version, b'x')
+        self.assertTrue(slow.lagged)
+        self.assertFalse(hub.has_subscribers())
+
+
+class TestStreamAPI(unittest.TestCase):
+
+    def setUp(self):
+        """Set up for each test."""
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.reset()
+        self.responses = []
+
+    def tearDown(self):
+        for response in self.responses:
+            response.close()
+        self.assertFalse(main_app.event_hub.has_subscribers())
+
+    def _open_stream(self, **kwargs):
+        response = self.client.get('/api/stream', buffered=False, **kwargs)
+        self.responses.append(response)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        return iter(response.response)
+
+    def test_stream_starts_with_snapshot_then_pushes_changes(self):
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+        events = self._open_stream()
+
+        event, event_id, data = parse_event(next(events))
+        self.assertEqual(event, 'delta')
+        self.assertTrue(data['full'])
+        self.assertEqual(data['data']['Cat1']['Item1']['status'], 'up')
+        self.assertEqual(event_id, data['version'])
+
+        self.client.put('/api/categories/Cat1/items/Item1', json={'status': 'down'})
+        event, event_id, data = parse_event(next(events))
+        self.assertEqual(event, 'item')
+        self.assertEqual(data['data'], {'Cat1': {'Item1': main_app.store.snapshot()['Cat1']['Item1']}})
+        self.assertEqual(event_id, self.client.get('/api/health').headers['ETag'].strip('"'))
+
+        self.client.delete('/api/categories/Cat1/items/Item1')
+        self.client.delete('/api/categories/Cat1')
+        self.assertEqual(parse_event(next(events))[0], 'item-deleted')
+        event, _, data = parse_event(next(events))
+        self.assertEqual(event, 'category-deleted')
+        self.assertEqual(data['deleted_categories'], ['Cat1'])
+
+    def test_stream_resumes_from_last_event_id(self):
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        last_id = self.client.get('/api/health').headers['ETag'].strip('"')
+        self.client.put('/api/categories/Cat2/items/Item1?upsert=1', json={'status': 'up'})
+
+        events = self._open_stream(headers={'Last-Event-ID': last_id})
+        _, _, data = parse_event(next(events))
+        self.assertFalse(data['full'])
+        self.assertEqual(list(data['data']), ['Cat2'])
+
+    def test_events_are_serialized_once_for_all_subscribers(self):
+        first = self._open_stream()
+        second = self._open_stream()
+        next(first)
+        next(second)
+
+        with patch('app.app._format_event', wraps=main_app._format_event) as format_event:
+            self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        self.assertEqual(format_event.call_count, 1)
+        self.assertEqual(next(first), next(second))
+
+    def test_lagged_subscriber_gets_catch_up_delta(self):
+        with patch.object(main_app.event_hub, 'queue_size', 1):
+            events = self._open_stream()
+        next(events)
+        for name in ('Cat1', 'Cat2', 'Cat3'):
+            self.client.post('/api/categories', json={'category_name': name})
+
+        # The queue overflowed, so the client is caught up with a single delta.
+        event, _, data = parse_event(next(events))
+        self.assertEqual(event, 'delta')
+        self.assertFalse(data['full'])
+        self.assertEqual(set(data['data']), {'Cat1', 'Cat2', 'Cat3'})
+
+        self.client.post('/api/categories', json={'category_name': 'Cat4'})
+        self.assertEqual(parse_event(next(events))[2]['data'], {'Cat4': {}})
+
+    def test_keepalive_when_idle(self):
+        with patch.object(main_app, 'STREAM_KEEPALIVE_SECONDS', 0.01):
+            events = self._open_stream()
+            next(events)
+            self.assertEqual(next(events), b': keepalive\n\n')
+
+    def test_changes_from_other_workers_are_streamed(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, 'board.db')
+        worker, other = main_app.SQLiteHealthStore(path, 100), main_app.SQLiteHealthStore(path, 100)
+        self.addCleanup(other.close)
+        self.addCleanup(worker.close)
+        worker.add_listener(main_app._on_board_change)
+
+        with patch.object(main_app, 'store', worker), patch.object(main_app, 'STREAM_POLL_SECONDS', 0.01):
+            events = self._open_stream()
+            self.assertEqual(parse_event(next(events))[2]['data'], {})
+            # Written by another process: nothing tells this worker.
+            with other.transaction() as txn:
+                txn.create_category('Cat1')
+            event, event_id, data = parse_event(next(events))
+            self.assertEqual(event, 'category')
+            self.assertEqual(data['data'], {'Cat1': {}})
+            self.assertEqual(event_id, main_app._board_etag(other.version))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import os
+import sys
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+class TestSummaryAPI(unittest.TestCase):
+
+    def setUp(self):
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        main_app.store.reset()
+
+    def _summary(self):
+        response = self.client.get('/api/summary')
+        self.assertEqual(response.status_code, 200)
+        return response.json
+
+    def test_empty_board(self):
+        self.assertEqual(self._summary(), {"counts": {}, "items": 0, "worst_color": None, "categories": {}})
+
+    def test_counts_and_worst_color(self):
+        self.client.put('/api/categories/Builds/items/Main?upsert=1', json={'status': 'passing'})
+        self.client.put('/api/categories/Builds/items/Nightly?upsert=1', json={'status': 'failing'})
+        self.client.put('/api/categories/Hosts/items/mars?upsert=1', json={'status': 'up'})
+        self.client.post('/api/categories/Hosts/items', json={'item_name': 'venus'})
+        self.client.post('/api/categories', json={'category_name': 'Empty'})
+
+        summary = self._summary()
+        self.assertEqual(summary['counts'], {'passing': 1, 'failing': 1, 'up': 1, 'unknown': 1})
+        self.assertEqual(summary['items'], 4)
+        self.assertEqual(summary['worst_color'], 'red')
+        self.assertEqual(summary['categories']['Builds'], {'counts': {'passing': 1, 'failing': 1}, 'items': 2, 'worst_color': 'red'})
+        self.assertEqual(summary['categories']['Hosts']['worst_color'], 'orange')
+        self.assertEqual(summary['categories']['Empty'], {'counts': {}, 'items': 0, 'worst_color': None})
+
+    def test_counters_follow_updates_and_deletes(self):
+        self.client.put('/api/categories/Builds/items/Main?upsert=1', json={'status': 'failing'})
+        self.client.put('/api/categories/Builds/items/Nightly?upsert=1', json={'status': 'failing'})
+        self.client.put('/api/categories/Builds/items/Main', json={'status': 'passing'})
+        self.client.delete('/api/categories/Builds/items/Nightly')
+        summary = self._summary()
+        self.assertEqual(summary['counts'], {'passing': 1})
+        self.assertEqual(summary['categories']['Builds']['worst_color'], 'green')
+
+        self.client.delete('/api/categories/Builds')
+        self.assertEqual(self._summary()['counts'], {})
+
+    def test_counters_match_board_after_restore_and_batch(self):
+        main_app.store.replace({'Cat1': {'A': {'status': 'down'}, 'B': {'status': 'up'}}})
+        self.client.post('/api/batch', json={'operations': [
+            {'op': 'update', 'category': 'Cat1', 'item': 'A', 'status': 'up'},
+            {'op': 'create', 'category': 'Cat2', 'item': 'C'},
+            {'op': 'create', 'category': 'Cat2'},
+            {'op': 'create', 'category': 'Cat2', 'item': 'C'},
+        ]})
+        summary = self._summary()
+        self.assertEqual(summary['categories']['Cat1']['counts'], {'up': 2})
+        self.assertEqual(summary['categories']['Cat2']['counts'], {'unknown': 1})
+        self.assertEqual(summary['counts'], {'up': 2, 'unknown': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,12 @@
 import unittest
 import json
-from app.app import app, health_data
+from app.app import app, store
 
 class TestURLValidation(unittest.TestCase):
     def setUp(self):
         self.app = app.test_client()
         self.app.testing = True
-        health_data.clear()
+        store.reset()
         # Setup initial state
         self.app.post('/api/categories', json={'category_name': 'TestCat'})
         self.app.post('/api/categories/TestCat/items', json={'item_name': 'TestItem'})
@@ -20,7 +20,7 @@ class TestURLValidation(unittest.TestCase):
             response = self.app.put('/api/categories/TestCat/items/TestItem',
                                     json={'url': url})
             self.assertEqual(response.status_code, 200)
-            item = health_data['TestCat']['TestItem']
+            item = store.snapshot()['TestCat']['TestItem']
             self.assertEqual(item['url'], url)
 
     def test_invalid_schemes(self):
@@ -39,7 +39,7 @@ class TestURLValidation(unittest.TestCase):
             response = self.app.put('/api/categories/TestCat/items/TestItem',
                                     json={'url': url})
             self.assertEqual(response.status_code, 200)
-            item = health_data['TestCat']['TestItem']
+            item = store.snapshot()['TestCat']['TestItem']
             # Should match original URL (update ignored)
             self.assertEqual(item['url'], "http://original.com", f"URL '{url}' should be rejected")
 
@@ -52,7 +52,7 @@ class TestURLValidation(unittest.TestCase):
         response = self.app.put('/api/categories/TestCat/items/TestItem',
                                 json={'url': ""})
         self.assertEqual(response.status_code, 200)
-        item = health_data['TestCat']['TestItem']
+        item = store.snapshot()['TestCat']['TestItem']
         self.assertEqual(item['url'], "")
 
     def test_partial_update_with_invalid_url(self):
@@ -77,7 +77,7 @@ class TestURLValidation(unittest.TestCase):
                                 })
 
         self.assertEqual(response.status_code, 200)
-        item = health_data['TestCat']['TestItem']
+        item = store.snapshot()['TestCat']['TestItem']
         self.assertEqual(item['message'], "Updated Message")
         self.assertEqual(item['url'], "") # Default was "", and update was ignored.
 
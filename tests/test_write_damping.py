@@ -0,0 +1,174 @@
+import unittest
+import os
+import sys
+import time
+from unittest.mock import patch
+
+# Adjust path to import app from the parent directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app as main_app
+
+
+class DampingTestCase(unittest.TestCase):
+
+    damper_options = {}
+
+    def setUp(self):
+        main_app.app.testing = True
+        self.client = main_app.app.test_client()
+        self.now = 1000.0
+        self.damper = main_app.WriteDamper(clock=lambda: self.now, **self.damper_options)
+        patcher = patch.object(main_app, 'write_damper', self.damper)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        main_app.store.reset()
+
+    def _put(self, item='Item1', **payload):
+        return self.client.put(f'/api/categories/Cat1/items/{item}?upsert=1', json=payload)
+
+    def _item(self, item='Item1'):
+        return main_app.store.snapshot()['Cat1'][item]
+
+
+class TestCoalescing(DampingTestCase):
+
+    damper_options = {'window': 1.0}
+
+    def test_updates_within_the_window_are_merged(self):
+        self.assertEqual(self._put(status='up', message='0%').status_code, 201)
+        version = main_app.store.version
+        for percent in (10, 20, 30):
+            self.assertEqual(self._put(message=f'{percent}%').status_code, 202)
+        self._put(url='http://ci.example.com/job/1')
+        self.assertEqual(main_app.store.version, version)
+        self.assertEqual(self._item()['message'], '0%')
+
+        self.now += 1.0
+        self.assertEqual(self.damper.flush(), 1)
+        self.assertEqual(main_app.store.version, version + 1)
+        self.assertEqual(self._item()['message'], '30%')
+        self.assertEqual(self._item()['url'], 'http://ci.example.com/job/1')
+        self.assertEqual(self.damper.stats()['coalesced'], 4)
+        self.assertEqual(self.damper.stats()['written'], 1)
+
+    def test_window_reopens_after_a_coalesced_write(self):
+        self._put(status='up')
+        self._put(message='a')
+        self.now += 1.0
+        self.damper.flush()
+        self.assertEqual(self._put(message='b').status_code, 202)
+        self.now += 1.0
+        self.damper.flush()
+        self.assertEqual(self._item()['message'], 'b')
+        # A window with nothing pending closes without a write.
+        self.now += 1.0
+        self.assertEqual(self.damper.flush(), 0)
+        self.assertEqual(self._put(message='c').status_code, 200)
+        self.assertEqual(self._item()['message'], 'c')
+
+    def test_update_between_window_end_and_flush(self):
+        self._put(status='up')
+        self.now += 1.0
+        # The window has ended but not been flushed: written directly, opening a new one.
+        self.assertEqual(self._put(message='a').status_code, 200)
+        self.assertEqual(self.damper.flush(), 0)
+        self.assertEqual(self._put(message='b').status_code, 202)
+        self.now += 1.0
+        self.assertEqual(self.damper.flush(), 1)
+        self.assertEqual(self._item()['message'], 'b')
+        self.now += 1.0
+        self.assertEqual(self.damper.flush(), 0)
+        self.assertEqual(self.damper.stats()['pending'], 0)
+
+    def test_items_are_independent(self):
+        self._put('Item1', status='up')
+        self.assertEqual(self._put('Item2', status='up').status_code, 201)
+
+    def test_invalid_update_is_rejected_not_coalesced(self):
+        self._put(status='up')
+        self.assertEqual(self._put(status='sideways').status_code, 400)
+        self.assertEqual(self.damper.stats()['coalesced'], 0)
+
+    def test_pending_update_of_a_deleted_item_is_dropped(self):
+        self.client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+        self.client.put('/api/categories/Cat1/items/Item1', json={'message': 'late'})
+        self.client.delete('/api/categories/Cat1/items/Item1')
+        self.now += 1.0
+        self.assertEqual(self.damper.flush(), 0)
+        self.assertEqual(self.damper.stats()['dropped'], 1)
+
+    def test_close_writes_pending_updates(self):
+        self._put(status='up')
+        self._put(status='down')
+        self.damper.close()
+        self.assertEqual(self._item()['status'], 'down')
+
+    def test_stats_endpoint(self):
+        self._put(status='up')
+        self._put(status='down')
+        stats = self.client.get('/api/damping').json
+        self.assertEqual(stats['window'], 1.0)
+        self.assertEqual(stats['coalesced'], 1)
+        self.assertEqual(stats['pending'], 1)
+
+
+class TestHysteresis(DampingTestCase):
+
+    damper_options = {'hold_updates': 3, 'hold_seconds': 60}
+
+    def test_new_status_needs_consecutive_reports(self):
+        self._put(status='up')
+        self._put(status='down', message='first')
+        self.assertEqual(self._item()['status'], 'up')
+        self.assertEqual(self._item()['message'], 'first')
+        self._put(status='down')
+        self.assertEqual(self._item()['status'], 'up')
+        self._put(status='down')
+        self.assertEqual(self._item()['status'], 'down')
+        self.assertEqual(self.damper.stats()['damped'], 2)
+
+    def test_new_status_needs_time(self):
+        self._put(status='up')
+        self._put(status='down')
+        self.now += 60
+        self._put(status='down')
+        self.assertEqual(self._item()['status'], 'down')
+
+    def test_flap_is_suppressed(self):
+        self._put(status='up')
+        for status in ('down', 'up', 'down', 'up'):
+            self._put(status=status)
+        self.assertEqual(self._item()['status'], 'up')
+        self.assertEqual(main_app.item_history.get('Cat1', 'Item1')[-1]['status'], 'up')
+        self.assertEqual(len(main_app.item_history.get('Cat1', 'Item1')), 1)
+        self.assertEqual(self.damper.stats()['flaps'], 2)
+
+    def test_unknown_items_take_a_status_at_once(self):
+        self.client.post('/api/categories', json={'category_name': 'Cat1'})
+        self.client.post('/api/categories/Cat1/items', json={'item_name': 'Item1'})
+        self._put(status='up')
+        self.assertEqual(self._item()['status'], 'up')
+
+
+class TestFlushThread(unittest.TestCase):
+
+    def test_background_flush(self):
+        main_app.app.testing = True
+        damper = main_app.WriteDamper(window=0.05)
+        with patch.object(main_app, 'write_damper', damper):
+            main_app.store.reset()
+            client = main_app.app.test_client()
+            damper.start()
+            try:
+                client.put('/api/categories/Cat1/items/Item1?upsert=1', json={'status': 'up'})
+                client.put('/api/categories/Cat1/items/Item1', json={'message': 'done'})
+                deadline = time.monotonic() + 5
+                while main_app.store.snapshot()['Cat1']['Item1']['message'] != 'done' and time.monotonic() < deadline:
+                    time.sleep(0.01)
+            finally:
+                damper.close()
+        self.assertEqual(main_app.store.snapshot()['Cat1']['Item1']['message'], 'done')
+
+
+if __name__ == '__main__':
+    unittest.main()